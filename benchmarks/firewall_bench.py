@@ -0,0 +1,105 @@
+"""Benchmark AgenticFirewall content scanning on large generated bundles.
+
+Compares the compiled single-pass engine against the previous
+one-re.search-per-rule loop, for the default policy and for policies with
+extra blocked_patterns added.
+
+    python benchmarks/firewall_bench.py [--sizes 1,4,16] [--extra 0,50,200]
+"""
+
+import argparse
+import json
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.security.audit import close_all  # noqa: E402
+from src.security.firewall import AgenticFirewall, DEFAULT_POLICY  # noqa: E402
+
+SAMPLE = '''import React, { useState } from "react";
+import { api } from "../lib/api";
+
+export function TodoList({ items }) {
+  const [filter, setFilter] = useState("all");
+  const visible = items.filter((t) => filter === "all" || t.status === filter);
+  return visible.map((t) => <TodoItem key={t.id} todo={t} />);
+}
+
+def list_todos(db, user_id: int, limit: int = 50):
+    rows = db.query(Todo).filter(Todo.owner_id == user_id).limit(limit).all()
+    return [TodoOut.model_validate(r) for r in rows]
+'''
+
+
+def make_bundle(megabytes: int) -> str:
+    repeat = megabytes * 1024 * 1024 // len(SAMPLE) + 1
+    return (SAMPLE * repeat)[: megabytes * 1024 * 1024]
+
+
+def legacy_validate(policy: dict, filepath: str, content: str) -> bool:
+    """The pre-compilation algorithm: one re.search per rule."""
+    for pattern in policy.get("blocked_paths", []):
+        if re.search(pattern, filepath):
+            return False
+    if not any(re.search(p, filepath) for p in policy.get("allowed_paths", [])):
+        return False
+    for pattern in policy.get("blocked_patterns", []):
+        if re.search(pattern, content):
+            return False
+    return True
+
+
+def policy_with_extra(extra: int) -> dict:
+    policy = json.loads(json.dumps(DEFAULT_POLICY))
+    policy["blocked_patterns"] += [rf"forbidden_call_{i}\(" for i in range(extra)]
+    return policy
+
+
+def timed(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1,4,16", help="Bundle sizes in MB")
+    parser.add_argument("--extra", default="0,50,200", help="Extra blocked_patterns")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",")]
+    extras = [int(e) for e in args.extra.split(",")]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'size':>6} {'rules':>6} {'legacy MB/s':>12} {'compiled MB/s':>14} {'speedup':>8}")
+        for extra in extras:
+            policy = policy_with_extra(extra)
+            policy_path = Path(tmp) / f"policy_{extra}.json"
+            policy_path.write_text(json.dumps(policy))
+            firewall = AgenticFirewall(policy_path, Path(tmp) / "audit.log")
+            rules = len(policy["blocked_patterns"])
+
+            for mb in sizes:
+                bundle = make_bundle(mb)
+                ok_legacy = legacy_validate(policy, "src/bundle.js", bundle)
+                ok_compiled = firewall.validate_file_write("src/bundle.js", bundle)[0]
+                assert ok_legacy == ok_compiled, "engines disagree"
+
+                t_legacy = timed(lambda: legacy_validate(policy, "src/bundle.js", bundle))
+                t_compiled = timed(lambda: firewall.validate_file_write("src/bundle.js", bundle))
+                print(f"{mb:>4}MB {rules:>6} {mb / t_legacy:>12.1f} {mb / t_compiled:>14.1f} "
+                      f"{t_legacy / t_compiled:>7.1f}x")
+
+        # Flush the audit log while its directory still exists
+        close_all()
+
+
+if __name__ == "__main__":
+    main()
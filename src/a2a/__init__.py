@@ -10,6 +10,8 @@ from .types import (
     FilePart,
     TaskResult,
     Artifact,
+    TaskEvent,
+    TaskIdParams,
 )
 from .client import A2AClient
 
@@ -23,5 +25,7 @@ __all__ = [
     "FilePart",
     "TaskResult",
     "Artifact",
+    "TaskEvent",
+    "TaskIdParams",
     "A2AClient",
 ]
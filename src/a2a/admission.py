@@ -0,0 +1,155 @@
+"""Admission control for A2A servers -- bounded concurrency with priority lanes.
+
+An agent server runs at most `max_in_flight` tasks at once. Further
+requests wait in a bounded queue ordered by lane (interactive before
+batch, FIFO within a lane) instead of piling onto the executor. When the
+queue is full the request is rejected with 429, and a request that waits
+longer than `queue_timeout` gets 503; both carry a Retry-After estimated
+from recent task durations. Batch work may only fill part of the queue,
+so an interactive build always finds room behind it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import math
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+LANES = {"interactive": 0, "batch": 1}
+DEFAULT_LANE = "interactive"
+
+
+class Rejected(Exception):
+    """The server is saturated; carries the HTTP status and Retry-After seconds."""
+
+    def __init__(self, status_code: int, retry_after: int, reason: str):
+        super().__init__(reason)
+        self.status_code = status_code
+        self.retry_after = retry_after
+        self.reason = reason
+
+
+class AdmissionController:
+    """Gate in front of task execution. Must be used from one event loop."""
+
+    def __init__(
+        self,
+        max_in_flight: int = 4,
+        max_queue: int = 32,
+        queue_timeout: Optional[float] = 300.0,
+        batch_queue_share: float = 0.5,
+    ):
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.batch_queue_limit = max(1, int(max_queue * batch_queue_share)) if max_queue else 0
+        self.in_flight = 0
+        self._waiters: list = []  # heap of (lane, seq, future)
+        self._seq = itertools.count()
+        self._avg_duration = 10.0  # seconds; EWMA of completed tasks
+        self.rejected = 0
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for *_, fut in self._waiters if not fut.done())
+
+    def lane_of(self, value: Optional[str]) -> str:
+        return value if value in LANES else DEFAULT_LANE
+
+    def retry_after(self) -> int:
+        """Seconds until a slot is likely free, from the queue length and task durations."""
+        backlog = self.queued + max(0, self.in_flight - self.max_in_flight + 1)
+        rounds = backlog / max(self.max_in_flight, 1)
+        return max(1, math.ceil(self._avg_duration * max(rounds, 0.5)))
+
+    def check(self, lane: str = DEFAULT_LANE):
+        """Raise Rejected(429) if a request in `lane` could not even be queued."""
+        if self.in_flight < self.max_in_flight and not self.queued:
+            return
+        limit = self.batch_queue_limit if lane == "batch" else self.max_queue
+        if self.queued >= limit:
+            self.rejected += 1
+            raise Rejected(429, self.retry_after(), f"{lane} queue is full")
+
+    def reserve(self, lane: str = DEFAULT_LANE) -> asyncio.Future:
+        """Take a slot, or a place in `lane`'s queue, without waiting.
+
+        The returned future is done once the slot is granted. Raises
+        Rejected(429) if the queue is full. Pass the reservation to slot()
+        to run under it, or to abandon() to give it up.
+        """
+        fut = asyncio.get_running_loop().create_future()
+        if self.in_flight < self.max_in_flight and not self.queued:
+            self.in_flight += 1
+            fut.set_result(None)
+            return fut
+        self.check(lane)
+        heapq.heappush(self._waiters, (LANES[lane], next(self._seq), fut))
+        return fut
+
+    def abandon(self, reservation: asyncio.Future):
+        """Give up a reservation: release a granted slot, or leave the queue."""
+        if reservation.done() and not reservation.cancelled():
+            self._release()
+        else:
+            reservation.cancel()
+
+    @asynccontextmanager
+    async def slot(self, lane: str = DEFAULT_LANE, timeout=...,
+                   reservation: Optional[asyncio.Future] = None) -> AsyncIterator[None]:
+        """Hold one execution slot for the body, waiting in `lane` if needed.
+
+        `timeout` overrides queue_timeout (None waits indefinitely).
+        `reservation` is a place already taken with reserve(); without one,
+        a place is reserved now.
+        """
+        if reservation is None:
+            reservation = self.reserve(lane)
+        await self._wait(reservation, self.queue_timeout if timeout is ... else timeout)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            yield
+        finally:
+            self._record(loop.time() - started)
+            self._release()
+
+    async def _wait(self, fut: asyncio.Future, timeout: Optional[float]):
+        if fut.done() and not fut.cancelled():
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(fut), timeout)
+        except asyncio.TimeoutError:
+            if fut.done() and not fut.cancelled():
+                return  # granted just as the timeout fired; keep the slot
+            fut.cancel()
+            self.rejected += 1
+            raise Rejected(503, self.retry_after(), "timed out waiting for a worker")
+        except asyncio.CancelledError:
+            # Client went away; hand a slot we were just given to the next waiter
+            self.abandon(fut)
+            raise
+
+    def _release(self):
+        # Hand the slot straight to the highest-priority live waiter
+        while self._waiters:
+            *_, fut = heapq.heappop(self._waiters)
+            if not fut.done():
+                fut.set_result(None)
+                return
+        self.in_flight -= 1
+
+    def _record(self, duration: float):
+        self._avg_duration = 0.8 * self._avg_duration + 0.2 * duration
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "max_in_flight": self.max_in_flight,
+            "max_queue": self.max_queue,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,123 @@
+"""Content-addressed blob store for file contents passed between agents.
+
+Instead of embedding every file in each Task, a caller puts contents in a
+BlobStore and sends `context["file_refs"] = {path: sha256}`. Before the
+agent runs, hydrate() swaps the refs for `context["files"]`, which is what
+agents already read. In-process, client and agent share one store, so a
+file is held once however many hops see it. Over HTTP the client first
+asks the server which digests it lacks (POST /blobs/have) and uploads only
+those (POST /blobs), so repeated hops send only changed files.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+from .types import Task
+
+# Least recently used blobs are dropped beyond this many bytes; a dropped
+# blob is simply re-uploaded when a later request references it
+MAX_BYTES = 256 * 1024 * 1024
+
+REFS_KEY = "file_refs"
+
+
+def digest(content: str) -> str:
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+class MissingBlobs(Exception):
+    """A task references blobs this store does not have."""
+
+    def __init__(self, digests: list[str]):
+        super().__init__(f"{len(digests)} blob(s) missing")
+        self.digests = digests
+
+
+class BlobStore:
+    """Thread-safe in-memory map of sha256 → content with an LRU byte cap."""
+
+    def __init__(self, max_bytes: int = MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._blobs: "OrderedDict[str, str]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def put(self, content: str, key: Optional[str] = None) -> str:
+        """Store content; returns its digest. `key`, if given, must match."""
+        d = digest(content)
+        if key is not None and key != d:
+            raise ValueError(f"Blob content does not match digest {key[:12]}")
+        with self._lock:
+            if d in self._blobs:
+                self._blobs.move_to_end(d)
+                return d
+            self._blobs[d] = content
+            self._bytes += len(content)
+            while self._bytes > self.max_bytes and len(self._blobs) > 1:
+                _, old = self._blobs.popitem(last=False)
+                self._bytes -= len(old)
+        return d
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            content = self._blobs.get(key)
+            if content is not None:
+                self._blobs.move_to_end(key)
+            return content
+
+    def missing(self, keys: Iterable[str]) -> list[str]:
+        """The subset of `keys` not in the store (the "want" list)."""
+        with self._lock:
+            return [k for k in dict.fromkeys(keys) if k not in self._blobs]
+
+    def refs(self, files: dict[str, str]) -> dict[str, str]:
+        """Store every file; returns {path: digest}."""
+        return {path: self.put(content) for path, content in files.items()}
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"blobs": len(self._blobs), "bytes": self._bytes}
+
+
+def task_refs(task: Task) -> dict[str, str]:
+    """{path: digest} referenced by a task's context."""
+    return dict((task.context or {}).get(REFS_KEY) or {})
+
+
+def hydrate(task: Task, store: BlobStore) -> Task:
+    """Return the task with context["file_refs"] resolved into context["files"].
+
+    Raises MissingBlobs listing every digest the store lacks.
+    """
+    refs = task_refs(task)
+    if not refs:
+        return task
+    files, missing = {}, []
+    for path, key in refs.items():
+        content = store.get(key)
+        if content is None:
+            missing.append(key)
+        else:
+            files[path] = content
+    if missing:
+        raise MissingBlobs(missing)
+    context = {k: v for k, v in task.context.items() if k != REFS_KEY}
+    context["files"] = {**context.get("files", {}), **files}
+    return task.model_copy(update={"context": context})
+
+
+_shared: Optional[BlobStore] = None
+_shared_lock = threading.Lock()
+
+
+def shared_blobs() -> BlobStore:
+    """The process-wide store used by A2A clients and servers by default."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = BlobStore()
+        return _shared
@@ -2,12 +2,29 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+import asyncio
+import atexit
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterator, Optional
+from urllib.parse import urlsplit
 
-from .types import Task, TaskResult, TaskStatus, Message, TextPart, Artifact
+from .blobs import BlobStore, MissingBlobs, hydrate, shared_blobs, task_refs
+from .streaming import decode_sse, iter_task_events
+from .types import Task, TaskEvent, TaskResult, TaskStatus, Message, TextPart, Artifact
 
 if TYPE_CHECKING:
-    pass
+    import httpx
+
+
+@dataclass(frozen=True)
+class PoolLimits:
+    """Connection pool settings (mirrors httpx.Limits)."""
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
 
 
 class A2AClient:
@@ -15,6 +32,19 @@ class A2AClient:
 
     When base_url is None or the agent is provided directly, falls back
     to in-process calls (no HTTP overhead).
+
+    HTTP clients share one keep-alive connection pool per origin
+    (scheme://host:port, HTTP/2 setting and limits): every client created
+    for the same agent server reuses its connections. The pool is closed
+    when the last client using it is closed. send_task() uses a sync pool;
+    asend_task() an async pool bound to the running event loop.
+
+    Tasks may reference contents in `blobs` by digest (context["file_refs"],
+    see a2a/blobs.py). In-process they are resolved from the shared store;
+    over HTTP only the blobs the server reports missing are uploaded.
+
+        with A2AClient.for_url("http://localhost:8102") as client:
+            result = client.send_task(task)
     """
 
     def __init__(
@@ -22,50 +52,341 @@ class A2AClient:
         base_url: Optional[str] = None,
         agent=None,  # BaseAgent instance for in-process calls
         timeout: float = 120.0,
+        limits: Optional[PoolLimits] = None,
+        http2: bool = False,
+        priority: Optional[str] = None,
+        busy_retries: int = 3,
+        blobs: Optional[BlobStore] = None,
     ):
         if base_url is None and agent is None:
             raise ValueError("Either base_url or agent must be provided")
         self.base_url = base_url
         self.agent = agent
         self.timeout = timeout
+        self.limits = limits or PoolLimits()
+        self.http2 = http2
+        self.priority = priority          # admission lane: "interactive" or "batch"
+        self.busy_retries = busy_retries  # retries of 429/503, honoring Retry-After
+        self._headers = {"X-Forge-Priority": priority} if priority else {}
+        self._holds_sync = False
+        self._async_loops: "weakref.WeakSet" = weakref.WeakSet()
+        self._closed = False
+        self._tasks = None  # TaskManager for in-process submit_task()
+        self.blobs = blobs if blobs is not None else shared_blobs()
 
     def send_task(self, task: Task) -> TaskResult:
         """Send a task to the agent and return the result."""
         if self.agent is not None:
             # In-process call: no HTTP overhead
+            try:
+                task = hydrate(task, self.blobs)
+            except MissingBlobs as e:
+                return _missing_result(task.id, e)
             return self.agent.handle_a2a_task(task)
         return self._send_http(task)
 
+    async def asend_task(self, task: Task) -> TaskResult:
+        """Async send_task: native async HTTP, or the agent's async handler in-process."""
+        if self.agent is not None:
+            try:
+                task = hydrate(task, self.blobs)
+            except MissingBlobs as e:
+                return _missing_result(task.id, e)
+            handler = getattr(self.agent, "ahandle_a2a_task", None)
+            if handler is not None:
+                return await handler(task)
+            return await asyncio.to_thread(self.agent.handle_a2a_task, task)
+        return await self._asend_http(task)
+
+    def stream_task(self, task: Task) -> Iterator[TaskEvent]:
+        """Send a task and yield TaskEvents as the agent produces them.
+
+        Text chunks and completed file blocks arrive before the agent has
+        finished; the last event always has kind="result" and carries the
+        TaskResult send_task() would have returned.
+        """
+        if self.agent is not None:
+            try:
+                task = hydrate(task, self.blobs)
+            except MissingBlobs as e:
+                result = _missing_result(task.id, e)
+                yield TaskEvent(id=task.id, kind="result", status=result.status, result=result)
+                return
+            yield from iter_task_events(self.agent, task)
+            return
+        yield from self._stream_http(task)
+
+    def _stream_http(self, task: Task) -> Iterator[TaskEvent]:
+        httpx = _import_httpx()
+        url = f"{self.base_url.rstrip('/')}/tasks/sendSubscribe"
+        payload = task.model_dump()
+        refs = task_refs(task)
+
+        try:
+            client = self._sync_client()
+            if refs:
+                self._offer_blobs(refs)
+            for attempt in range(self.busy_retries + 1):
+                with client.stream("POST", url, json=payload, timeout=self.timeout,
+                                   headers=self._headers) as resp:
+                    if resp.is_error:
+                        resp.read()
+                    if resp.status_code == 409 and refs and attempt < self.busy_retries:
+                        self._upload_blobs(resp.json().get("missing", []))
+                        continue
+                    if _busy(resp) and attempt < self.busy_retries:
+                        time.sleep(_retry_after(resp))
+                        continue
+                    resp.raise_for_status()
+                    for event in decode_sse(resp.iter_lines()):
+                        yield event
+                        if event.final:
+                            return
+                break
+            error = f"Stream from {self.base_url} ended without a result"
+            result = TaskResult(id=task.id, status=TaskStatus.failed, error=error)
+        except (httpx.HTTPStatusError, httpx.RequestError) as e:
+            result = self._error_result(task.id, e)
+        except MissingBlobs as e:
+            result = _missing_result(task.id, e)
+        yield TaskEvent(id=task.id, kind="result", status=result.status, result=result)
+
+    # --- Submit / poll / cancel ---
+
+    def submit_task(self, task: Task, push_url: Optional[str] = None) -> TaskResult:
+        """Queue a task and return at once (status "submitted").
+
+        Collect the result with get_task()/wait_task(), or pass push_url to
+        have the server POST the final TaskResult there (servers only post
+        to hosts they allow; see create_a2a_app's push_hosts).
+        """
+        if push_url:
+            task = task.model_copy(update={"metadata": {**(task.metadata or {}), "push_url": push_url}})
+        if self.agent is not None:
+            try:
+                task = hydrate(task, self.blobs)
+            except MissingBlobs as e:
+                return _missing_result(task.id, e)
+            return self._local_tasks().submit(task)
+        return self._post("/tasks/submit", task.model_dump(), task.id, task_refs(task))
+
+    def get_task(self, task_id: str) -> TaskResult:
+        """Current status of a submitted task, with artifacts once it is done."""
+        if self.agent is not None:
+            return self._local_tasks().get(task_id) or _unknown(task_id)
+        return self._post("/tasks/get", {"id": task_id}, task_id)
+
+    def cancel_task(self, task_id: str) -> TaskResult:
+        """Cancel a submitted task; a running agent stops at its next chunk."""
+        if self.agent is not None:
+            return self._local_tasks().cancel(task_id) or _unknown(task_id)
+        return self._post("/tasks/cancel", {"id": task_id}, task_id)
+
+    def wait_task(self, task_id: str, poll_interval: float = 2.0,
+                  timeout: Optional[float] = None) -> TaskResult:
+        """Poll get_task() until the task finishes (or `timeout` seconds pass)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            result = self.get_task(task_id)
+            if result.status not in (TaskStatus.submitted, TaskStatus.working):
+                return result
+            if deadline is not None and time.monotonic() >= deadline:
+                return result
+            time.sleep(poll_interval)
+
+    def _local_tasks(self):
+        if self._tasks is None:
+            from .tasks import TaskManager
+            self._tasks = TaskManager(self.agent)
+        return self._tasks
+
+    # --- HTTP ---
+
     def _send_http(self, task: Task) -> TaskResult:
         """Send task via HTTP to a remote A2A server."""
+        return self._post("/tasks/send", task.model_dump(), task.id, task_refs(task))
+
+    def _post(self, path: str, payload: dict, task_id: str,
+              refs: Optional[dict] = None) -> TaskResult:
+        httpx = _import_httpx()
+        url = f"{self.base_url.rstrip('/')}{path}"
+
         try:
-            import httpx
-        except ImportError:
-            raise ImportError(
-                "httpx is required for remote A2A calls. "
-                "Install with: pip install 'forge-ai[adk]'"
-            )
+            client = self._sync_client()
+            if refs:
+                self._offer_blobs(refs)
+            for attempt in range(self.busy_retries + 1):
+                resp = client.post(url, json=payload, timeout=self.timeout,
+                                   headers=self._headers)
+                if resp.status_code == 409 and refs and attempt < self.busy_retries:
+                    # Evicted since the offer (or the server restarted)
+                    self._upload_blobs(resp.json().get("missing", []))
+                    continue
+                if not (_busy(resp) and attempt < self.busy_retries):
+                    break
+                time.sleep(_retry_after(resp))
+            resp.raise_for_status()
+            return TaskResult.model_validate(resp.json())
+        except (httpx.HTTPStatusError, httpx.RequestError) as e:
+            return self._error_result(task_id, e)
+        except MissingBlobs as e:
+            return _missing_result(task_id, e)
 
+    def _offer_blobs(self, refs: dict):
+        """Ask the server which referenced blobs it lacks and upload those."""
+        resp = self._sync_client().post(
+            f"{self.base_url.rstrip('/')}/blobs/have",
+            json={"digests": sorted(set(refs.values()))},
+            timeout=self.timeout,
+        )
+        resp.raise_for_status()
+        self._upload_blobs(resp.json()["missing"])
+
+    def _upload_blobs(self, keys: list[str]):
+        if not keys:
+            return
+        resp = self._sync_client().post(
+            f"{self.base_url.rstrip('/')}/blobs",
+            json={"blobs": self._blob_contents(keys)},
+            timeout=self.timeout,
+        )
+        resp.raise_for_status()
+
+    def _blob_contents(self, keys: list[str]) -> dict[str, str]:
+        contents = {k: self.blobs.get(k) for k in keys}
+        lost = [k for k, v in contents.items() if v is None]
+        if lost:
+            raise MissingBlobs(lost)
+        return contents
+
+    async def _asend_http(self, task: Task) -> TaskResult:
+        httpx = _import_httpx()
         url = f"{self.base_url.rstrip('/')}/tasks/send"
         payload = task.model_dump()
+        refs = task_refs(task)
+        base = self.base_url.rstrip('/')
 
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                resp = client.post(url, json=payload)
-                resp.raise_for_status()
-                return TaskResult.model_validate(resp.json())
-        except httpx.HTTPStatusError as e:
-            return TaskResult(
-                id=task.id,
-                status=TaskStatus.failed,
-                error=f"HTTP {e.response.status_code}: {e.response.text[:200]}",
-            )
-        except httpx.RequestError as e:
-            return TaskResult(
-                id=task.id,
-                status=TaskStatus.failed,
-                error=f"Connection error to {self.base_url}: {e}",
-            )
+            client = self._async_client()
+            if refs:
+                have = await client.post(f"{base}/blobs/have", timeout=self.timeout,
+                                         json={"digests": sorted(set(refs.values()))})
+                have.raise_for_status()
+                missing = have.json()["missing"]
+                if missing:
+                    up = await client.post(f"{base}/blobs", timeout=self.timeout,
+                                           json={"blobs": self._blob_contents(missing)})
+                    up.raise_for_status()
+            for attempt in range(self.busy_retries + 1):
+                resp = await client.post(url, json=payload, timeout=self.timeout,
+                                         headers=self._headers)
+                if resp.status_code == 409 and refs and attempt < self.busy_retries:
+                    up = await client.post(f"{base}/blobs", timeout=self.timeout, json={
+                        "blobs": self._blob_contents(resp.json().get("missing", []))})
+                    up.raise_for_status()
+                    continue
+                if not (_busy(resp) and attempt < self.busy_retries):
+                    break
+                await asyncio.sleep(_retry_after(resp))
+            resp.raise_for_status()
+            return TaskResult.model_validate(resp.json())
+        except (httpx.HTTPStatusError, httpx.RequestError) as e:
+            return self._error_result(task.id, e)
+        except MissingBlobs as e:
+            return _missing_result(task.id, e)
+
+    def _error_result(self, task_id: str, e: Exception) -> TaskResult:
+        import httpx
+        if isinstance(e, httpx.HTTPStatusError):
+            error = f"HTTP {e.response.status_code}: {e.response.text[:200]}"
+        else:
+            error = f"Connection error to {self.base_url}: {e}"
+        return TaskResult(id=task_id, status=TaskStatus.failed, error=error)
+
+    # --- Pooled connections ---
+
+    def _pool_key(self) -> tuple:
+        origin = urlsplit(self.base_url)
+        return (origin.scheme, origin.netloc, self.http2, self.limits)
+
+    def _sync_client(self) -> "httpx.Client":
+        if self._closed:
+            raise RuntimeError("A2AClient is closed")
+        if not self._holds_sync:
+            client = _sync_pools.acquire(self._pool_key(), self._make_sync)
+            self._holds_sync = True
+            return client
+        return _sync_pools.get(self._pool_key())
+
+    def _async_client(self) -> "httpx.AsyncClient":
+        if self._closed:
+            raise RuntimeError("A2AClient is closed")
+        loop = asyncio.get_running_loop()
+        pools = _async_pools_for(loop)
+        if loop not in self._async_loops:
+            client = pools.acquire(self._pool_key(), self._make_async)
+            self._async_loops.add(loop)
+            return client
+        return pools.get(self._pool_key())
+
+    def _client_kwargs(self) -> dict:
+        httpx = _import_httpx()
+        if self.http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError:
+                raise ImportError(
+                    "HTTP/2 for A2A calls needs the h2 package. "
+                    "Install with: pip install 'httpx[http2]'"
+                )
+        return {
+            "timeout": self.timeout,
+            "http2": self.http2,
+            "limits": httpx.Limits(
+                max_connections=self.limits.max_connections,
+                max_keepalive_connections=self.limits.max_keepalive_connections,
+                keepalive_expiry=self.limits.keepalive_expiry,
+            ),
+        }
+
+    def _make_sync(self) -> "httpx.Client":
+        return _import_httpx().Client(**self._client_kwargs())
+
+    def _make_async(self) -> "httpx.AsyncClient":
+        return _import_httpx().AsyncClient(**self._client_kwargs())
+
+    # --- Lifecycle ---
+
+    def close(self):
+        """Release this client's pooled connections (closed with the last user)."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._holds_sync:
+            _sync_pools.release(self._pool_key())
+            self._holds_sync = False
+
+    async def aclose(self):
+        """Release the sync pool and the pool bound to the running loop."""
+        loop = asyncio.get_running_loop()
+        if loop in self._async_loops:
+            self._async_loops.discard(loop)
+            client = _async_pools_for(loop).release(self._pool_key())
+            if client is not None:
+                await client.aclose()
+        self.close()
+
+    def __enter__(self) -> "A2AClient":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    async def __aenter__(self) -> "A2AClient":
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
 
     @classmethod
     def for_agent(cls, agent) -> "A2AClient":
@@ -73,6 +394,105 @@ class A2AClient:
         return cls(agent=agent)
 
     @classmethod
-    def for_url(cls, base_url: str, timeout: float = 120.0) -> "A2AClient":
-        """Create an HTTP client for a remote agent server."""
-        return cls(base_url=base_url, timeout=timeout)
+    def for_url(cls, base_url: str, timeout: float = 120.0,
+                limits: Optional[PoolLimits] = None,
+                http2: bool = False,
+                priority: Optional[str] = None) -> "A2AClient":
+        """Create an HTTP client for a remote agent server (shares its host's pool)."""
+        return cls(base_url=base_url, timeout=timeout, limits=limits, http2=http2,
+                   priority=priority)
+
+
+# Longest Retry-After the client will sleep for before giving up on a busy server
+MAX_BUSY_WAIT = 60.0
+
+
+def _busy(resp) -> bool:
+    return resp.status_code in (429, 503)
+
+
+def _retry_after(resp) -> float:
+    try:
+        return min(float(resp.headers.get("Retry-After", 1)), MAX_BUSY_WAIT)
+    except ValueError:  # HTTP-date form
+        return 1.0
+
+
+def _missing_result(task_id: str, e: MissingBlobs) -> TaskResult:
+    return TaskResult(id=task_id, status=TaskStatus.failed,
+                      error=f"Referenced file contents are not available: {e}")
+
+
+def _unknown(task_id: str) -> TaskResult:
+    return TaskResult(id=task_id, status=TaskStatus.failed, error=f"Unknown task {task_id}")
+
+
+def _import_httpx():
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError(
+            "httpx is required for remote A2A calls. "
+            "Install with: pip install 'forge-ai[adk]'"
+        )
+    return httpx
+
+
+class _PoolRegistry:
+    """Reference-counted clients keyed by origin + settings."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[tuple, list] = {}  # key → [client, refs]
+
+    def acquire(self, key: tuple, factory):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = [factory(), 0]
+            entry[1] += 1
+            return entry[0]
+
+    def get(self, key: tuple):
+        with self._lock:
+            return self._entries[key][0]
+
+    def release(self, key: tuple):
+        """Drop one reference; close (sync) or return (async) the client at zero."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry[1] -= 1
+            if entry[1] > 0:
+                return None
+            del self._entries[key]
+        client = entry[0]
+        if hasattr(client, "aclose"):
+            return client  # caller awaits aclose() on its loop
+        client.close()
+        return None
+
+    def close_all(self):
+        with self._lock:
+            entries, self._entries = list(self._entries.values()), {}
+        for client, _ in entries:
+            if hasattr(client, "close"):
+                client.close()
+
+
+_sync_pools = _PoolRegistry()
+# Async clients are bound to the loop that created them
+_async_pools: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_async_pools_lock = threading.Lock()
+
+
+def _async_pools_for(loop) -> _PoolRegistry:
+    with _async_pools_lock:
+        registry = _async_pools.get(loop)
+        if registry is None:
+            registry = _async_pools[loop] = _PoolRegistry()
+        return registry
+
+
+atexit.register(_sync_pools.close_all)
@@ -1,52 +1,142 @@
 """A2A Server -- wraps a Forge agent as an A2A-compatible HTTP server."""
 
-from __future__ import annotations
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Optional, Union
 
-from typing import TYPE_CHECKING
-
-from .types import AgentCard, Task, TaskResult, TaskStatus
+from .admission import AdmissionController, Rejected
+from .blobs import BlobStore, MissingBlobs, hydrate, shared_blobs
+from .streaming import encode_sse, iter_task_events
+from .tasks import TASKS_DIR, DuplicateTask, TaskManager, TaskStore
+from .types import AgentCard, BlobQuery, BlobUpload, Task, TaskIdParams, TaskResult, TaskStatus
 
 if TYPE_CHECKING:
     pass
 
+# Request header (or Task.metadata key) naming the admission lane
+PRIORITY_HEADER = "X-Forge-Priority"
+
 
-def create_a2a_app(agent, host: str = "0.0.0.0", port: int = 8100):
+def create_a2a_app(
+    agent,
+    host: str = "0.0.0.0",
+    port: int = 8100,
+    max_in_flight: int = 4,
+    max_queue: int = 32,
+    queue_timeout: Optional[float] = 300.0,
+    task_db: Optional[Union[Path, str]] = None,
+    blobs: Optional[BlobStore] = None,
+    push_hosts: Iterable[str] = (),
+):
     """Create a FastAPI app that wraps a Forge agent as an A2A server.
 
     Exposes:
         GET  /.well-known/agent.json  -- AgentCard
         POST /tasks/send              -- process a Task, return TaskResult
+        POST /tasks/sendSubscribe     -- same, streamed as server-sent TaskEvents
+        POST /tasks/submit            -- queue a Task, return its id at once
+        POST /tasks/get               -- status / result of a submitted Task
+        POST /tasks/cancel            -- cancel a submitted Task
+        POST /blobs/have              -- which of these digests are missing?
+        POST /blobs                   -- upload {digest: content}
+        GET  /health                  -- status plus admission counters
+
+    Agents that define ahandle_a2a_task() run natively on the event loop;
+    sync handle_a2a_task() runs on a dedicated pool of max_in_flight
+    threads, so a slow LLM call never blocks /health or agent-card requests.
+
+    At most max_in_flight tasks run at once; up to max_queue more wait,
+    interactive ahead of batch (lane from the X-Forge-Priority header or
+    task.metadata["priority"]). Beyond that the server answers 429, and a
+    request queued longer than queue_timeout gets 503, both with
+    Retry-After.
+
+    Submitted tasks are persisted in a SQLite task store (task_db, default
+    ~/.forge/a2a/<agent>.db) and wait for a worker without a queue timeout.
+    Re-submitting a task id returns the stored task (409 if the request
+    differs). If task.metadata["push_url"] names a host in push_hosts, the
+    final TaskResult is POSTed there; other push URLs get 400.
+
+    Tasks may reference file contents by digest (context["file_refs"]);
+    they are resolved from the blob store before the agent runs, and a
+    task naming unknown digests gets 409 with the missing list.
 
     Args:
         agent: A BaseAgent subclass with handle_a2a_task() and agent_card()
         host: Host to bind to
         port: Port to listen on
+        max_in_flight: Tasks executed concurrently
+        max_queue: Tasks allowed to wait for a worker
+        queue_timeout: Seconds a task may wait before 503 (None = no limit)
+        task_db: SQLite file for submitted tasks (":memory:" to not persist)
+        blobs: Blob store for file refs (default: the process-wide store)
+        push_hosts: Hosts push notifications may go to (default: none)
     """
     try:
-        from fastapi import FastAPI, HTTPException
-        from fastapi.responses import JSONResponse
+        from fastapi import FastAPI, Request
+        from fastapi.concurrency import iterate_in_threadpool
+        from fastapi.responses import JSONResponse, StreamingResponse
     except ImportError:
         raise ImportError(
             "fastapi is required for A2A server support. "
             "Install with: pip install 'forge-ai[adk]'"
         )
 
+    admission = AdmissionController(max_in_flight, max_queue, queue_timeout)
+    executor = ThreadPoolExecutor(max_workers=max_in_flight,
+                                  thread_name_prefix=f"a2a-{agent.name}")
+
+    store = TaskStore(task_db if task_db is not None else TASKS_DIR / f"{agent.name}.db")
+    manager = TaskManager(agent, store, push_hosts=push_hosts)
+    blobs = blobs if blobs is not None else shared_blobs()
+    background: set = set()
+
+    @asynccontextmanager
+    async def lifespan(app):
+        store.fail_unfinished("server restarted before the task finished")
+        store.prune()
+        yield
+        for job in background:
+            job.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+        store.close()
+
     app = FastAPI(
         title=f"Forge Agent: {agent.name}",
         description=f"A2A-compatible server for {agent.name}",
         version="0.1.0",
+        lifespan=lifespan,
     )
+    app.state.admission = admission
 
-    @app.get("/.well-known/agent.json")
-    async def get_agent_card():
-        card = agent.get_agent_card(host=host, port=port)
-        return JSONResponse(content=card.model_dump())
+    def _lane(request: Request, task: Task) -> str:
+        value = request.headers.get(PRIORITY_HEADER)
+        if value is None and task.metadata:
+            value = task.metadata.get("priority")
+        return admission.lane_of(value)
 
-    @app.post("/tasks/send")
-    async def send_task(task: Task) -> TaskResult:
+    def _missing(e: MissingBlobs):
+        return JSONResponse(
+            status_code=409,
+            content={"error": str(e), "missing": e.digests},
+        )
+
+    def _busy(e: Rejected):
+        return JSONResponse(
+            status_code=e.status_code,
+            content={"error": e.reason, "retry_after": e.retry_after},
+            headers={"Retry-After": str(e.retry_after)},
+        )
+
+    async def _run(task: Task) -> TaskResult:
         try:
-            result = agent.handle_a2a_task(task)
-            return result
+            async_handler = getattr(agent, "ahandle_a2a_task", None)
+            if async_handler is not None:
+                return await async_handler(task)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, agent.handle_a2a_task, task)
         except Exception as e:
             return TaskResult(
                 id=task.id,
@@ -54,17 +144,134 @@ def create_a2a_app(agent, host: str = "0.0.0.0", port: int = 8100):
                 error=str(e),
             )
 
+    @app.get("/.well-known/agent.json")
+    async def get_agent_card():
+        card = agent.get_agent_card(host=host, port=port)
+        return JSONResponse(content=card.model_dump())
+
+    @app.post("/tasks/send")
+    async def send_task(task: Task, request: Request):
+        try:
+            task = hydrate(task, blobs)
+        except MissingBlobs as e:
+            return _missing(e)
+        try:
+            async with admission.slot(_lane(request, task)):
+                return await _run(task)
+        except Rejected as e:
+            return _busy(e)
+
+    @app.post("/tasks/sendSubscribe")
+    async def send_subscribe(task: Task, request: Request):
+        try:
+            task = hydrate(task, blobs)
+        except MissingBlobs as e:
+            return _missing(e)
+        # Admit before answering so a saturated server can still say 429;
+        # the slot is held until the stream ends
+        slot = admission.slot(_lane(request, task))
+        try:
+            await slot.__aenter__()
+        except Rejected as e:
+            return _busy(e)
+
+        async def _events():
+            try:
+                async for event in iterate_in_threadpool(iter_task_events(agent, task)):
+                    yield encode_sse(event)
+            finally:
+                await slot.__aexit__(None, None, None)
+
+        return StreamingResponse(
+            _events(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    @app.post("/tasks/submit", status_code=202)
+    async def submit_task(task: Task, request: Request):
+        lane = _lane(request, task)
+        try:
+            task = hydrate(task, blobs)
+        except MissingBlobs as e:
+            return _missing(e)
+        # A retried submit gets the stored task instead of a second run
+        try:
+            existing = manager.lookup(task)
+            manager.check_push_url(task)
+        except DuplicateTask as e:
+            return JSONResponse(status_code=409, content={"error": str(e)})
+        except ValueError as e:
+            return JSONResponse(status_code=400, content={"error": str(e)})
+        if existing is not None:
+            return JSONResponse(content=existing.model_dump(mode="json"))
+        # Take the queue position now, so concurrent submits cannot all pass
+        # an admission check and then overflow the queue in the background
+        try:
+            reservation = admission.reserve(lane)
+        except Rejected as e:
+            return _busy(e)
+        try:
+            submitted = manager.create(task)
+        except BaseException:
+            admission.abandon(reservation)
+            raise
+
+        async def _background():
+            try:
+                async with admission.slot(lane, timeout=None, reservation=reservation):
+                    loop = asyncio.get_running_loop()
+                    await loop.run_in_executor(executor, manager.run, task.id)
+            except Exception as e:
+                manager.fail(task.id, f"task could not be run: {e}")
+
+        job = asyncio.create_task(_background())
+        background.add(job)
+        job.add_done_callback(background.discard)
+        return submitted
+
+    @app.post("/tasks/get")
+    async def get_task(params: TaskIdParams):
+        result = manager.get(params.id)
+        if result is None:
+            return JSONResponse(status_code=404, content={"error": f"Unknown task {params.id}"})
+        return result
+
+    @app.post("/tasks/cancel")
+    async def cancel_task(params: TaskIdParams):
+        result = manager.cancel(params.id)
+        if result is None:
+            return JSONResponse(status_code=404, content={"error": f"Unknown task {params.id}"})
+        return result
+
+    @app.post("/blobs/have")
+    async def blobs_have(query: BlobQuery):
+        return {"missing": blobs.missing(query.digests)}
+
+    @app.post("/blobs")
+    async def blobs_upload(upload: BlobUpload):
+        try:
+            for key, content in upload.blobs.items():
+                blobs.put(content, key)
+        except ValueError as e:
+            return JSONResponse(status_code=400, content={"error": str(e)})
+        return {"stored": len(upload.blobs)}
+
     @app.get("/health")
     async def health():
-        return {"status": "ok", "agent": agent.name}
+        agent_stats = agent.stats() if hasattr(agent, "stats") else {}
+        return {"status": "ok", "agent": agent.name, **admission.stats(),
+                "blobs": blobs.stats(), **agent_stats}
 
     return app
 
 
-def serve_agent(agent, host: str = "0.0.0.0", port: int = 8100):
+def serve_agent(agent, host: str = "0.0.0.0", port: int = 8100, **options):
     """Start an A2A server for the given agent.
 
-    Blocks until the server is stopped.
+    Blocks until the server is stopped. `options` are passed to
+    create_a2a_app (max_in_flight, max_queue, queue_timeout, task_db, blobs,
+    push_hosts).
     """
     try:
         import uvicorn
@@ -74,7 +281,7 @@ def serve_agent(agent, host: str = "0.0.0.0", port: int = 8100):
             "Install with: pip install 'forge-ai[adk]'"
         )
 
-    app = create_a2a_app(agent, host=host, port=port)
+    app = create_a2a_app(agent, host=host, port=port, **options)
     print(f"Starting A2A server for '{agent.name}' on http://{host}:{port}")
     print(f"  AgentCard: http://{host}:{port}/.well-known/agent.json")
     uvicorn.run(app, host=host, port=port, log_level="warning")
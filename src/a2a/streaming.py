@@ -0,0 +1,132 @@
+"""Streaming A2A tasks -- TaskEvents as an agent produces its response.
+
+iter_task_events() runs an agent's handle_a2a_task() in a worker thread
+with a stream sink installed. While the sink is active, BaseAgent.invoke()
+streams from the provider instead of waiting for the full reply, and the
+sink turns chunks into `text` events and each closed ```file:path block
+into a `file` event. The final `result` event carries the same TaskResult
+handle_a2a_task() returns, so a streamed call never loses information
+compared to /tasks/send.
+
+Agents without streaming support (e.g. ADKAgentRunner) still work: their
+files are emitted from the final result, just not early.
+
+The sink is also the cancellation point: once `cancelled` is set, the
+next streamed chunk raises TaskCancelled, which closes the provider stream
+so a cancelled task stops consuming tokens (see a2a/tasks.py).
+
+Server-sent events on the wire are one `data: <TaskEvent json>` line each.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Iterable, Iterator, Optional
+
+from ..agents.file_stream import FileBlockParser, stream_to
+from .types import FilePart, Task, TaskEvent, TaskResult, TaskStatus
+
+
+class TaskCancelled(Exception):
+    """Raised inside an agent when its task has been cancelled."""
+
+
+class StreamSink:
+    """Collects streamed LLM output for one task into TaskEvents.
+
+    With `events=None` nothing is forwarded; the sink then only makes the
+    agent's LLM calls cancellable.
+    """
+
+    def __init__(self, task_id: str, events: Optional["queue.Queue"] = None,
+                 cancelled: Optional[threading.Event] = None):
+        self.task_id = task_id
+        self._events = events
+        self.cancelled = cancelled or threading.Event()
+        self.emitted: set[tuple[str, str]] = set()
+
+    def emit(self, event: TaskEvent):
+        if self._events is not None:
+            self._events.put(event)
+
+    def consume(self, chunks: Iterable[str]) -> str:
+        """Forward chunks and closed file blocks as events; return the full text."""
+        parser = FileBlockParser()
+        for chunk in chunks:
+            if self.cancelled.is_set():
+                raise TaskCancelled(self.task_id)
+            self.emit(TaskEvent(id=self.task_id, kind="text", text=chunk))
+            for path, content in parser.feed(chunk):
+                self.emit_file(path, content)
+        for path, content in parser.close():
+            self.emit_file(path, content)
+        return parser.response
+
+    def emit_file(self, path: str, content: str):
+        self.emitted.add((path, content))
+        self.emit(TaskEvent(id=self.task_id, kind="file",
+                            file=FilePart(path=path, content=content)))
+
+
+def iter_task_events(agent, task: Task) -> Iterator[TaskEvent]:
+    """Run a task on a local agent and yield its events as they happen."""
+    events: queue.Queue = queue.Queue()
+    sink = StreamSink(task.id, events)
+    done = object()
+
+    def _run():
+        try:
+            with stream_to(sink):
+                result = agent.handle_a2a_task(task)
+        except Exception as e:
+            result = TaskResult(id=task.id, status=TaskStatus.failed, error=str(e))
+        # Files the agent did not stream (non-streaming agents, fallback
+        # formats, post-processed content) are sent before the result
+        for path, content in result.get_files():
+            if (path, content) not in sink.emitted:
+                sink.emit_file(path, content)
+        events.put(TaskEvent(id=task.id, kind="result", status=result.status, result=result))
+        events.put(done)
+
+    yield TaskEvent(id=task.id, kind="status", status=TaskStatus.working)
+    threading.Thread(target=_run, name=f"a2a-stream-{task.id}", daemon=True).start()
+    while True:
+        event = events.get()
+        if event is done:
+            return
+        yield event
+
+
+def run_cancellable(agent, task: Task, cancelled: threading.Event) -> TaskResult:
+    """Run a task on this thread; setting `cancelled` stops it at the next chunk."""
+    sink = StreamSink(task.id, cancelled=cancelled)
+    if cancelled.is_set():
+        return TaskResult(id=task.id, status=TaskStatus.cancelled)
+    try:
+        with stream_to(sink):
+            result = agent.handle_a2a_task(task)
+    except TaskCancelled:
+        return TaskResult(id=task.id, status=TaskStatus.cancelled)
+    except Exception as e:
+        return TaskResult(id=task.id, status=TaskStatus.failed, error=str(e))
+    if cancelled.is_set():
+        return TaskResult(id=task.id, status=TaskStatus.cancelled)
+    return result
+
+
+def encode_sse(event: TaskEvent) -> str:
+    return f"data: {event.model_dump_json()}\n\n"
+
+
+def decode_sse(lines: Iterable[str]) -> Iterator[TaskEvent]:
+    """Parse `data:` lines of a text/event-stream into TaskEvents."""
+    data: list[str] = []
+    for line in lines:
+        if line.startswith("data:"):
+            data.append(line[5:].lstrip())
+        elif not line.strip() and data:
+            yield TaskEvent.model_validate_json("\n".join(data))
+            data = []
+    if data:
+        yield TaskEvent.model_validate_json("\n".join(data))
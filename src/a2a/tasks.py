@@ -0,0 +1,277 @@
+"""Asynchronous A2A task lifecycle -- submit, poll, cancel, push notifications.
+
+/tasks/send holds the connection open for the whole generation. For long
+tasks a client instead submits (getting the id back at once), then polls
+tasks/get or waits for a webhook. TaskStore persists every task's status
+and final TaskResult in SQLite, so results outlive the HTTP request and a
+client that timed out can still collect them. TaskManager runs tasks in
+the background and cancels them cooperatively: a cancelled task stops at
+the agent's next streamed chunk (see a2a/streaming.py).
+
+Submitting is idempotent: re-submitting a task id with the same request
+returns the task's current state, while reusing an id for a different
+request raises DuplicateTask. Webhooks (metadata["push_url"]) go only to
+http(s) hosts the TaskManager allows; the A2A server allows none unless
+configured with push_hosts, so callers cannot make it send requests to
+arbitrary URLs.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterable, Optional, Union
+from urllib.parse import urlparse
+
+from ..config import CONFIG_DIR
+from .streaming import run_cancellable
+from .types import Task, TaskResult, TaskStatus
+
+TASKS_DIR = CONFIG_DIR / "a2a"
+RETENTION_DAYS = 7          # finished tasks older than this are pruned
+WEBHOOK_ATTEMPTS = 3
+WEBHOOK_TIMEOUT = 10.0
+
+# Task.metadata key holding the URL to POST the final TaskResult to
+PUSH_URL_KEY = "push_url"
+
+_FINAL = (TaskStatus.completed, TaskStatus.failed, TaskStatus.cancelled)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id          TEXT PRIMARY KEY,
+    status      TEXT NOT NULL,
+    request     TEXT NOT NULL,
+    result      TEXT,
+    push_url    TEXT,
+    created_at  TEXT NOT NULL,
+    updated_at  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks(status, updated_at);
+"""
+
+
+class DuplicateTask(ValueError):
+    """A task id was submitted again with a different request."""
+
+
+class TaskStore:
+    """SQLite-backed table of A2A tasks, safe to share between threads."""
+
+    def __init__(self, path: Union[Path, str] = ":memory:"):
+        self.path = path
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+
+    def create(self, task: Task, push_url: Optional[str] = None) -> bool:
+        """Insert a submitted task; False if its id is already taken."""
+        now = datetime.now().isoformat()
+        with self._lock:
+            return self._db.execute(
+                "INSERT INTO tasks (id, status, request, push_url, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT(id) DO NOTHING",
+                (task.id, TaskStatus.submitted.value, task.model_dump_json(), push_url, now, now),
+            ).rowcount > 0
+
+    def set_status(self, task_id: str, status: TaskStatus, only_if: Optional[TaskStatus] = None) -> bool:
+        """Update a task's status; with `only_if`, only from that status. True if changed."""
+        sql = "UPDATE tasks SET status = ?, updated_at = ? WHERE id = ?"
+        args: list = [status.value, datetime.now().isoformat(), task_id]
+        if only_if is not None:
+            sql += " AND status = ?"
+            args.append(only_if.value)
+        with self._lock:
+            return self._db.execute(sql, args).rowcount > 0
+
+    def finish(self, task_id: str, result: TaskResult):
+        with self._lock:
+            self._db.execute(
+                "UPDATE tasks SET status = ?, result = ?, updated_at = ? WHERE id = ?",
+                (result.status.value, result.model_dump_json(), datetime.now().isoformat(), task_id),
+            )
+
+    def get(self, task_id: str) -> Optional[TaskResult]:
+        """The task's result if finished, else a TaskResult carrying its status."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT status, result FROM tasks WHERE id = ?", (task_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        status, result = row
+        if result:
+            return TaskResult.model_validate_json(result)
+        return TaskResult(id=task_id, status=TaskStatus(status))
+
+    def request(self, task_id: str) -> Optional[tuple[Task, Optional[str]]]:
+        """(Task, push_url) as submitted."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT request, push_url FROM tasks WHERE id = ?", (task_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return Task.model_validate_json(row[0]), row[1]
+
+    def fail_unfinished(self, reason: str) -> int:
+        """Mark tasks left submitted/working (by a previous process) as failed."""
+        with self._lock:
+            ids = [r[0] for r in self._db.execute(
+                "SELECT id FROM tasks WHERE status IN (?, ?)",
+                (TaskStatus.submitted.value, TaskStatus.working.value),
+            )]
+        for task_id in ids:
+            self.finish(task_id, TaskResult(id=task_id, status=TaskStatus.failed, error=reason))
+        return len(ids)
+
+    def prune(self, days: int = RETENTION_DAYS) -> int:
+        """Delete finished tasks last updated more than `days` ago."""
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        with self._lock:
+            return self._db.execute(
+                "DELETE FROM tasks WHERE status IN (?, ?, ?) AND updated_at < ?",
+                (*(s.value for s in _FINAL), cutoff),
+            ).rowcount
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class TaskManager:
+    """Runs submitted tasks for one agent and records them in a TaskStore.
+
+    The server schedules run() on its worker pool (behind admission
+    control); in-process clients use submit(), which starts a thread.
+
+    `push_hosts` are the hosts webhooks may be sent to; None allows any
+    http(s) URL, which is only safe when every submitter is trusted.
+    """
+
+    def __init__(self, agent, store: Optional[TaskStore] = None,
+                 push_hosts: Optional[Iterable[str]] = None):
+        self.agent = agent
+        self.store = store or TaskStore()
+        self.push_hosts = None if push_hosts is None else {h.lower() for h in push_hosts}
+        self._cancel: dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, task: Task) -> Optional[TaskResult]:
+        """Current state of an already submitted task, or None if its id is new.
+
+        Raises DuplicateTask if the id was submitted with a different request.
+        """
+        stored = self.store.request(task.id)
+        if stored is None:
+            return None
+        if stored[0] != task:
+            raise DuplicateTask(f"Task {task.id} was already submitted with a different request")
+        return self.store.get(task.id)
+
+    def check_push_url(self, task: Task):
+        """Raise ValueError if the task asks for a webhook this manager may not send."""
+        url = (task.metadata or {}).get(PUSH_URL_KEY)
+        if not url:
+            return
+        parsed = urlparse(str(url))
+        if parsed.scheme not in ("http", "https") or not parsed.hostname:
+            raise ValueError(f"push_url must be an http(s) URL: {url}")
+        if self.push_hosts is not None and parsed.hostname.lower() not in self.push_hosts:
+            raise ValueError(f"push notifications to {parsed.hostname} are not allowed")
+
+    def create(self, task: Task) -> TaskResult:
+        """Record a task as submitted; returns its initial TaskResult.
+
+        Raises DuplicateTask if the id is taken (see lookup()), and
+        ValueError if its push_url is not allowed.
+        """
+        self.check_push_url(task)
+        push_url = (task.metadata or {}).get(PUSH_URL_KEY)
+        if not self.store.create(task, push_url):
+            raise DuplicateTask(f"Task {task.id} was already submitted")
+        with self._lock:
+            self._cancel[task.id] = threading.Event()
+        return TaskResult(id=task.id, status=TaskStatus.submitted)
+
+    def submit(self, task: Task) -> TaskResult:
+        """create() and run the task on a background thread.
+
+        A task submitted before is not run again; its current state is returned.
+        """
+        existing = self.lookup(task)
+        if existing is not None:
+            return existing
+        submitted = self.create(task)
+        threading.Thread(target=self.run, args=(task.id,),
+                         name=f"a2a-task-{task.id}", daemon=True).start()
+        return submitted
+
+    def run(self, task_id: str) -> Optional[TaskResult]:
+        """Execute a created task on this thread and store its result."""
+        with self._lock:
+            cancelled = self._cancel.setdefault(task_id, threading.Event())
+        try:
+            if not self.store.set_status(task_id, TaskStatus.working, only_if=TaskStatus.submitted):
+                return None  # cancelled (or already run) before it started
+            task, push_url = self.store.request(task_id)
+            result = run_cancellable(self.agent, task, cancelled)
+            self.store.finish(task_id, result)
+        finally:
+            with self._lock:
+                self._cancel.pop(task_id, None)
+        if push_url:
+            notify(push_url, result)
+        return result
+
+    def fail(self, task_id: str, error: str):
+        """Record a task that has not finished as failed (e.g. it could not be scheduled)."""
+        current = self.store.get(task_id)
+        if current is not None and current.status not in _FINAL:
+            self.store.finish(task_id, TaskResult(id=task_id, status=TaskStatus.failed,
+                                                  error=error))
+
+    def get(self, task_id: str) -> Optional[TaskResult]:
+        return self.store.get(task_id)
+
+    def cancel(self, task_id: str) -> Optional[TaskResult]:
+        """Cancel a task. Queued tasks never start; running ones stop at the next chunk."""
+        current = self.store.get(task_id)
+        if current is None or current.status in _FINAL:
+            return current
+        with self._lock:
+            event = self._cancel.get(task_id)
+        if event is not None:
+            event.set()
+        if self.store.set_status(task_id, TaskStatus.cancelled, only_if=TaskStatus.submitted):
+            result = TaskResult(id=task_id, status=TaskStatus.cancelled)
+            self.store.finish(task_id, result)
+            return result
+        return self.store.get(task_id)
+
+
+def notify(url: str, result: TaskResult):
+    """POST a finished TaskResult to a webhook, retrying transient failures."""
+    try:
+        import httpx
+    except ImportError:
+        print(f"WARNING: httpx not installed; push notification to {url} skipped")
+        return
+    body = json.loads(result.model_dump_json())
+    for attempt in range(WEBHOOK_ATTEMPTS):
+        try:
+            resp = httpx.post(url, json=body, timeout=WEBHOOK_TIMEOUT)
+            if resp.status_code < 500:
+                return
+        except httpx.RequestError:
+            pass
+        if attempt < WEBHOOK_ATTEMPTS - 1:
+            time.sleep(2 ** attempt)
+    print(f"WARNING: push notification for task {result.id} to {url} failed")
@@ -99,6 +99,42 @@ class TaskResult(BaseModel):
         return None
 
 
+class TaskIdParams(BaseModel):
+    """Body of tasks/get and tasks/cancel."""
+    id: str
+
+
+class BlobQuery(BaseModel):
+    """Body of POST /blobs/have: digests the caller is about to reference."""
+    digests: List[str]
+
+
+class BlobUpload(BaseModel):
+    """Body of POST /blobs: {sha256: content} the server asked for."""
+    blobs: Dict[str, str]
+
+
+class TaskEvent(BaseModel):
+    """One update from a streaming task (/tasks/sendSubscribe).
+
+    kind:
+      status -- task state changed (`status`)
+      text   -- a chunk of the agent's response text (`text`)
+      file   -- a complete file block is ready (`file`)
+      result -- final event; `result` holds the full TaskResult
+    """
+    id: str
+    kind: Literal["status", "text", "file", "result"]
+    status: Optional[TaskStatus] = None
+    text: Optional[str] = None
+    file: Optional[FilePart] = None
+    result: Optional[TaskResult] = None
+
+    @property
+    def final(self) -> bool:
+        return self.kind == "result"
+
+
 class AgentSkill(BaseModel):
     """A skill/capability that an agent offers."""
     id: str
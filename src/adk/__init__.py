@@ -1,7 +1,15 @@
 """Google ADK integration layer for Forge agents."""
 
 from .agent_runner import ADKAgentRunner
+from .artifacts import ArtifactStore, Revision
 from .orchestrator_agent import ForgeADKOrchestrator
 from .tools import BuildArtifacts, make_agent_tools
 
-__all__ = ["ADKAgentRunner", "ForgeADKOrchestrator", "BuildArtifacts", "make_agent_tools"]
+__all__ = [
+    "ADKAgentRunner",
+    "ArtifactStore",
+    "ForgeADKOrchestrator",
+    "BuildArtifacts",
+    "Revision",
+    "make_agent_tools",
+]
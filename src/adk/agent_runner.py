@@ -10,18 +10,26 @@ google.adk.agents.LlmAgent. This runner:
   5. Returns a TaskResult with text + file artifacts
 
 This is the glue between ADK's world and the A2A protocol.
+
+Each runner owns one long-lived event loop on a background thread; every
+task (sync or async entry point) is submitted to it, so there is no
+per-call loop startup and ADK's session service is only touched from one
+thread. The per-task session is deleted once the task finishes, keeping
+memory flat on long-running agent servers.
 """
 
 from __future__ import annotations
 
 import asyncio
 import re
+import threading
 from typing import TYPE_CHECKING, Optional
 
 from ..a2a.types import (
     AgentCard, AgentSkill, Artifact, FilePart, Message,
     Task, TaskResult, TaskStatus, TextPart,
 )
+from ..providers.usage import usage_scope
 
 if TYPE_CHECKING:
     pass
@@ -55,6 +63,11 @@ class ADKAgentRunner:
         self.skill_description = skill_description
         self._runner = None
         self._session_service = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        self.live_sessions = 0
+        self.tasks_handled = 0
 
     def _ensure_runner(self):
         """Lazy-init the ADK Runner (imports google-adk only when needed)."""
@@ -77,10 +90,59 @@ class ADKAgentRunner:
             session_service=self._session_service,
         )
 
+    # ── Background loop ──────────────────────────────────────────────────────
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the runner's event loop thread on first use (or after close())."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=loop.run_forever, name=f"adk-{self.name}", daemon=True
+                )
+                self._thread.start()
+                self._loop = loop
+            return self._loop
+
+    def close(self):
+        """Stop the background loop. The runner restarts it if used again."""
+        with self._loop_lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    def stats(self) -> dict:
+        """Live-session and throughput counters (shown on the server's /health)."""
+        return {
+            "live_sessions": self.live_sessions,
+            "tasks_handled": self.tasks_handled,
+            "loop_running": self._loop is not None,
+        }
+
+    # ── A2A entry points ─────────────────────────────────────────────────────
+
     def handle_a2a_task(self, task: Task) -> TaskResult:
         """A2A entry point — run the ADK agent and return a TaskResult."""
+        loop = self._ensure_loop()
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("handle_a2a_task() called from the runner's own loop")
+        try:
+            return asyncio.run_coroutine_threadsafe(self._handle_async(task), loop).result()
+        except Exception as e:
+            return TaskResult(id=task.id, status=TaskStatus.failed, error=str(e))
+
+    async def ahandle_a2a_task(self, task: Task) -> TaskResult:
+        """Async A2A entry point for callers already on an event loop."""
+        loop = self._ensure_loop()
         try:
-            return asyncio.run(self._handle_async(task))
+            if asyncio.get_running_loop() is loop:
+                return await self._handle_async(task)
+            future = asyncio.run_coroutine_threadsafe(self._handle_async(task), loop)
+            return await asyncio.wrap_future(future)
         except Exception as e:
             return TaskResult(id=task.id, status=TaskStatus.failed, error=str(e))
 
@@ -102,30 +164,42 @@ class ADKAgentRunner:
         if task.context:
             prompt += "\n\n" + _format_context(task.context)
 
-        # Create a fresh session per task
+        # Create a fresh session per task; deleted below once it is done
         session = await self._session_service.create_session(
             app_name=f"forge-{self.name}",
             user_id="forge-build",
         )
+        self.live_sessions += 1
 
         message = genai_types.Content(
             role="user",
             parts=[genai_types.Part(text=prompt)],
         )
 
-        # Run the ADK agent and collect the final text response
+        # Run the ADK agent and collect the final text response; its LLM
+        # calls are recorded under this agent's name
         response_text = ""
-        async for event in self._runner.run_async(
-            user_id="forge-build",
-            session_id=session.id,
-            new_message=message,
-        ):
-            if hasattr(event, "is_final_response") and event.is_final_response():
-                if event.content:
-                    for part in getattr(event.content, "parts", []):
-                        t = getattr(part, "text", None)
-                        if t:
-                            response_text += t
+        try:
+            with usage_scope(agent=self.name):
+                async for event in self._runner.run_async(
+                    user_id="forge-build",
+                    session_id=session.id,
+                    new_message=message,
+                ):
+                    if hasattr(event, "is_final_response") and event.is_final_response():
+                        if event.content:
+                            for part in getattr(event.content, "parts", []):
+                                t = getattr(part, "text", None)
+                                if t:
+                                    response_text += t
+        finally:
+            await self._session_service.delete_session(
+                app_name=f"forge-{self.name}",
+                user_id="forge-build",
+                session_id=session.id,
+            )
+            self.live_sessions -= 1
+            self.tasks_handled += 1
 
         # Extract ```file:path``` blocks from the response
         files = _extract_files(response_text)
@@ -147,13 +221,18 @@ class ADKAgentRunner:
         )
 
     def get_agent_card(self, host: str = "localhost", port: int = 8100) -> AgentCard:
-        """Return A2A AgentCard for /.well-known/agent.json."""
+        """Return A2A AgentCard for /.well-known/agent.json.
+
+        /tasks/sendSubscribe serves runners through iter_task_events: a
+        working status, each generated file, then the result. The ADK
+        agent's text is not streamed token by token.
+        """
         return AgentCard(
             name=self.name,
             description=self.skill_description,
             url=f"http://{host}:{port}",
             version="0.1.0",
-            capabilities={"streaming": False, "pushNotifications": False},
+            capabilities={"streaming": True, "pushNotifications": True},
             skills=[
                 AgentSkill(
                     id=f"{self.name}-main",
@@ -163,10 +242,10 @@ class ADKAgentRunner:
             ],
         )
 
-    def serve(self, port: int = 8100, host: str = "0.0.0.0"):
+    def serve(self, port: int = 8100, host: str = "0.0.0.0", **options):
         """Start this agent as an A2A HTTP server (blocks)."""
         from ..a2a.server import serve_agent
-        serve_agent(self, host=host, port=port)
+        serve_agent(self, host=host, port=port, **options)
 
 
 # ── File extraction (same logic as BaseAgent.extract_files) ──────────────────
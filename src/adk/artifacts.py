@@ -0,0 +1,138 @@
+"""Path-keyed store for the files agents generate during an ADK build.
+
+Tools running concurrently (run_parallel_agents, the static DAG) all
+record their output here. Each path has exactly one current revision;
+every write that changes it adds a numbered Revision that remembers which
+agent produced it, so a file's history can be traced after the build.
+
+Two situations are recorded as conflicts rather than passing silently:
+
+  duplicate -- a second agent generates a path another agent already
+               produced, with different content (e.g. both backend and ci
+               emit requirements.txt). The first agent's revision stays
+               current and the duplicate is rejected, so a file streamed to
+               disk is never overwritten by another agent's version.
+  stale     -- a patch was computed against a revision that has since been
+               replaced. The patch is rejected so it cannot undo the newer
+               content.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class Revision:
+    path: str
+    content: str
+    agent: str
+    version: int  # 1 for the first revision of a path
+
+
+@dataclass(frozen=True)
+class Conflict:
+    kind: str  # "duplicate" | "stale"
+    current: Revision
+    incoming: Revision
+
+    def __str__(self) -> str:
+        if self.kind == "stale":
+            return (f"{self.current.path}: {self.incoming.agent} patch rejected, "
+                    f"{self.current.agent} rewrote the file first (now v{self.current.version})")
+        return (f"{self.current.path}: generated by both {self.current.agent} and "
+                f"{self.incoming.agent}; keeping {self.current.agent}'s version")
+
+
+class ArtifactStore:
+    """Thread-safe map of path → revision history.
+
+    Iterating yields (path, content) of the current revisions in the order
+    the paths were first written, which is what the file writers consume.
+    """
+
+    def __init__(self):
+        self._history: Dict[str, List[Revision]] = {}
+        self._conflicts: List[Conflict] = []
+        self._lock = threading.Lock()
+
+    def put(self, path: str, content: str, agent: str) -> Optional[Revision]:
+        """Record a generated file and return the path's current revision.
+
+        Re-writing identical content is a no-op. A different version from
+        another agent is recorded as a duplicate conflict (once) and None
+        is returned; write a file only when put() accepts it.
+        """
+        with self._lock:
+            revisions = self._history.setdefault(path, [])
+            current = revisions[-1] if revisions else None
+            if current is not None and current.content == content:
+                return current
+            rev = Revision(path, content, agent, len(revisions) + 1)
+            if current is not None and current.agent != agent:
+                if not any(c.kind == "duplicate" and c.current == current
+                           and c.incoming == rev for c in self._conflicts):
+                    self._conflicts.append(Conflict("duplicate", current, rev))
+                return None
+            revisions.append(rev)
+            return rev
+
+    def patch(self, path: str, content: str, agent: str,
+              base: Optional[int] = None) -> Optional[Revision]:
+        """Replace a file's current revision with a modified one.
+
+        `base` is the version the patch was computed from; if the file has
+        moved on since, the patch is recorded as a stale conflict and None
+        is returned. A patch to a path with no revisions adds it.
+        """
+        with self._lock:
+            revisions = self._history.setdefault(path, [])
+            current = revisions[-1] if revisions else None
+            if current is not None and current.content == content:
+                return current
+            rev = Revision(path, content, agent, len(revisions) + 1)
+            if current is not None and base is not None and current.version != base:
+                self._conflicts.append(Conflict("stale", current, rev))
+                return None
+            revisions.append(rev)
+            return rev
+
+    def get(self, path: str) -> Optional[Revision]:
+        with self._lock:
+            revisions = self._history.get(path)
+            return revisions[-1] if revisions else None
+
+    def history(self, path: str) -> List[Revision]:
+        """Every revision of a path, oldest first."""
+        with self._lock:
+            return list(self._history.get(path, ()))
+
+    def snapshot(self) -> Dict[str, Revision]:
+        """Current revision of every path, taken atomically."""
+        with self._lock:
+            return {path: revs[-1] for path, revs in self._history.items() if revs}
+
+    def contents(self) -> Dict[str, str]:
+        """{path: content} of the current revisions."""
+        return {path: rev.content for path, rev in self.snapshot().items()}
+
+    def paths(self) -> List[str]:
+        with self._lock:
+            return [path for path, revs in self._history.items() if revs]
+
+    def items(self) -> List[Tuple[str, str]]:
+        return list(self.contents().items())
+
+    @property
+    def conflicts(self) -> List[Conflict]:
+        with self._lock:
+            return list(self._conflicts)
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        return iter(self.items())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(1 for revs in self._history.values() if revs)
@@ -59,13 +59,8 @@ def create_forge_llm(provider: "BaseProvider"):
             if llm_request.system_instruction:
                 system = _content_to_text(llm_request.system_instruction)
 
-            # Call Forge provider (synchronous) -- run in executor for async
-            import asyncio
-            loop = asyncio.get_event_loop()
-            response_text = await loop.run_in_executor(
-                None,
-                lambda: provider.chat_with_retry(messages, system=system),
-            )
+            # Native async provider call -- no executor thread per request
+            response_text = await provider.achat_with_retry(messages, system=system)
 
             content = genai_types.Content(
                 role="model",
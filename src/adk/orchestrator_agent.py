@@ -17,17 +17,24 @@ Architecture:
             call_reviewer_agent,
         ]
         │
-        │  runner.run(spec + rules)
-        │  LLM decides which tools to call and in what order
+        │  runner.run("build the project")
+        │  LLM decides which tools to call and in what order; spec, rules
+        │  and decisions stay in BuildArtifacts and never pass through it
         │
-        ├── call_planner(spec, rules)
+        ├── call_planner()
         │       └── A2A POST → PlannerAgent → TaskResult
         │
-        ├── call_backend_agent(spec, rules)
+        ├── call_backend_agent()
         │       └── A2A POST → BackendAgent → TaskResult
         │
         └── ... (LLM continues until build is complete)
 
+Static mode (run_static / forge build --adk-static) skips the orchestrator
+LLM and calls the same tools as a fixed dependency graph:
+
+    planner → {backend, ci, deploy} → frontend (after backend)
+            → security (after backend + frontend) → reviewer (after all)
+
 Requires: pip install 'forge-ai[adk]'  (google-adk, google-genai)
 """
 
@@ -35,8 +42,9 @@ from __future__ import annotations
 
 import asyncio
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
+from ..providers.usage import usage_scope
 from .tools import BuildArtifacts, make_agent_tools
 
 if TYPE_CHECKING:
@@ -48,6 +56,10 @@ You are Forge Orchestrator, a master build coordinator for software projects.
 You coordinate specialized AI agents to build complete, production-ready applications
 from a project specification.
 
+The project spec, build rules and deploy template are already loaded and
+every tool reads them itself. Tools take no spec or rules arguments — never
+repeat the spec in a tool call.
+
 You have these tools available:
 - call_planner            — Analyze spec → build plan + tech decisions. Call this FIRST.
 - run_parallel_agents     — Run multiple independent agents concurrently (sub-orchestrator).
@@ -60,20 +72,20 @@ You have these tools available:
 - call_reviewer_agent     — Final review of all code. Call LAST.
 
 Execution order — follow this exactly:
-1. call_planner(spec, rules)
+1. call_planner()
    — Must be first. Produces the build plan and tech decisions.
 
-2. run_parallel_agents("backend,ci,deploy", spec, rules)
+2. run_parallel_agents("backend,ci,deploy")
    — Backend, CI, and Deploy are all independent of each other.
    — Use the sub-orchestrator so they run concurrently and save time.
 
-3. call_frontend_agent(spec, rules)
+3. call_frontend_agent()
    — Must come after backend (needs the API contracts).
 
 4. call_security_agent()
    — Must come after backend + frontend are both done.
 
-5. call_reviewer_agent(spec, rules)
+5. call_reviewer_agent()
    — Always last. Reviews everything generated.
 
 RULES:
@@ -83,6 +95,18 @@ RULES:
 """
 
 
+# Static execution graph: tool node → nodes it must wait for
+STATIC_PIPELINE = {
+    "planner":  set(),
+    "backend":  {"planner"},
+    "ci":       {"planner"},
+    "deploy":   {"planner"},
+    "frontend": {"backend"},
+    "security": {"backend", "frontend", "ci", "deploy"},  # audits every generated file
+    "reviewer": {"security", "ci", "deploy"},
+}
+
+
 class ForgeADKOrchestrator:
     """Orchestrates a multi-agent build using Google ADK LlmAgent + A2A protocol.
 
@@ -109,12 +133,14 @@ class ForgeADKOrchestrator:
         forge_path: Path,
         agents: Optional[Dict[str, Any]] = None,
         distributed: bool = False,
+        on_file: Optional[Callable[[str, str, str], None]] = None,
     ):
         self.provider = provider
         self.forge_path = forge_path
         self.project_root = forge_path.parent
         self.agents = agents or {}
         self.distributed = distributed
+        self.on_file = on_file  # see make_agent_tools
 
         from ..a2a.client import A2AClient
         self._clients: Dict[str, "A2AClient"] = {}
@@ -126,7 +152,24 @@ class ForgeADKOrchestrator:
             else:
                 self._clients[name] = A2AClient.for_agent(agent)
 
-    def _build_adk_agent(self, artifacts: BuildArtifacts, deploy_md: str):
+    def close(self):
+        """Release pooled HTTP connections held by the agent clients."""
+        for client in self._clients.values():
+            client.close()
+
+    def _artifacts(self, spec: str, rules: str) -> BuildArtifacts:
+        """Fresh shared state for one run, holding every input the tools read."""
+        from ..knowledge import load as load_knowledge
+
+        deploy_path = self.forge_path / "deploy.md"
+        return BuildArtifacts(
+            spec=spec,
+            rules=rules,
+            deploy_template=deploy_path.read_text() if deploy_path.exists() else "",
+            learnings=load_knowledge() or "",
+        )
+
+    def _build_adk_agent(self, artifacts: BuildArtifacts):
         """Create the ADK LlmAgent with all agent tools wired in."""
         try:
             from google.adk.agents import LlmAgent
@@ -139,7 +182,7 @@ class ForgeADKOrchestrator:
         from .llm_bridge import create_forge_llm
 
         llm = create_forge_llm(self.provider)
-        tools = make_agent_tools(self._clients, artifacts, deploy_md)
+        tools = make_agent_tools(self._clients, artifacts, self.on_file)
 
         return LlmAgent(
             name="forge-orchestrator",
@@ -149,6 +192,63 @@ class ForgeADKOrchestrator:
             tools=tools,
         )
 
+    def run_static(self, spec: str, rules: str, verbose: bool = False) -> Dict[str, Any]:
+        """Run the build as a hard-coded DAG of agent tools (no orchestrator LLM).
+
+        Same tools, same A2A calls and same result shape as run(), but the
+        call order comes from STATIC_PIPELINE instead of an LLM, so no
+        orchestrator round-trips are spent and independent agents run
+        concurrently. If the planner fails, nothing downstream is run.
+
+        Returns:
+            {decisions, tasks, files_written, errors, review}
+        """
+        from ..scheduler import run_dag
+
+        artifacts = self._artifacts(spec, rules)
+        tools = {fn.__name__: fn for fn in make_agent_tools(self._clients, artifacts, self.on_file)}
+
+        calls = {
+            "planner":  ("call_planner", tools["call_planner"]),
+            "backend":  ("call_backend_agent", tools["call_backend_agent"]),
+            "ci":       ("call_ci_agent", tools["call_ci_agent"]),
+            "deploy":   ("call_deploy_agent", tools["call_deploy_agent"]),
+            "frontend": ("call_frontend_agent", tools["call_frontend_agent"]),
+            "security": ("call_security_agent", tools["call_security_agent"]),
+            "reviewer": ("call_reviewer_agent", tools["call_reviewer_agent"]),
+        }
+        planner_failed = False
+
+        def _run(node: str):
+            nonlocal planner_failed
+            if planner_failed:
+                return
+            tool_name, call = calls[node]
+            if verbose:
+                print(f"  [ADK] → {tool_name}(...)")
+            try:
+                summary = call()
+            except Exception as e:
+                artifacts.errors.append(f"{node} raised an exception: {e}")
+                summary = f"ERROR: {e}"
+            if node == "planner" and summary.startswith("ERROR"):
+                planner_failed = True
+            if verbose:
+                print(f"  [ADK] ← {node}: {' '.join(summary.split())[:120]}")
+
+        if verbose:
+            print("  [ADK] Static pipeline starting...")
+
+        run_dag(STATIC_PIPELINE, _run, max_workers=len(STATIC_PIPELINE))
+
+        return {
+            "decisions": artifacts.decisions,
+            "tasks": artifacts.tasks,
+            "files_written": artifacts.files.items(),
+            "errors": artifacts.errors,
+            "review": artifacts.review,
+        }
+
     def run(self, spec: str, rules: str, verbose: bool = False) -> Dict[str, Any]:
         """Run the full multi-agent build via ADK LlmAgent + A2A.
 
@@ -171,16 +271,11 @@ class ForgeADKOrchestrator:
                 "Install with: pip install 'forge-ai[adk]'"
             )
 
-        deploy_md = ""
-        deploy_path = self.forge_path / "deploy.md"
-        if deploy_path.exists():
-            deploy_md = deploy_path.read_text()
-
-        # Shared state that tools write into
-        artifacts = BuildArtifacts()
+        # Shared state: the inputs tools read, and the results they write
+        artifacts = self._artifacts(spec, rules)
 
         # Build the ADK agent with tools bound to this run's artifacts
-        adk_agent = self._build_adk_agent(artifacts, deploy_md)
+        adk_agent = self._build_adk_agent(artifacts)
 
         # Set up runner + session
         session_service = InMemorySessionService()
@@ -194,20 +289,14 @@ class ForgeADKOrchestrator:
             user_id="forge-build",
         )
 
-        # Load past learnings from the knowledge base
-        from ..knowledge import load as load_knowledge
-        knowledge = load_knowledge()
-        knowledge_section = (
-            f"\n\n## Past Learnings (apply these to this build)\n{knowledge}"
-            if knowledge else ""
+        # Prompt: the tools already hold spec, rules and learnings, so the
+        # orchestrator only needs to know what it is building
+        title = next(
+            (line.lstrip("#").strip() for line in spec.splitlines() if line.startswith("#")),
+            "the project",
         )
-
-        # Prompt: give the orchestrator the full spec + rules + learnings
         prompt = (
-            f"Build this project using all available agents.\n\n"
-            f"## Project Spec\n{spec}\n\n"
-            f"## Build Rules\n{rules}"
-            f"{knowledge_section}\n\n"
+            f"Build {title} using all available agents.\n\n"
             f"Call every agent tool. Start with call_planner."
         )
         message = genai_types.Content(
@@ -218,31 +307,33 @@ class ForgeADKOrchestrator:
         if verbose:
             print("  [ADK] Orchestrator starting...")
 
-        # Run the ADK agent — it calls tools (→ A2A → agents) until done
+        # Run the ADK agent — it calls tools (→ A2A → agents) until done;
+        # its own LLM calls are recorded as the "orchestrator" agent
         final_text = ""
-        async for event in runner.run_async(
-            user_id="forge-build",
-            session_id=session.id,
-            new_message=message,
-        ):
-            # Print tool calls in verbose mode
-            if verbose and hasattr(event, "content") and event.content:
-                for part in getattr(event.content, "parts", []):
-                    fn_call = getattr(part, "function_call", None)
-                    fn_resp = getattr(part, "function_response", None)
-                    if fn_call:
-                        print(f"  [ADK] → {fn_call.name}(...)")
-                    elif fn_resp:
-                        resp_text = str(getattr(fn_resp, "response", ""))[:120]
-                        print(f"  [ADK] ← {fn_resp.name}: {resp_text}")
-
-            # Capture final text response
-            if hasattr(event, "is_final_response") and event.is_final_response():
-                if event.content:
+        with usage_scope(agent="orchestrator"):
+            async for event in runner.run_async(
+                user_id="forge-build",
+                session_id=session.id,
+                new_message=message,
+            ):
+                # Print tool calls in verbose mode
+                if verbose and hasattr(event, "content") and event.content:
                     for part in getattr(event.content, "parts", []):
-                        t = getattr(part, "text", None)
-                        if t:
-                            final_text += t
+                        fn_call = getattr(part, "function_call", None)
+                        fn_resp = getattr(part, "function_response", None)
+                        if fn_call:
+                            print(f"  [ADK] → {fn_call.name}(...)")
+                        elif fn_resp:
+                            resp_text = str(getattr(fn_resp, "response", ""))[:120]
+                            print(f"  [ADK] ← {fn_resp.name}: {resp_text}")
+
+                # Capture final text response
+                if hasattr(event, "is_final_response") and event.is_final_response():
+                    if event.content:
+                        for part in getattr(event.content, "parts", []):
+                            t = getattr(part, "text", None)
+                            if t:
+                                final_text += t
 
         if verbose and final_text:
             print(f"\n  [ADK] {final_text.strip()}")
@@ -250,7 +341,7 @@ class ForgeADKOrchestrator:
         return {
             "decisions": artifacts.decisions,
             "tasks": artifacts.tasks,
-            "files_written": artifacts.files,
+            "files_written": artifacts.files.items(),
             "errors": artifacts.errors,
             "review": artifacts.review,
         }
@@ -8,60 +8,111 @@ Tool design rules:
 - Docstring is used as the tool description shown to the LLM
 - Return a plain string summary that the LLM can reason about
 - Side-effect: write files/decisions into the shared BuildArtifacts state
+- Never take the spec, rules or decisions as arguments: they are read from
+  BuildArtifacts, so the orchestrator LLM does not have to re-emit them as
+  output tokens on every call
 """
 
 from __future__ import annotations
 
 import json
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional
 
+from .artifacts import ArtifactStore
 
 @dataclass
 class BuildArtifacts:
-    """Shared state written to by tools, read by orchestrator after run."""
+    """Shared state written to by tools, read by orchestrator after run.
+
+    The inputs (spec, rules, deploy template, past learnings) are set by the
+    orchestrator before the run; tools resolve them from here.
+    """
+    spec: str = ""
+    rules: str = ""
+    deploy_template: str = ""  # .forge/deploy.md
+    learnings: str = ""        # knowledge base, shown to the planner
     decisions: Dict = field(default_factory=dict)
     tasks: List = field(default_factory=list)
-    files: List[Tuple[str, str]] = field(default_factory=list)  # (path, content)
+    files: ArtifactStore = field(default_factory=ArtifactStore)  # one current revision per path
     errors: List[str] = field(default_factory=list)
     review: Optional[Dict] = None
 
 
-def make_agent_tools(clients: dict, artifacts: BuildArtifacts, deploy_md: str = "") -> list:
+def make_agent_tools(clients: dict, artifacts: BuildArtifacts,
+                     on_file: Optional[Callable[[str, str, str], None]] = None) -> list:
     """Create all ADK tool functions bound to the given A2A clients and shared artifacts.
 
     Args:
         clients: dict of agent_name → A2AClient
-        artifacts: shared BuildArtifacts that tools write into
-        deploy_md: contents of .forge/deploy.md (for DeployAgent)
+        artifacts: shared BuildArtifacts holding the build inputs; tools write
+                   their results into it
+        on_file: optional callback(agent_name, path, content), called as soon
+                 as a code-generating agent (backend, frontend, ci, deploy)
+                 finishes each file, while it is still generating the rest.
+                 Only revisions the artifact store accepts are passed on.
 
     Returns:
         List of plain Python functions usable as ADK tools
     """
     from ..a2a.types import Task, Message, TextPart
 
-    def _send(agent_name: str, text: str, context: dict = None):
+    def _send(agent_name: str, text: str, context: dict = None, stream_files: bool = False,
+              files: Optional[Dict[str, str]] = None):
         client = clients.get(agent_name)
         if client is None:
             raise RuntimeError(f"Agent '{agent_name}' not registered")
+        context = dict(context or {})
+        if files:
+            # By digest: only contents the agent's side lacks are transferred
+            context["file_refs"] = client.blobs.refs(files)
         task = Task(
             message=Message(role="user", parts=[TextPart(text=text)]),
-            context=context or {},
+            context=context,
         )
-        return client.send_task(task)
+        if not (stream_files and on_file):
+            return client.send_task(task)
+        for event in client.stream_task(task):
+            if event.kind == "file":
+                rev = _put(agent_name, event.file.path, event.file.content)
+                if rev is not None and rev.agent == agent_name:
+                    on_file(agent_name, rev.path, rev.content)
+            elif event.final:
+                return event.result
+
+    def _put(agent_name: str, path: str, content: str):
+        """Add one file to the store; a rejected duplicate is reported once."""
+        before = len(artifacts.files.conflicts)
+        rev = artifacts.files.put(path, content, agent_name)
+        for conflict in artifacts.files.conflicts[before:]:
+            if conflict.incoming.agent == agent_name and conflict.incoming.path == path:
+                artifacts.errors.append(f"Conflict: {conflict}")
+        return rev
+
+    def _record(agent_name: str, result) -> List[str]:
+        """Add an agent's generated files to the store; returns their paths."""
+        files = result.get_files()
+        for path, content in files:
+            _put(agent_name, path, content)
+        return [path for path, _ in files]
+
+    def _listing(paths: List[str], limit: Optional[int] = None) -> str:
+        shown = paths if limit is None else paths[:limit]
+        more = "..." if limit is not None and len(paths) > limit else ""
+        return f"{len(paths)} files: {', '.join(shown)}{more}"
 
     # ── Tools ─────────────────────────────────────────────────────────────────
 
-    def call_planner(spec: str, rules: str) -> str:
+    def call_planner() -> str:
         """Analyze the project specification and return a structured build plan.
 
         Call this FIRST. Returns the tech stack decisions and an ordered list of
-        build tasks. You must call this before any other agent.
-
-        Args:
-            spec: Full contents of the project spec (.forge/spec.md)
-            rules: Full contents of the build rules (.forge/rules.md)
+        build tasks. You must call this before any other agent. Takes no
+        arguments — the spec and rules are already loaded.
         """
+        spec, rules = artifacts.spec, artifacts.rules
+        if artifacts.learnings:
+            spec = f"{spec}\n\n## Past Learnings (apply these to this build)\n{artifacts.learnings}"
         result = _send(
             "planner",
             f"Analyze this specification and produce a structured build plan.\n\n"
@@ -82,42 +133,36 @@ def make_agent_tools(clients: dict, artifacts: BuildArtifacts, deploy_md: str =
         )
         return summary
 
-    def call_backend_agent(spec: str, rules: str) -> str:
+    def call_backend_agent() -> str:
         """Generate complete backend code: API routes, database models, and service layer.
 
         Call this after call_planner. Generates all backend source files.
-
-        Args:
-            spec: Full contents of the project spec
-            rules: Full contents of the build rules
+        Takes no arguments.
         """
+        spec, rules = artifacts.spec, artifacts.rules
         decisions_str = json.dumps(artifacts.decisions, indent=2)
         result = _send(
             "backend",
             f"Generate backend code (API routes, DB models, service layer).\n\n"
             f"## Spec\n{spec}\n\n## Rules\n{rules}\n\n## Decisions\n{decisions_str}",
             context={"decisions": artifacts.decisions, "spec": spec, "rules": rules},
+            stream_files=True,
         )
         if not result.success:
             artifacts.errors.append(f"Backend failed: {result.error}")
             return f"ERROR: Backend failed — {result.error}"
 
-        files = result.get_files()
-        artifacts.files.extend(files)
-        paths = [f[0] for f in files]
-        return f"Backend complete. {len(files)} files: {', '.join(paths[:5])}{'...' if len(paths) > 5 else ''}"
+        return f"Backend complete. {_listing(_record('backend', result), 5)}"
 
-    def call_frontend_agent(spec: str, rules: str) -> str:
+    def call_frontend_agent() -> str:
         """Generate frontend code: React components, routing, state, and API integration.
 
         Call this after call_backend_agent so it can match API contracts.
-
-        Args:
-            spec: Full contents of the project spec
-            rules: Full contents of the build rules
+        Takes no arguments.
         """
+        spec, rules = artifacts.spec, artifacts.rules
         decisions_str = json.dumps(artifacts.decisions, indent=2)
-        backend_paths = [f[0] for f in artifacts.files]
+        backend_paths = artifacts.files.paths()
         result = _send(
             "frontend",
             f"Generate frontend code (React components, pages, routing, API integration).\n\n"
@@ -128,15 +173,13 @@ def make_agent_tools(clients: dict, artifacts: BuildArtifacts, deploy_md: str =
                 "rules": rules,
                 "backend_files": backend_paths,
             },
+            stream_files=True,
         )
         if not result.success:
             artifacts.errors.append(f"Frontend failed: {result.error}")
             return f"ERROR: Frontend failed — {result.error}"
 
-        files = result.get_files()
-        artifacts.files.extend(files)
-        paths = [f[0] for f in files]
-        return f"Frontend complete. {len(files)} files: {', '.join(paths[:5])}{'...' if len(paths) > 5 else ''}"
+        return f"Frontend complete. {_listing(_record('frontend', result), 5)}"
 
     def call_security_agent() -> str:
         """Audit all generated code for security issues (OWASP Top 10, secrets, injection).
@@ -144,12 +187,13 @@ def make_agent_tools(clients: dict, artifacts: BuildArtifacts, deploy_md: str =
         Call this after backend and frontend are generated. May return patched files.
         No arguments needed — audits everything generated so far.
         """
-        files_dict = {path: content for path, content in artifacts.files}
+        # Patches apply only to the revisions that were audited
+        audited = artifacts.files.snapshot()
         result = _send(
             "security",
             "Perform a security audit on the generated code. "
             "Check for OWASP Top 10, hardcoded secrets, and injection flaws.",
-            context={"files": files_dict},
+            files={path: rev.content for path, rev in audited.items()},
         )
         if not result.success:
             artifacts.errors.append(f"Security audit failed: {result.error}")
@@ -157,82 +201,76 @@ def make_agent_tools(clients: dict, artifacts: BuildArtifacts, deploy_md: str =
 
         patched = result.get_files()
         if patched:
-            patch_map = {p: c for p, c in patched}
-            artifacts.files = [
-                (path, patch_map.get(path, content))
-                for path, content in artifacts.files
-            ]
-            existing = {p for p, _ in artifacts.files}
-            artifacts.files.extend((p, c) for p, c in patched if p not in existing)
-            return f"Security audit complete. {len(patched)} file(s) patched."
+            stale = []
+            for path, content in patched:
+                base = audited[path].version if path in audited else None
+                if artifacts.files.patch(path, content, "security", base=base) is None:
+                    stale.append(path)
+                    artifacts.errors.append(
+                        f"Security patch for {path} not applied: file changed during the audit"
+                    )
+            applied = len(patched) - len(stale)
+            note = f" {len(stale)} stale patch(es) rejected." if stale else ""
+            return f"Security audit complete. {applied} file(s) patched.{note}"
 
         audit_text = result.get_text()
         passed = "PASS" in audit_text.upper() or "no issue" in audit_text.lower()
         return f"Security audit complete. {'No issues found.' if passed else 'Issues found — see audit report.'}"
 
-    def call_ci_agent(spec: str) -> str:
+    def call_ci_agent() -> str:
         """Generate CI/CD configuration: GitHub Actions workflows, Dockerfile, docker-compose.
 
         Call this after call_planner. Independent of backend/frontend output.
-
-        Args:
-            spec: Full contents of the project spec
+        Takes no arguments.
         """
+        spec = artifacts.spec
         decisions_str = json.dumps(artifacts.decisions, indent=2)
         result = _send(
             "ci",
             "Generate CI/CD configuration: GitHub Actions workflows, Dockerfile, docker-compose.yml.",
             context={"decisions": artifacts.decisions, "spec": spec},
+            stream_files=True,
         )
         if not result.success:
             artifacts.errors.append(f"CI/CD failed: {result.error}")
             return f"ERROR: CI/CD failed — {result.error}"
 
-        files = result.get_files()
-        artifacts.files.extend(files)
-        paths = [f[0] for f in files]
-        return f"CI/CD complete. {len(files)} files: {', '.join(paths)}"
+        return f"CI/CD complete. {_listing(_record('ci', result))}"
 
-    def call_deploy_agent(spec: str) -> str:
+    def call_deploy_agent() -> str:
         """Generate deployment configuration for Railway, Render, Vercel, or Fly.io.
 
         Call this after call_planner. Independent of backend/frontend output.
-
-        Args:
-            spec: Full contents of the project spec
+        Takes no arguments.
         """
+        spec = artifacts.spec
         result = _send(
             "deploy",
             "Generate deployment configuration files.",
             context={
                 "decisions": artifacts.decisions,
                 "spec": spec,
-                "deploy_template": deploy_md,
+                "deploy_template": artifacts.deploy_template,
             },
+            stream_files=True,
         )
         if not result.success:
             artifacts.errors.append(f"Deploy config failed: {result.error}")
             return f"ERROR: Deploy config failed — {result.error}"
 
-        files = result.get_files()
-        artifacts.files.extend(files)
-        paths = [f[0] for f in files]
-        return f"Deploy config complete. {len(files)} files: {', '.join(paths)}"
+        return f"Deploy config complete. {_listing(_record('deploy', result))}"
 
-    def call_reviewer_agent(spec: str, rules: str) -> str:
+    def call_reviewer_agent() -> str:
         """Review all generated code for correctness, consistency, and security.
 
-        Call this LAST after all other agents have run.
-
-        Args:
-            spec: Full contents of the project spec
-            rules: Full contents of the build rules
+        Call this LAST after all other agents have run. Takes no arguments.
         """
-        files_dict = {path: content for path, content in artifacts.files}
+        spec, rules = artifacts.spec, artifacts.rules
         result = _send(
             "reviewer",
             "Review all generated code for correctness, consistency, and completeness.",
-            context={"files": files_dict, "spec": spec, "rules": rules},
+            context={"spec": spec, "rules": rules},
+            files=artifacts.files.contents(),
         )
         if not result.success:
             artifacts.errors.append(f"Review failed: {result.error}")
@@ -247,7 +285,7 @@ def make_agent_tools(clients: dict, artifacts: BuildArtifacts, deploy_md: str =
             return f"Review complete. {'Passed.' if passed else f'{n_issues} issue(s) found.'}"
         return "Review complete."
 
-    def run_parallel_agents(agent_names: str, spec: str, rules: str) -> str:
+    def run_parallel_agents(agent_names: str) -> str:
         """Run multiple independent agents in parallel using a thread pool.
 
         Use this for agents that do not depend on each other's output.
@@ -258,17 +296,15 @@ def make_agent_tools(clients: dict, artifacts: BuildArtifacts, deploy_md: str =
             agent_names: Comma-separated names of agents to run in parallel.
                          Valid names: backend, frontend, ci, deploy, security
                          Example: "backend,ci,deploy"
-            spec: Full contents of the project spec
-            rules: Full contents of the build rules
         """
         from concurrent.futures import ThreadPoolExecutor, as_completed
 
         _AGENT_DISPATCH = {
-            "backend":  lambda: call_backend_agent(spec, rules),
-            "frontend": lambda: call_frontend_agent(spec, rules),
-            "ci":       lambda: call_ci_agent(spec),
-            "deploy":   lambda: call_deploy_agent(spec),
-            "security": lambda: call_security_agent(),
+            "backend":  call_backend_agent,
+            "frontend": call_frontend_agent,
+            "ci":       call_ci_agent,
+            "deploy":   call_deploy_agent,
+            "security": call_security_agent,
         }
 
         names = [n.strip() for n in agent_names.split(",") if n.strip()]
@@ -3,6 +3,7 @@
 from pathlib import Path
 
 from .base import BaseAgent
+from ..providers.prompt import project_prefix, segment
 from ..providers.base import BaseProvider
 
 # ── ADK agent factory ─────────────────────────────────────────────────────────
@@ -94,16 +95,7 @@ class BackendAgent(BaseAgent):
         project_context: str = "",
     ) -> str:
         """Generate all backend files. Returns raw LLM response."""
-        prompt = f"""\
-## Project Specification
-{spec}
-
-## Build Rules
-{rules}
-
-## Architecture Decisions
-{decisions}
-
+        prompt = [project_prefix(spec, rules, decisions), segment(f"""\
 ## Existing Project Context
 {project_context or "(No existing files)"}
 
@@ -121,7 +113,7 @@ Use this format for each file:
 <complete file contents>
 ```
 
-Write COMPLETE files. Include all imports and error handling."""
+Write COMPLETE files. Include all imports and error handling.""")]
 
         return self.invoke(prompt)
 
@@ -2,20 +2,23 @@
 
 import re
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, Union
 
 from ..providers.base import BaseProvider
+from ..providers.usage import usage_scope
 
 
 class BaseAgent:
     """Base class for all Forge agents.
 
     Each agent has a role (system prompt), can construct prompts from context,
-    and can extract file blocks from LLM responses.
+    and can extract file blocks from LLM responses. Provider calls made
+    through the invoke methods are recorded under the agent's name.
 
     A2A support:
       - skill_description: short description of what this agent does
-      - handle_a2a_task(task): A2A entry point
+      - handle_a2a_task(task): A2A entry point (also streamable, see
+        a2a/streaming.py); ahandle_a2a_task(task) is its async form
       - get_agent_card(host, port): returns AgentCard for /.well-known/agent.json
       - serve(port): starts a FastAPI A2A server
     """
@@ -24,6 +27,12 @@ class BaseAgent:
     name: str = "base"
     skill_description: str = "A general-purpose Forge build agent."
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # The inherited async handler would bypass a sync override
+        if "handle_a2a_task" in cls.__dict__ and "ahandle_a2a_task" not in cls.__dict__:
+            cls.ahandle_a2a_task = None
+
     def __init__(self, provider: BaseProvider, project_root: Path):
         self.provider = provider
         self.project_root = project_root
@@ -40,14 +49,58 @@ class BaseAgent:
         )
         return f"{self.role}\n\n{safety}"
 
-    def invoke(self, prompt: str) -> str:
-        """Send a prompt to the LLM with this agent's system role."""
+    def invoke(self, prompt: Union[str, list]) -> str:
+        """Send a prompt to the LLM with this agent's system role.
+
+        `prompt` may be a segment list whose stable leading parts are
+        marked cacheable (see providers/prompt.py).
+        """
         messages = [{"role": "user", "content": prompt}]
-        return self.provider.chat_with_retry(messages, system=self._system_prompt())
+        return self.invoke_with_history(messages)
 
     def invoke_with_history(self, messages: list[dict]) -> str:
-        """Send a multi-turn conversation."""
-        return self.provider.chat_with_retry(messages, system=self._system_prompt())
+        """Send a multi-turn conversation.
+
+        Inside a streaming A2A task the reply is streamed to the task's
+        subscribers as it is generated; the return value is the same.
+        """
+        from .file_stream import active_sink
+        sink = active_sink()
+        with usage_scope(agent=self.name):
+            if sink is not None:
+                return sink.consume(
+                    self.provider.stream_with_retry(messages, system=self._system_prompt())
+                )
+            return self.provider.chat_with_retry(messages, system=self._system_prompt())
+
+    def discard_response(self, prompt: Union[str, list]):
+        """Forget the cached reply to invoke(prompt) after rejecting it."""
+        messages = [{"role": "user", "content": prompt}]
+        self.provider.discard_cached(messages, system=self._system_prompt())
+
+    def invoke_stream(self, prompt: Union[str, list]) -> Iterator[str]:
+        """Stream the response to a prompt chunk by chunk."""
+        messages = [{"role": "user", "content": prompt}]
+        return self._scoped(self.provider.stream_with_retry(messages, system=self._system_prompt()))
+
+    def _scoped(self, chunks: Iterator[str]) -> Iterator[str]:
+        with usage_scope(agent=self.name):
+            yield from chunks
+
+    def stream_files(self, prompt: Union[str, list]) -> "FileStream":
+        """Invoke and yield (path, content) as each file block closes.
+
+        Iterate the returned FileStream; its `response` attribute holds the
+        full text once iteration finishes.
+        """
+        from .file_stream import FileStream
+        return FileStream(self.invoke_stream(prompt), fallback=self.extract_files)
+
+    async def ainvoke(self, prompt: Union[str, list]) -> str:
+        """Async invoke() for callers running on an event loop."""
+        messages = [{"role": "user", "content": prompt}]
+        with usage_scope(agent=self.name):
+            return await self.provider.achat_with_retry(messages, system=self._system_prompt())
 
     def extract_files(self, response: str) -> list[tuple[str, str]]:
         """Extract file blocks from LLM response.
@@ -134,48 +187,25 @@ class BaseAgent:
           3. Extracts any file blocks from the response
           4. Returns a TaskResult with text + file artifacts
         """
-        from ..a2a.types import TaskResult, TaskStatus, Artifact, TextPart, FilePart, Message
-
         try:
-            # Extract prompt text from task message parts
-            prompt_parts = []
-            for part in task.message.parts:
-                if hasattr(part, "text"):
-                    prompt_parts.append(part.text)
-            prompt = "\n".join(prompt_parts)
-
-            # Inject context if provided
-            if task.context:
-                context_str = self._format_context(task.context)
-                if context_str:
-                    prompt = f"{prompt}\n\n{context_str}"
-
-            response = self.invoke(prompt)
-            files = self.extract_files(response)
-
-            artifacts = []
-
-            # Text artifact (the full response)
-            artifacts.append(Artifact(
-                type="text",
-                name="response",
-                parts=[TextPart(text=response)],
-            ))
-
-            # File artifacts
-            if files:
-                file_parts = [FilePart(path=fp, content=content) for fp, content in files]
-                artifacts.append(Artifact(
-                    type="files",
-                    name="generated_files",
-                    parts=file_parts,
-                ))
-
+            return self._a2a_result(task, self.invoke(self._a2a_prompt(task)))
+        except Exception as e:
+            from ..a2a.types import TaskResult, TaskStatus
             return TaskResult(
                 id=task.id,
-                status=TaskStatus.completed,
-                artifacts=artifacts,
+                status=TaskStatus.failed,
+                error=str(e),
             )
+
+    async def ahandle_a2a_task(self, task) -> "TaskResult":
+        """Async A2A entry point, used by the A2A server and in-process clients.
+
+        Runs the default handler on the event loop through ainvoke(). Agents
+        that override only handle_a2a_task have no async handler (see
+        __init_subclass__), so callers run their override in a thread.
+        """
+        try:
+            return self._a2a_result(task, await self.ainvoke(self._a2a_prompt(task)))
         except Exception as e:
             from ..a2a.types import TaskResult, TaskStatus
             return TaskResult(
@@ -184,6 +214,51 @@ class BaseAgent:
                 error=str(e),
             )
 
+    def _a2a_prompt(self, task) -> str:
+        """The prompt text of an A2A task, with its context appended."""
+        prompt_parts = []
+        for part in task.message.parts:
+            if hasattr(part, "text"):
+                prompt_parts.append(part.text)
+        prompt = "\n".join(prompt_parts)
+
+        # Inject context if provided
+        if task.context:
+            context_str = self._format_context(task.context)
+            if context_str:
+                prompt = f"{prompt}\n\n{context_str}"
+        return prompt
+
+    def _a2a_result(self, task, response: str) -> "TaskResult":
+        """TaskResult with the response text and any file blocks in it."""
+        from ..a2a.types import TaskResult, TaskStatus, Artifact, TextPart, FilePart
+
+        files = self.extract_files(response)
+
+        artifacts = []
+
+        # Text artifact (the full response)
+        artifacts.append(Artifact(
+            type="text",
+            name="response",
+            parts=[TextPart(text=response)],
+        ))
+
+        # File artifacts
+        if files:
+            file_parts = [FilePart(path=fp, content=content) for fp, content in files]
+            artifacts.append(Artifact(
+                type="files",
+                name="generated_files",
+                parts=file_parts,
+            ))
+
+        return TaskResult(
+            id=task.id,
+            status=TaskStatus.completed,
+            artifacts=artifacts,
+        )
+
     def _format_context(self, context: dict) -> str:
         """Format a context dict into a prompt section."""
         parts = []
@@ -208,7 +283,7 @@ class BaseAgent:
             description=self.skill_description,
             url=f"http://{host}:{port}",
             version="0.1.0",
-            capabilities={"streaming": False, "pushNotifications": False},
+            capabilities={"streaming": True, "pushNotifications": True},
             skills=[
                 AgentSkill(
                     id=f"{self.name}-main",
@@ -218,7 +293,7 @@ class BaseAgent:
             ],
         )
 
-    def serve(self, port: int = 8100, host: str = "0.0.0.0"):
+    def serve(self, port: int = 8100, host: str = "0.0.0.0", **options):
         """Start an A2A-compatible HTTP server for this agent."""
         from ..a2a.server import serve_agent
-        serve_agent(self, host=host, port=port)
+        serve_agent(self, host=host, port=port, **options)
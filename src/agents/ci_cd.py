@@ -1,6 +1,7 @@
 """CI/CD agent -- generates GitHub Actions workflows, Dockerfiles, and compose configs."""
 
 from .base import BaseAgent
+from ..providers.prompt import project_prefix, segment
 
 # ── ADK agent factory ─────────────────────────────────────────────────────────
 
@@ -90,16 +91,7 @@ class CIAgent(BaseAgent):
 
         decisions_str = json.dumps(decisions, indent=2) if isinstance(decisions, dict) else str(decisions)
 
-        prompt = f"""\
-## Project Specification
-{spec}
-
-## Tech Stack Decisions
-{decisions_str}
-
-## Build Rules
-{rules or "(Use sensible defaults)"}
-
+        prompt = [project_prefix(spec, rules or "(Use sensible defaults)", decisions_str), segment("""\
 Generate the COMPLETE CI/CD configuration:
 1. `.github/workflows/ci.yml` -- lint + test on every push/PR
 2. `.github/workflows/deploy.yml` -- build and deploy on merge to main
@@ -113,7 +105,7 @@ Use this format for each file:
 <complete file contents>
 ```
 
-Match the tech stack exactly. Include proper caching for dependencies."""
+Match the tech stack exactly. Include proper caching for dependencies.""")]
 
         return self.invoke(prompt)
 
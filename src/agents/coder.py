@@ -1,5 +1,6 @@
 """Coder agent -- generates complete file contents for a given task."""
 
+from ..providers.prompt import project_prefix, segment
 from .base import BaseAgent
 
 
@@ -24,16 +25,18 @@ class CoderAgent(BaseAgent):
     def generate_files(self, task: dict, spec: str, rules: str,
                        decisions: str, project_context: str) -> str:
         """Generate code for a single task. Returns raw LLM response."""
-        prompt = f"""\
-## Project Specification
-{spec}
-
-## Build Rules
-{rules}
-
-## Architecture Decisions
-{decisions}
-
+        return self.invoke(self._task_prompt(task, spec, rules, decisions, project_context))
+
+    def stream_task_files(self, task: dict, spec: str, rules: str,
+                          decisions: str, project_context: str):
+        """Generate code for a task, yielding each file as soon as it is complete."""
+        return self.stream_files(self._task_prompt(task, spec, rules, decisions, project_context))
+
+    def _task_prompt(self, task: dict, spec: str, rules: str,
+                     decisions: str, project_context: str) -> list:
+        # Spec, rules and decisions are the same for every task of a build:
+        # a cacheable prefix, with the task-specific part after it
+        return [project_prefix(spec, rules, decisions), segment(f"""\
 ## Current Task
 **{task['name']}**
 {task['description']}
@@ -55,17 +58,12 @@ Important:
 - Include all imports
 - Include proper error handling
 - Follow the build rules exactly
-- If modifying an existing file, output the ENTIRE updated file"""
-
-        return self.invoke(prompt)
+- If modifying an existing file, output the ENTIRE updated file""")]
 
     def fix_file(self, filepath: str, current_content: str, issue: str,
                  spec: str, rules: str) -> str:
         """Fix a specific file based on a review issue."""
-        prompt = f"""\
-## Build Rules
-{rules}
-
+        prompt = [segment(f"## Build Rules\n{rules}", cache=True), segment(f"""\
 ## File to Fix
 **{filepath}**
 
@@ -81,6 +79,6 @@ Output the COMPLETE corrected file using this format:
 
 ```file:{filepath}
 <complete corrected file contents>
-```"""
+```""")]
 
         return self.invoke(prompt)
@@ -1,6 +1,7 @@
 """Deploy agent -- generates cloud deployment configs for Railway, Render, Vercel, Fly.io."""
 
 from .base import BaseAgent
+from ..providers.prompt import project_prefix, segment
 
 # ── ADK agent factory ─────────────────────────────────────────────────────────
 
@@ -103,18 +104,11 @@ class DeployAgent(BaseAgent):
             dl = deploy_template.lower()
             for p in ["railway", "render", "vercel", "fly", "heroku"]:
                 if p in dl:
-                    platform_hint = f"\nTarget platform: {p.title()}"
+                    platform_hint = f"Target platform: {p.title()}\n\n"
                     break
 
-        prompt = f"""\
-## Project Specification
-{spec}
-
-## Tech Stack Decisions
-{decisions_str}
-{platform_hint}
-
-## Deploy Template
+        prompt = [project_prefix(spec, decisions=decisions_str), segment(f"""\
+{platform_hint}## Deploy Template
 {deploy_template or "(No deploy template -- use Railway as default)"}
 
 Generate the COMPLETE deployment configuration:
@@ -129,7 +123,7 @@ Use this format for each file:
 <complete file contents>
 ```
 
-Match the tech stack and target platform. Include all required environment variables."""
+Match the tech stack and target platform. Include all required environment variables.""")]
 
         return self.invoke(prompt)
 
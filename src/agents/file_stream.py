@@ -0,0 +1,149 @@
+"""Incremental file-block extraction for streamed LLM responses.
+
+BaseAgent.extract_files() needs the whole response. FileBlockParser consumes
+the response chunk by chunk and emits each ```file:path block as soon as its
+closing fence arrives, so callers can validate and write the first file while
+the model is still generating the rest.
+"""
+
+import re
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator, Optional
+
+# Same shape as the fallback pattern in BaseAgent.extract_files
+_PATH_HEADER = re.compile(r'[a-zA-Z0-9_\-./]+\.[a-zA-Z0-9]+')
+
+
+class FileBlockParser:
+    """Line-oriented parser for ```file:path fences.
+
+    Recognizes the same headers as BaseAgent.extract_files():
+      ```file:path/to/file.ext   (primary)
+      ```path/to/file.ext        (fallback; path must contain a /, and only
+                                  used until the first ```file: block is seen)
+
+    Any other fenced block (```yaml, ```bash, ...) is skipped as a whole.
+    """
+
+    def __init__(self):
+        self._chunks: list[str] = []
+        self._partial = ""
+        self._path: Optional[str] = None
+        self._lines: list[str] = []
+        self._in_other_fence = False
+        self._seen_primary = False
+
+    @property
+    def response(self) -> str:
+        """Full text fed so far."""
+        return "".join(self._chunks)
+
+    def feed(self, chunk: str) -> list[tuple[str, str]]:
+        """Consume a chunk; return any (path, content) blocks it completed."""
+        self._chunks.append(chunk)
+        self._partial += chunk
+        if "\n" not in chunk:
+            return []
+
+        *lines, self._partial = self._partial.split("\n")
+        files = []
+        for line in lines:
+            done = self._feed_line(line)
+            if done:
+                files.append(done)
+        return files
+
+    def close(self) -> list[tuple[str, str]]:
+        """Flush the trailing partial line. Unterminated blocks are dropped."""
+        line, self._partial = self._partial, ""
+        done = self._feed_line(line) if line else None
+        return [done] if done else []
+
+    def _feed_line(self, line: str) -> Optional[tuple[str, str]]:
+        stripped = line.strip()
+        is_fence = stripped.startswith("```")
+
+        if self._path is not None:
+            if is_fence and not stripped.strip("`"):
+                content = "\n".join(self._lines).rstrip() + "\n"
+                path, self._path, self._lines = self._path, None, []
+                return path, content
+            self._lines.append(line)
+            return None
+
+        if self._in_other_fence:
+            if is_fence and not stripped.strip("`"):
+                self._in_other_fence = False
+            return None
+
+        if not is_fence:
+            return None
+
+        header = stripped[3:].strip()
+        if header.startswith("file:"):
+            self._seen_primary = True
+            self._path = header[len("file:"):].strip().lstrip("/")
+        elif (not self._seen_primary and "/" in header
+              and _PATH_HEADER.fullmatch(header)):
+            self._path = header.lstrip("/")
+        else:
+            # ```yaml, ```bash or a bare ``` -- not a file block
+            self._in_other_fence = True
+        return None
+
+
+class FileStream:
+    """Iterate (path, content) pairs from a stream of response chunks.
+
+    After iteration, `response` holds the full text and `files` every block
+    that was emitted. If the incremental parser found nothing, the complete
+    response is handed to `fallback` (normally BaseAgent.extract_files) so
+    the other formats it understands still work.
+    """
+
+    def __init__(self, chunks: Iterable[str],
+                 fallback: Optional[Callable[[str], list[tuple[str, str]]]] = None):
+        self._chunks = chunks
+        self._fallback = fallback
+        self._parser = FileBlockParser()
+        self.files: list[tuple[str, str]] = []
+
+    @property
+    def response(self) -> str:
+        return self._parser.response
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        for chunk in self._chunks:
+            for item in self._parser.feed(chunk):
+                self.files.append(item)
+                yield item
+        for item in self._parser.close():
+            self.files.append(item)
+            yield item
+
+        if not self.files and self._fallback is not None:
+            for item in self._fallback(self.response):
+                self.files.append(item)
+                yield item
+
+
+# Streaming A2A tasks (a2a/streaming.py) install a sink for the thread that
+# runs the agent; BaseAgent.invoke() streams into it instead of blocking
+_active = threading.local()
+
+
+def active_sink():
+    """The sink of the streaming task running on this thread, if any."""
+    return getattr(_active, "sink", None)
+
+
+@contextmanager
+def stream_to(sink):
+    """Route this thread's BaseAgent.invoke() calls through `sink.consume(chunks)`."""
+    previous = active_sink()
+    _active.sink = sink
+    try:
+        yield sink
+    finally:
+        _active.sink = previous
@@ -3,6 +3,7 @@
 from pathlib import Path
 
 from .base import BaseAgent
+from ..providers.prompt import project_prefix, segment
 from ..providers.base import BaseProvider
 
 # ── ADK agent factory ─────────────────────────────────────────────────────────
@@ -98,22 +99,13 @@ class FrontendAgent(BaseAgent):
         backend_context = ""
         if backend_files:
             backend_context = (
-                "\n## Backend Files (match these API contracts)\n"
+                "## Backend Files (match these API contracts)\n"
                 + "\n".join(f"  - {f}" for f in backend_files)
+                + "\n\n"
             )
 
-        prompt = f"""\
-## Project Specification
-{spec}
-
-## Build Rules
-{rules}
-
-## Architecture Decisions
-{decisions}
-{backend_context}
-
-## Existing Project Context
+        prompt = [project_prefix(spec, rules, decisions), segment(f"""\
+{backend_context}## Existing Project Context
 {project_context or "(No existing files)"}
 
 Generate the COMPLETE frontend implementation:
@@ -131,7 +123,7 @@ Use this format for each file:
 <complete file contents>
 ```
 
-Write COMPLETE files. Match the backend API contracts exactly."""
+Write COMPLETE files. Match the backend API contracts exactly.""")]
 
         return self.invoke(prompt)
 
@@ -5,6 +5,7 @@ import yaml
 from pathlib import Path
 
 from .base import BaseAgent
+from ..providers.prompt import project_prefix, segment
 
 # ── ADK agent factory ─────────────────────────────────────────────────────────
 
@@ -49,11 +50,15 @@ tasks:
     description: "Create the project skeleton with package manifests and config files"
     agent: coder
     files: [requirements.txt, main.py]
+    depends_on: []
   - id: task_02
     name: "..."
     description: "..."
     agent: coder
     files: [...]
+    depends_on: [task_01]
+
+In depends_on, list only the ids of earlier tasks whose files a task builds on.
 
 Output ONLY the YAML, nothing else.
 """
@@ -99,19 +104,12 @@ class PlannerAgent(BaseAgent):
     def analyze_and_plan(self, spec: str, rules: str, existing_files: str = "") -> dict:
         """Analyze spec + rules, return a structured plan as a dict."""
         prompt = self._build_plan_prompt(spec, rules, existing_files)
-        response = self.invoke(prompt)
-        return self._parse_plan(response)
+        return self._plan(prompt)
 
     def plan_incremental(self, spec: str, rules: str, feature_description: str,
                          existing_files: str) -> dict:
         """Plan tasks to add a feature to an existing project."""
-        prompt = f"""\
-## Project Specification
-{spec}
-
-## Build Rules
-{rules}
-
+        prompt = [project_prefix(spec, rules), segment(f"""\
 ## Existing Project Files
 {existing_files}
 
@@ -120,6 +118,8 @@ class PlannerAgent(BaseAgent):
 
 Analyze the existing project and plan the tasks needed to add this feature.
 Consider what files need to be created vs modified.
+In depends_on, list only the ids of earlier tasks this task builds on;
+independent tasks run in parallel.
 
 Output the plan as YAML with this exact structure:
 
@@ -135,50 +135,58 @@ tasks:
     description: "Detailed description of what to do"
     agent: coder
     files: [files this task touches]
+    depends_on: []
   - id: task_02
     name: "..."
     description: "..."
     agent: coder
     files: [...]
+    depends_on: [task_01]
+
+Output ONLY the YAML, nothing else.""")]
 
-Output ONLY the YAML, nothing else."""
+        return self._plan(prompt)
 
+    def _plan(self, prompt: list) -> dict:
+        """Invoke and parse; an unusable plan is not kept in the response cache."""
         response = self.invoke(prompt)
-        return self._parse_plan(response)
+        try:
+            return self._parse_plan(response)
+        except (ValueError, yaml.YAMLError):
+            self.discard_response(prompt)
+            raise
 
-    def _build_plan_prompt(self, spec: str, rules: str, existing_files: str) -> str:
+    def _build_plan_prompt(self, spec: str, rules: str, existing_files: str) -> list:
         from ..knowledge import load as load_knowledge
 
         context_section = ""
         if existing_files and existing_files != "(No project files yet)":
-            context_section = f"""
+            context_section = f"""\
 ## Existing Project Files
 {existing_files}
 
-Note: This is an existing project. Plan tasks that build on what exists."""
+Note: This is an existing project. Plan tasks that build on what exists.
+
+"""
 
         knowledge = load_knowledge()
         knowledge_section = ""
         if knowledge:
-            knowledge_section = f"""
+            knowledge_section = f"""\
 ## Past Learnings (apply these to this build)
 {knowledge}
-"""
 
-        return f"""\
-## Project Specification
-{spec}
-
-## Build Rules
-{rules}
-{knowledge_section}{context_section}
+"""
 
-Analyze the specification and rules. Then output a structured build plan as YAML.
+        return [project_prefix(spec, rules), segment(f"""\
+{knowledge_section}{context_section}Analyze the specification and rules. Then output a structured build plan as YAML.
 
 Requirements for the plan:
 - Break the build into 3-8 focused tasks
 - Each task should produce 1-4 files
 - Order tasks so dependencies come first (data models before routes, etc.)
+- In depends_on, list ONLY the ids of earlier tasks whose files this task
+  imports or builds on. Independent tasks run in parallel, so keep it minimal.
 - First task should always be project setup (config files, dependencies)
 - Last task should be integration / wiring everything together
 - Keep tasks small enough that the AI can write complete files in one pass
@@ -200,13 +208,15 @@ tasks:
     description: "Create the project skeleton with package manifests and config files"
     agent: coder
     files: [requirements.txt, main.py]
+    depends_on: []
   - id: task_02
     name: "..."
     description: "..."
     agent: coder
     files: [...]
+    depends_on: [task_01]
 
-Output ONLY the YAML, nothing else."""
+Output ONLY the YAML, nothing else.""")]
 
     def handle_a2a_task(self, task):
         """A2A entry point: produces a structured plan as a TaskResult."""
@@ -4,6 +4,7 @@ import re
 import yaml
 
 from .base import BaseAgent
+from ..providers.prompt import project_prefix, segment
 
 # ── ADK agent factory ─────────────────────────────────────────────────────────
 
@@ -87,13 +88,7 @@ class ReviewerAgent(BaseAgent):
         for fp, content in files_written.items():
             files_str += f"\n### {fp}\n```\n{content}\n```\n"
 
-        prompt = f"""\
-## Project Spec
-{spec}
-
-## Build Rules
-{rules}
-
+        prompt = [project_prefix(spec, rules), segment(f"""\
 ## Generated Files
 {files_str}
 
@@ -120,7 +115,7 @@ If no issues found, output:
 passed: true
 issues: []
 
-Output ONLY the YAML."""
+Output ONLY the YAML.""")]
 
         response = self.invoke(prompt)
         return self._parse_review(response)
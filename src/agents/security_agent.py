@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Optional
 
 from .base import BaseAgent
+from ..providers.prompt import project_prefix, segment
 from ..providers.base import BaseProvider
 
 # ── ADK agent factory ─────────────────────────────────────────────────────────
@@ -105,10 +106,7 @@ class SecurityAgent(BaseAgent):
         for fp, content in files.items():
             files_str += f"\n### {fp}\n```\n{content}\n```\n"
 
-        prompt = f"""\
-## Project Context
-{spec or "(No spec provided)"}
-
+        prompt = [project_prefix(spec or "(No spec provided)"), segment(f"""\
 ## Files to Audit
 {files_str}
 
@@ -134,7 +132,7 @@ If no issues found:
 passed: true
 issues: []
 
-Output the YAML first, then any fixed files."""
+Output the YAML first, then any fixed files.""")]
 
         response = self.invoke(prompt)
         return self._parse_audit(response)
@@ -1,6 +1,7 @@
 """Forge CLI - Project scaffolding for LLM-assisted development."""
 
 import os
+import json
 import sys
 import shutil
 import argparse
@@ -401,13 +402,15 @@ def cmd_build(args):
         print("Run 'forge new <name>' or 'forge init' first.")
         sys.exit(1)
 
-    from .config import ensure_config, get_provider_config
+    from .config import ensure_config, get_agent_provider_configs, get_provider_config
     from .orchestrator import BuildOrchestrator
+    from .providers.cache import response_cache_from_config
 
     config = ensure_config()
 
     try:
         provider_config = get_provider_config(config, getattr(args, 'provider', None))
+        agent_configs = get_agent_provider_configs(config, provider_config)
     except ValueError as e:
         print(f"Error: {e}")
         sys.exit(1)
@@ -415,21 +418,35 @@ def cmd_build(args):
     feature = getattr(args, 'feature', None)
     no_review = getattr(args, 'no_review', False)
     verbose = getattr(args, 'verbose', False)
-    use_adk = getattr(args, 'adk', False)
+    adk_static = getattr(args, 'adk_static', False)
+    use_adk = getattr(args, 'adk', False) or adk_static
+    cache = None if getattr(args, 'no_cache', False) else response_cache_from_config(config)
 
-    if use_adk:
+    if adk_static:
+        print(f"Building with {provider_config} [ADK static pipeline]...")
+    elif use_adk:
         print(f"Building with {provider_config} [ADK multi-agent mode]...")
     else:
         print(f"Building with {provider_config}...")
     print("")
 
-    orchestrator = BuildOrchestrator(
-        provider_config=provider_config,
-        forge_path=forge_path,
-        review=not no_review,
-        verbose=verbose,
-        use_adk=use_adk,
-    )
+    try:
+        orchestrator = BuildOrchestrator(
+            provider_config=provider_config,
+            forge_path=forge_path,
+            review=not no_review,
+            verbose=verbose,
+            use_adk=use_adk,
+            adk_static=adk_static,
+            cache=cache,
+            stream=not getattr(args, 'no_stream', False),
+            jobs=getattr(args, 'jobs', None) or (config.get("build") or {}).get("jobs", 4),
+            full=getattr(args, 'full', False),
+            agent_configs=agent_configs,
+        )
+    except ValueError as e:  # e.g. a corrupted build journal
+        print(f"Error: {e}")
+        sys.exit(1)
 
     try:
         orchestrator.run(feature=feature)
@@ -466,6 +483,62 @@ def cmd_config(args):
         print(CONFIG_FILE)
 
 
+def cmd_cache(args):
+    """Manage the LLM response cache."""
+    from .config import load_config
+    from .providers.cache import response_cache_from_config
+
+    cache = response_cache_from_config(load_config())
+    if cache is None:
+        print("Response cache is disabled in ~/.forge/config.yaml")
+        return
+
+    cache_cmd = getattr(args, 'cache_cmd', 'path')
+    if cache_cmd == "clear":
+        cache.clear()
+        print(f"Cleared {cache.cache_dir}")
+    elif cache_cmd == "path":
+        print(cache.cache_dir)
+
+
+def cmd_audit(args):
+    """Query the firewall audit log (.forge/firewall_audit.log + archives)."""
+    from collections import deque
+    from .security.audit import iter_audit, parse_time
+
+    log_path = Path(FORGE_DIR) / "firewall_audit.log"
+    try:
+        since = parse_time(args.since) if getattr(args, 'since', None) else None
+        until = parse_time(args.until) if getattr(args, 'until', None) else None
+    except ValueError as e:
+        print(f"Error: bad time ({e}). Use e.g. 30m, 2h, 7d or 2026-01-31T12:00")
+        sys.exit(1)
+
+    entries = iter_audit(
+        log_path,
+        action=getattr(args, 'action', None),
+        target=getattr(args, 'target', None),
+        since=since,
+        until=until,
+    )
+    limit = getattr(args, 'limit', None)
+    if limit:
+        entries = deque(entries, maxlen=limit)
+
+    count = 0
+    for entry in entries:
+        count += 1
+        if getattr(args, 'json', False):
+            print(json.dumps(entry))
+            continue
+        detail = f"  ({entry['detail']})" if entry.get("detail") else ""
+        print(f"{entry.get('timestamp', '')[:19]}  {entry.get('action', ''):9} "
+              f"{entry.get('target', '')}{detail}")
+
+    if not count and not getattr(args, 'json', False):
+        print("No matching audit entries.")
+
+
 def cmd_status(args):
     """Show current build status."""
     forge_path = Path(FORGE_DIR)
@@ -475,7 +548,11 @@ def cmd_status(args):
 
     from .state import load_build_state
 
-    state = load_build_state(forge_path)
+    try:
+        state = load_build_state(forge_path)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
 
     if state.status == "not_started":
         print("No build started yet. Run 'forge build'.")
@@ -505,6 +582,70 @@ def cmd_status(args):
         for f in state.files_written:
             print(f"  {f}")
 
+    if state.usage:
+        from .config import get_prices, load_config
+        try:
+            prices = get_prices(load_config())
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print("")
+        _print_usage(state, prices)
+
+
+def _print_usage(state, prices: dict):
+    """Token, latency and estimated-cost breakdown per agent and per task."""
+    from .providers.usage import UsageStats, estimate_cost, price_for
+
+    def _cost(model, stats):
+        return estimate_cost(stats, price_for(model, prices))
+
+    def _money(cost):
+        return f"${cost:.4f}" if cost is not None else "-"
+
+    header = (f"  {'Agent':<13}{'Model':<30}{'Calls':>6}{'Retry':>6}{'Input':>10}"
+              f"{'Cached':>10}{'Output':>9}{'Latency':>9}{'TTFT':>7}{'Cost':>10}")
+    print("Usage:")
+    print(header)
+    total, total_cost, unpriced = UsageStats(), 0.0, set()
+    for agent, models in state.usage.items():
+        for model, data in models.items():
+            stats = UsageStats.from_dict(data)
+            cost = _cost(model, stats)
+            total = total.merge(stats)
+            if cost is None:
+                unpriced.add(model)
+            else:
+                total_cost += cost
+            ttft = f"{stats.mean_ttft:.1f}s" if stats.mean_ttft is not None else "-"
+            print(f"  {agent:<13}{model[:29]:<30}{stats.calls:>6}{stats.retries:>6}"
+                  f"{stats.input_tokens:>10,}{stats.cache_read_tokens:>10,}"
+                  f"{stats.output_tokens:>9,}{stats.mean_latency:>8.1f}s{ttft:>7}"
+                  f"{_money(cost):>10}")
+    print(f"  {'Total':<43}{total.calls:>6}{total.retries:>6}{total.input_tokens:>10,}"
+          f"{total.cache_read_tokens:>10,}{total.output_tokens:>9,}"
+          f"{total.mean_latency:>8.1f}s{'':>7}{_money(total_cost):>10}")
+    if total.failures:
+        print(f"  {total.failures} call(s) failed after retries")
+    if unpriced:
+        print(f"  No price for: {', '.join(sorted(unpriced))} (add them under pricing: in "
+              "~/.forge/config.yaml)")
+    print("  Latency is the mean per call; Cached counts prompt tokens read from the cache.")
+
+    tasks = [t for t in state.tasks if t.usage]
+    if tasks:
+        print("")
+        print("Usage by task:")
+        for t in tasks:
+            stats, cost = UsageStats(), 0.0
+            for model, data in t.usage.items():
+                model_stats = UsageStats.from_dict(data)
+                stats = stats.merge(model_stats)
+                cost += _cost(model, model_stats) or 0.0
+            print(f"  {t.name[:40]:<42}{stats.calls:>3} call(s) "
+                  f"{stats.usage.prompt_tokens:>9,} in "
+                  f"{stats.output_tokens:>8,} out {stats.latency_s:>7.1f}s {_money(cost):>10}")
+
 
 def cmd_publish(args):
     """Publish project to GitHub."""
@@ -585,12 +726,22 @@ def main():
 
     # forge build
     build_parser = subparsers.add_parser("build", help="Build project using AI agents")
-    build_parser.add_argument("--provider", "-p", help="AI provider (anthropic, openai, together, ollama)")
+    build_parser.add_argument("--provider", "-p", help="AI provider (anthropic, openai, together, ollama, router)")
     build_parser.add_argument("--feature", "-f", help="Add a specific feature (incremental build)")
     build_parser.add_argument("--no-review", action="store_true", help="Skip review phase")
     build_parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     build_parser.add_argument("--adk", action="store_true",
                               help="Use ADK multi-agent pipeline (Backend, Frontend, Security, CI, Deploy)")
+    build_parser.add_argument("--adk-static", action="store_true",
+                              help="ADK agents as a fixed dependency graph (no orchestrator LLM)")
+    build_parser.add_argument("--no-cache", action="store_true",
+                              help="Always call the LLM; ignore cached responses")
+    build_parser.add_argument("--no-stream", action="store_true",
+                              help="Wait for each full response before writing files")
+    build_parser.add_argument("--jobs", "-j", type=int,
+                              help="Max tasks to run in parallel (default: 4, or build.jobs in config)")
+    build_parser.add_argument("--full", action="store_true",
+                              help="Replan and rebuild everything instead of only changed tasks")
     build_parser.set_defaults(func=cmd_build)
 
     # forge config
@@ -600,6 +751,24 @@ def main():
                                help="Config subcommand")
     config_parser.set_defaults(func=cmd_config)
 
+    # forge cache
+    cache_parser = subparsers.add_parser("cache", help="Manage the LLM response cache")
+    cache_parser.add_argument("cache_cmd", nargs="?", default="path",
+                              choices=["path", "clear"],
+                              help="Cache subcommand")
+    cache_parser.set_defaults(func=cmd_cache)
+
+    # forge audit
+    audit_parser = subparsers.add_parser("audit", help="Query the firewall audit log")
+    audit_parser.add_argument("--action", "-a",
+                              help="PERMITTED, DENIED, or a violation type (e.g. BLOCKED_PATH)")
+    audit_parser.add_argument("--target", "-t", help="File path glob or substring")
+    audit_parser.add_argument("--since", help="Start time: 30m, 2h, 7d or ISO date/time")
+    audit_parser.add_argument("--until", help="End time: same formats as --since")
+    audit_parser.add_argument("--limit", "-n", type=int, help="Show only the last N matches")
+    audit_parser.add_argument("--json", action="store_true", help="Print raw JSON lines")
+    audit_parser.set_defaults(func=cmd_audit)
+
     # forge status
     status_parser = subparsers.add_parser("status", help="Show build status")
     status_parser.set_defaults(func=cmd_status)
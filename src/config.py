@@ -9,6 +9,9 @@ from typing import Optional
 CONFIG_DIR = Path.home() / ".forge"
 CONFIG_FILE = CONFIG_DIR / "config.yaml"
 
+# Agents whose provider/model can be set in the `agents:` config section
+AGENT_NAMES = ("planner", "coder", "backend", "frontend", "security", "ci", "deploy", "reviewer")
+
 DEFAULT_CONFIG = """\
 # Forge Configuration
 # The first provider with valid credentials will be used.
@@ -18,6 +21,10 @@ providers:
   - name: anthropic
     api_key: ${ANTHROPIC_API_KEY}
     model: claude-sonnet-4-20250514
+    # Optional account limits, shared by all parallel agents:
+    # rpm: 50                # requests per minute
+    # tpm: 40000             # tokens per minute
+    # max_concurrency: 8     # in-flight ceiling (halved on 429/overload)
 
   - name: openai
     api_key: ${OPENAI_API_KEY}
@@ -30,6 +37,34 @@ providers:
   - name: ollama
     base_url: http://localhost:11434
     model: llama3.1
+
+# Route across several providers with failover (see providers/router.py).
+routing:
+  enabled: false
+  # providers: [anthropic, openai]   # default: every provider with an API key
+  policy: priority                   # priority | least-latency | weighted
+  # weights: {anthropic: 3, openai: 1}
+  hedge: false                       # re-send slow calls to the next provider
+  hedge_after: p95                   # or a number of seconds
+
+# Per-agent provider/model overrides; unset fields use the build's provider.
+# Agents: planner, coder, backend, frontend, security, ci, deploy, reviewer
+# agents:
+#   planner:  {model: claude-3-5-haiku-latest, max_tokens: 4096}
+#   reviewer: {model: claude-3-5-haiku-latest}
+#   ci:       {provider: openai, model: gpt-4o-mini}
+
+# Prices in $ per million tokens for the cost estimate in 'forge status',
+# matched by model-name prefix. Adds to / overrides the built-in table.
+# pricing:
+#   claude-sonnet-4: {input: 3.0, output: 15.0, cache_read: 0.3, cache_write: 3.75}
+#   llama3.1: {input: 0, output: 0}
+
+# Identical LLM requests are answered from ~/.forge/cache.
+cache:
+  enabled: true
+  max_disk_mb: 200
+  ttl_days: 14
 """
 
 
@@ -60,7 +95,11 @@ def ensure_config() -> dict:
 
 
 def get_provider_config(config: dict, provider_name: Optional[str] = None):
-    """Resolve which provider to use. Returns a ProviderConfig."""
+    """Resolve which provider to use. Returns a ProviderConfig.
+
+    With `routing.enabled` (or `--provider router`) this is a RouterConfig
+    over several providers.
+    """
     from .providers.base import ProviderConfig
 
     providers = config.get("providers", [])
@@ -70,6 +109,10 @@ def get_provider_config(config: dict, provider_name: Optional[str] = None):
             f"Run 'forge config init' or edit {CONFIG_FILE}"
         )
 
+    routing = config.get("routing") or {}
+    if (provider_name or "").lower() == "router" or (routing.get("enabled") and not provider_name):
+        return _router_config(providers, routing)
+
     if provider_name:
         for p in providers:
             if p["name"].lower() == provider_name.lower():
@@ -89,6 +132,99 @@ def get_provider_config(config: dict, provider_name: Optional[str] = None):
     )
 
 
+def get_agent_provider_configs(config: dict, default) -> dict:
+    """Per-agent ProviderConfigs from the `agents:` section of the config.
+
+    Each entry may set `provider` (a name from `providers:`, or `router`),
+    `model` and `max_tokens`; anything unset comes from `default`, the
+    build's provider. Only agents with an entry are returned.
+    """
+    from dataclasses import replace
+    from .providers.router import RouterConfig
+
+    overrides = config.get("agents") or {}
+    unknown = [name for name in overrides if name not in AGENT_NAMES]
+    if unknown:
+        raise ValueError(
+            f"Unknown agent(s) in config: {', '.join(unknown)}. "
+            f"Valid: {', '.join(AGENT_NAMES)}"
+        )
+
+    result = {}
+    for name, entry in overrides.items():
+        entry = entry or {}
+        base = get_provider_config(config, entry["provider"]) if entry.get("provider") else default
+        changes = {k: entry[k] for k in ("model", "max_tokens") if entry.get(k)}
+        if isinstance(base, RouterConfig):
+            if "model" in changes:
+                raise ValueError(
+                    f"Agent '{name}' sets a model while routing is enabled; "
+                    "also name its provider."
+                )
+            if "max_tokens" in changes:
+                changes["routes"] = [replace(r, max_tokens=changes["max_tokens"]) for r in base.routes]
+        result[name] = replace(base, **changes) if changes else base
+    return result
+
+
+def get_prices(config: dict) -> dict:
+    """Model price table: the built-in defaults updated with `pricing:`."""
+    from .providers.usage import DEFAULT_PRICES
+
+    prices = dict(DEFAULT_PRICES)
+    for model, entry in (config.get("pricing") or {}).items():
+        if not isinstance(entry, dict):
+            raise ValueError(f"pricing.{model} must be a mapping like {{input: 3.0, output: 15.0}}")
+        prices[str(model)] = entry
+    return prices
+
+
+def _router_config(providers: list, routing: dict):
+    """RouterConfig over the providers named in `routing.providers`.
+
+    Without that list, every provider with an API key is routed to.
+    Providers with only a base_url (e.g. a local ollama) are always
+    "configured", so they join the route only when listed explicitly.
+    """
+    from .providers.base import ProviderConfig
+    from .providers.router import POLICIES, RouterConfig
+
+    def _has_key(p):
+        return bool((p.get("api_key") or "").strip())
+
+    def _usable(p):
+        return _has_key(p) or bool(p.get("base_url"))
+
+    names = routing.get("providers")
+    if names:
+        by_name = {p["name"].lower(): p for p in providers}
+        missing = [n for n in names if n.lower() not in by_name]
+        if missing:
+            raise ValueError(f"Routing provider(s) not found in config: {', '.join(missing)}")
+        selected = [p for p in (by_name[n.lower()] for n in names) if _usable(p)]
+    else:
+        selected = [p for p in providers if _has_key(p)]
+    if not selected:
+        raise ValueError("No routing provider has valid credentials.")
+
+    policy = routing.get("policy", "priority")
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown routing policy '{policy}'. Use one of: {', '.join(POLICIES)}")
+    hedge_after = routing.get("hedge_after", "p95")
+
+    routes = [ProviderConfig(**{k: v for k, v in p.items() if v}) for p in selected]
+    return RouterConfig(
+        name="router",
+        model=routes[0].model,
+        max_tokens=routes[0].max_tokens,
+        routes=routes,
+        policy=policy,
+        weights=routing.get("weights") or {},
+        hedge=bool(routing.get("hedge")),
+        hedge_after=None if hedge_after in (None, "p95") else float(hedge_after),
+    )
+
+
 def _expand_env_vars(obj):
     """Recursively expand ${VAR} in config values."""
     if isinstance(obj, str):
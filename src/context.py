@@ -1,8 +1,14 @@
 """Context management -- assembles project context within token budgets."""
 
+import json
+import os
+import tempfile
+import threading
 from pathlib import Path
 from typing import Optional
 
+from .project_index import ProjectIndex, outline_file
+
 CHARS_PER_TOKEN = 4
 
 SKIP_DIRS = {
@@ -11,6 +17,9 @@ SKIP_DIRS = {
     "env", ".egg-info",
 }
 
+# Directory name suffixes that are skipped like SKIP_DIRS (foo.egg-info/)
+SKIP_DIR_SUFFIXES = (".egg-info",)
+
 SKIP_EXTENSIONS = {
     ".pyc", ".pyo", ".so", ".dylib", ".dll",
     ".png", ".jpg", ".jpeg", ".gif", ".ico", ".svg",
@@ -34,43 +43,187 @@ SENSITIVE_NAMES = {
     "apikey", "api_key", "password", "passwd", "private",
 }
 
+# Persistent per-project index of file metadata and text, kept in .forge/
+INDEX_FILE = "file-index.json"
+INDEX_VERSION = 2
+# Larger text files are indexed by signature only and re-read when needed
+MAX_INDEXED_CHARS = 256 * 1024
+
+# A NUL byte in the first SNIFF_BYTES marks a file as binary
+SNIFF_BYTES = 8192
+
+# Share of an over-full context budget spent on full file text; the rest
+# goes to outlines of the remaining files
+FULL_TEXT_SHARE = 0.6
+
 
 def gather_project_files(project_root: Path) -> list[tuple[Path, str]]:
-    """Gather all readable project files as (relative_path, content) pairs."""
-    files = []
-    for path in sorted(project_root.rglob("*")):
-        if not path.is_file():
-            continue
-        rel = path.relative_to(project_root)
+    """Gather all readable project files as (relative_path, content) pairs.
 
-        if any(part in SKIP_DIRS or part.startswith(".") for part in rel.parts):
-            continue
-        if path.suffix.lower() in SKIP_EXTENSIONS:
-            continue
-        name_lower = path.name.lower()
-        if name_lower in SENSITIVE_NAMES:
-            continue
-        if any(marker in name_lower for marker in SENSITIVE_NAMES):
-            continue
+    Served from the project's FileIndex, so unchanged files are not re-read.
+    """
+    return get_file_index(project_root).files()
+
+
+def _skip_dir(name: str) -> bool:
+    return (
+        name in SKIP_DIRS
+        or name.startswith(".")
+        or name.endswith(SKIP_DIR_SUFFIXES)
+    )
+
+
+def _skip_file(name: str) -> bool:
+    if name.startswith("."):
+        return True
+    if Path(name).suffix.lower() in SKIP_EXTENSIONS:
+        return True
+    name_lower = name.lower()
+    if name_lower in SENSITIVE_NAMES:
+        return True
+    return any(marker in name_lower for marker in SENSITIVE_NAMES)
+
+
+def walk_project(project_root: Path) -> list[Path]:
+    """Relative paths of candidate project files, sorted.
+
+    Skipped directories (node_modules, .venv, .git, ...) are pruned before
+    descending, so their size never affects the walk.
+    """
+    found = []
+    for dirpath, dirnames, filenames in os.walk(project_root):
+        dirnames[:] = [d for d in dirnames if not _skip_dir(d)]
+        rel_dir = Path(dirpath).relative_to(project_root)
+        for name in filenames:
+            if not _skip_file(name):
+                found.append(rel_dir / name)
+    return sorted(found)
+
+
+class FileIndex:
+    """(path, mtime, size) → metadata/content index of a project's files.
+
+    Each entry holds the file's signature, whether it is binary and, for
+    text files up to MAX_INDEXED_CHARS, its content. The index is persisted
+    to .forge/file-index.json, so a new `forge build` process loads the
+    project from one file and re-reads only files whose mtime or size
+    changed; binaries are skipped without being read again.
+    """
 
+    def __init__(self, project_root: Path):
+        self.project_root = project_root
+        self.index_path = project_root / ".forge" / INDEX_FILE
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] = self._load()
+
+    def files(self) -> list[tuple[Path, str]]:
+        """(relative_path, content) for every text file in the project."""
+        with self._lock:
+            result = []
+            seen = set()
+            dirty = False
+            for rel in walk_project(self.project_root):
+                key = rel.as_posix()
+                try:
+                    st = (self.project_root / rel).stat()
+                except OSError:
+                    continue
+                sig = [st.st_mtime_ns, st.st_size]
+                seen.add(key)
+
+                entry = self._entries.get(key)
+                if entry and entry.get("sig") == sig:
+                    if entry.get("binary"):
+                        continue
+                    if "text" in entry:
+                        result.append((rel, entry["text"]))
+                        continue
+
+                content = _read_text(self.project_root / rel)
+                fresh = {"sig": sig, "binary": content is None}
+                if content is not None and len(content) <= MAX_INDEXED_CHARS:
+                    fresh["text"] = content
+                if entry != fresh:
+                    self._entries[key] = fresh
+                    dirty = True
+                if content is not None:
+                    result.append((rel, content))
+
+            for key in set(self._entries) - seen:
+                del self._entries[key]
+                dirty = True
+
+            if dirty:
+                self._save()
+            return result
+
+    def _load(self) -> dict[str, dict]:
         try:
-            content = path.read_text(errors="replace")
-            files.append((rel, content))
-        except Exception:
-            continue
+            data = json.loads(self.index_path.read_text())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return {}
+        entries = data.get("files")
+        return entries if isinstance(entries, dict) else {}
+
+    def _save(self):
+        """Atomically rewrite the index (no-op if there is no .forge/)."""
+        if not self.index_path.parent.is_dir():
+            return
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.index_path.parent, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"version": INDEX_VERSION, "files": self._entries}, f)
+            os.replace(tmp, self.index_path)
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+
 
-    return files
+def _read_text(path: Path) -> Optional[str]:
+    """File content as text, or None if it is binary or unreadable."""
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    if b"\0" in data[:SNIFF_BYTES]:
+        return None
+    return data.decode("utf-8", errors="replace")
+
+
+_indexes: dict[Path, FileIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_file_index(project_root: Path) -> FileIndex:
+    """The shared FileIndex for a project root (one per process)."""
+    root = project_root.resolve()
+    with _indexes_lock:
+        index = _indexes.get(root)
+        if index is None:
+            index = _indexes[root] = FileIndex(root)
+        return index
 
 
 def build_context_string(
     project_root: Path,
     max_tokens: int = 4000,
     include_files: Optional[list[str]] = None,
+    focus_files: Optional[list[str]] = None,
+    query: str = "",
 ) -> str:
     """Build a context string of project files within a token budget.
 
-    Prioritizes config files, then includes source files by size (small first).
-    Truncates large files and lists remaining files if over budget.
+    With `focus_files` (a task's declared files) or a `query` (its name and
+    description), files are ranked by relevance via ProjectIndex: declared
+    files and their import neighbours first. Otherwise config files come
+    first, then source files by size (small first).
+
+    Over budget, the top files get full text and the rest structural
+    outlines; files without an outline are truncated or listed as skipped.
     """
     all_files = gather_project_files(project_root)
 
@@ -81,20 +234,48 @@ def build_context_string(
     parts = []
     used_chars = 0
 
-    def priority(item):
-        path, content = item
-        is_config = path.name in CONFIG_NAMES
-        return (0 if is_config else 1, len(content))
+    if focus_files or query:
+        order = {
+            path: rank for rank, path in
+            enumerate(ProjectIndex(all_files).rank(focus_files or [], query))
+        }
+        all_files.sort(key=lambda item: order[item[0].as_posix()])
+    else:
+        def priority(item):
+            path, content = item
+            is_config = path.name in CONFIG_NAMES
+            return (0 if is_config else 1, len(content))
+
+        all_files.sort(key=priority)
 
-    all_files.sort(key=priority)
+    # When everything fits, send full text. Otherwise full text goes to the
+    # most relevant files until FULL_TEXT_SHARE of the budget is used, and
+    # the rest get outlines (signatures, routes, tables) in what remains.
+    overhead = len("### \n```\n") + len("\n```\n\n")
+    total = sum(len(str(p)) + overhead + len(c) for p, c in all_files)
+    full_limit = max_chars if total <= max_chars else int(max_chars * FULL_TEXT_SHARE)
 
     for rel_path, content in all_files:
         header = f"### {rel_path}\n```\n"
         footer = "\n```\n\n"
         overhead = len(header) + len(footer)
 
+        if used_chars + overhead + len(content) <= full_limit:
+            parts.append(f"{header}{content}{footer}")
+            used_chars += overhead + len(content)
+            continue
+
+        outline = outline_file(rel_path.as_posix(), content)
+        if outline is not None:
+            header = f"### {rel_path} (outline of {len(content)} chars)\n```\n"
+            cost = len(header) + len(footer) + len(outline)
+            if used_chars + cost <= max_chars:
+                parts.append(f"{header}{outline}{footer}")
+                used_chars += cost
+                continue
+
         available = max_chars - used_chars - overhead
-        if available <= 0:
+        if outline is not None or available <= 0:
             parts.append(f"### {rel_path} ({len(content)} chars, skipped)\n")
             continue
 
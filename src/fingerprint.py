@@ -0,0 +1,155 @@
+"""Per-task input fingerprints -- decide which tasks an edit actually affects.
+
+A task's fingerprint covers the inputs that shaped its output:
+  - the spec sections relevant to it (by keyword overlap with the task)
+  - rules.md and the planner's decisions
+  - the task's own name, description and declared files
+
+Together with hashes of the files the task read (its declared files that
+already existed when it started) and the list of files it wrote, this lets
+`forge build` re-run only the tasks whose inputs changed, plus everything
+downstream of them.
+
+Spec sections no task is relevant to are not part of any fingerprint; the
+build records their hashes instead, and a section it has not seen before
+is sent to the planner for new tasks (see unplanned_sections()).
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Optional, Sequence
+
+from .project_index import extract_keywords
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+def file_hash(path: Path) -> str:
+    """Short content hash of a file, or "" if it does not exist."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+    except OSError:
+        return ""
+
+
+def split_sections(markdown: str) -> list[str]:
+    """Split markdown into chunks at each heading line.
+
+    Trailing whitespace is dropped from each chunk, so blank lines added
+    or removed between sections do not count as edits.
+    """
+    sections, current = [], []
+    for line in markdown.splitlines():
+        if line.startswith("#") and current:
+            sections.append("\n".join(current).rstrip())
+            current = []
+        current.append(line)
+    if current:
+        sections.append("\n".join(current).rstrip())
+    return [section for section in sections if section]
+
+
+def task_keywords(task) -> set[str]:
+    """Significant words from a task's name, description and file names."""
+    return extract_keywords(" ".join([
+        task.name or "",
+        task.description or "",
+        " ".join(Path(f).stem for f in (task.files or [])),
+    ]))
+
+
+def relevant_spec(spec: str, task) -> str:
+    """The spec sections that mention any of the task's keywords.
+
+    Falls back to the whole spec when nothing matches, so an unrelated
+    edit can never silently skip a task that had no keyword signal.
+    """
+    keywords = task_keywords(task)
+    matched = [
+        section for section in split_sections(spec)
+        if keywords & extract_keywords(section)
+    ]
+    return "\n".join(matched) if matched else spec
+
+
+def unplanned_sections(spec: str, tasks: Sequence) -> list[str]:
+    """The spec sections that mention none of the tasks' keywords.
+
+    Hashing these into every task would rebuild the whole project for each
+    new requirement; instead the build plans new tasks for the ones it has
+    not seen (BuildState.unplanned_sections holds the hashes it has).
+    """
+    keywords = set()
+    for task in tasks:
+        keywords |= task_keywords(task)
+    return [
+        section for section in split_sections(spec)
+        if not keywords & extract_keywords(section)
+    ]
+
+
+def task_fingerprint(task, spec: str, rules: str, decisions: str) -> str:
+    """Fingerprint of everything that went into generating a task."""
+    parts = [
+        relevant_spec(spec, task),
+        rules,
+        decisions,
+        task.name or "",
+        task.description or "",
+        "\n".join(task.files or []),
+    ]
+    return content_hash("\x00".join(parts))
+
+
+def hash_files(project_root: Path, paths: Sequence[str]) -> dict[str, str]:
+    """{path: hash} for the given project-relative paths that exist."""
+    hashes = {}
+    for path in paths:
+        h = file_hash(project_root / path)
+        if h:
+            hashes[path] = h
+    return hashes
+
+
+def stale_tasks(
+    tasks: Sequence,
+    spec: str,
+    rules: str,
+    decisions: str,
+    project_root: Path,
+    deps: Optional[dict[int, set[int]]] = None,
+) -> set[int]:
+    """Indices of tasks that must re-run, including downstream dependents.
+
+    A task is stale when it never completed, its fingerprint changed, a file
+    it wrote is missing, or a file it read has changed. A read file that the
+    task itself or a later task overwrote is skipped -- that change is the
+    build's own output. Edits to written files are left alone, so hand
+    fixes are not regenerated away.
+    """
+    last_writer: dict[str, int] = {}
+    for i, task in enumerate(tasks):
+        for path in task.files_written:
+            last_writer[path] = i
+
+    stale = set()
+    for i, task in enumerate(tasks):
+        if task.status != "completed" or not task.fingerprint:
+            stale.add(i)
+        elif task.fingerprint != task_fingerprint(task, spec, rules, decisions):
+            stale.add(i)
+        elif any(not (project_root / p).exists() for p in task.files_written):
+            stale.add(i)
+        elif any(file_hash(project_root / p) != h
+                 for p, h in task.input_hashes.items()
+                 if last_writer.get(p, -1) < i):
+            stale.add(i)
+
+    if deps:
+        # Propagate to dependents; deps only point at earlier tasks
+        for i in range(len(tasks)):
+            if i not in stale and deps.get(i, set()) & stale:
+                stale.add(i)
+    return stale
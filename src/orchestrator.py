@@ -1,6 +1,7 @@
 """Build orchestrator -- drives the multi-agent build pipeline."""
 
 import sys
+import threading
 import uuid
 import yaml
 import re
@@ -10,13 +11,19 @@ from typing import Optional
 
 from .providers import create_provider
 from .providers.base import ProviderConfig
+from .providers.usage import merge_stats, usage_scope
 from .agents import PlannerAgent, CoderAgent, ReviewerAgent
 from .agents import BackendAgent, FrontendAgent, SecurityAgent, CIAgent, DeployAgent
 from .security.firewall import AgenticFirewall
+from .security.matcher import PatternSet
 from .state import (
     BuildState, TaskState, load_build_state, save_build_state, compute_spec_hash,
 )
 from .context import build_context_string
+from .scheduler import run_dag, task_dependencies
+from .fingerprint import (
+    content_hash, task_fingerprint, hash_files, stale_tasks, unplanned_sections,
+)
 
 
 class BuildOrchestrator:
@@ -24,10 +31,13 @@ class BuildOrchestrator:
 
     Pipeline phases:
       1. PLANNING   -- PlannerAgent analyzes spec, produces task list
-      2. BUILDING   -- CoderAgent executes each task sequentially
+      2. BUILDING   -- CoderAgent executes tasks; independent tasks (per the
+                       plan's depends_on/files) run concurrently
       3. REVIEWING  -- ReviewerAgent validates the output (optional)
 
-    State is persisted after each task, enabling resume on failure.
+    State is persisted after each task, enabling resume on failure. Each
+    completed task records a fingerprint of its inputs, so a later build
+    re-runs only the tasks an edit affects (full=True forces a replan).
     """
 
     def __init__(
@@ -37,17 +47,33 @@ class BuildOrchestrator:
         review: bool = True,
         verbose: bool = False,
         use_adk: bool = False,
+        adk_static: bool = False,
+        cache=None,
+        stream: bool = True,
+        jobs: int = 4,
+        full: bool = False,
+        agent_configs: Optional[dict] = None,
     ):
         self.forge_path = forge_path
         self.project_root = forge_path.parent
         self.review = review
         self.verbose = verbose
-        self.use_adk = use_adk
-
-        self.provider = create_provider(provider_config)
-        self.planner = PlannerAgent(self.provider, self.project_root)
-        self.coder = CoderAgent(self.provider, self.project_root)
-        self.reviewer = ReviewerAgent(self.provider, self.project_root) if review else None
+        self.use_adk = use_adk or adk_static
+        self.adk_static = adk_static
+        self.stream = stream
+        self.jobs = max(1, jobs)
+        self.full = full
+        # Guards self.state while tasks run on worker threads
+        self._state_lock = threading.RLock()
+
+        self.cache = cache
+        self.provider = create_provider(provider_config, cache=cache)
+        # Agents configured with their own provider/model (see config.py)
+        self.agent_configs = agent_configs or {}
+        self._providers = {repr(provider_config): self.provider}
+        self.planner = PlannerAgent(self._provider_for("planner"), self.project_root)
+        self.coder = CoderAgent(self._provider_for("coder"), self.project_root)
+        self.reviewer = ReviewerAgent(self._provider_for("reviewer"), self.project_root) if review else None
 
         # ADK specialized agents (initialized lazily in ADK mode)
         self._adk_agents = None
@@ -59,6 +85,26 @@ class BuildOrchestrator:
 
         self.state = load_build_state(forge_path)
         self.provider_config = provider_config
+        # Usage saved by earlier runs of this build; this run's is added on top
+        self._usage_base = _saved_usage(self.state)
+
+    def _provider_for(self, agent_name: str):
+        """The provider an agent runs on: its configured override, else the build's.
+
+        Agents with identical settings share one provider instance, and all
+        providers add to one usage total.
+        """
+        config = self.agent_configs.get(agent_name)
+        if config is None:
+            return self.provider
+        key = repr(config)
+        if key not in self._providers:
+            provider = create_provider(config, cache=self.cache)
+            provider.usage = self.provider.usage
+            self._providers[key] = provider
+            if self.verbose:
+                print(f"  {agent_name}: {config}")
+        return self._providers[key]
 
     def _init_adk_agents(self) -> dict:
         """Initialize all specialized agents as ADK LlmAgent + ADKAgentRunner instances."""
@@ -73,35 +119,41 @@ class BuildOrchestrator:
             create_reviewer_agent,
         )
 
-        llm = create_forge_llm(self.provider)
+        llms: dict = {}
+
+        def llm(agent_name: str):
+            provider = self._provider_for(agent_name)
+            if id(provider) not in llms:
+                llms[id(provider)] = create_forge_llm(provider)
+            return llms[id(provider)]
 
         self._adk_agents = {
             "planner": ADKAgentRunner(
-                create_planner_agent(llm), name="planner",
+                create_planner_agent(llm("planner")), name="planner",
                 skill_description="Analyzes spec and produces a structured build plan.",
             ),
             "backend": ADKAgentRunner(
-                create_backend_agent(llm), name="backend",
+                create_backend_agent(llm("backend")), name="backend",
                 skill_description="Generates FastAPI backend: routes, models, services.",
             ),
             "frontend": ADKAgentRunner(
-                create_frontend_agent(llm), name="frontend",
+                create_frontend_agent(llm("frontend")), name="frontend",
                 skill_description="Generates React/TypeScript frontend with API integration.",
             ),
             "security": ADKAgentRunner(
-                create_security_agent(llm), name="security",
+                create_security_agent(llm("security")), name="security",
                 skill_description="OWASP security audit and code hardening.",
             ),
             "ci": ADKAgentRunner(
-                create_ci_agent(llm), name="ci",
+                create_ci_agent(llm("ci")), name="ci",
                 skill_description="Generates GitHub Actions workflows, Dockerfile, docker-compose.",
             ),
             "deploy": ADKAgentRunner(
-                create_deploy_agent(llm), name="deploy",
+                create_deploy_agent(llm("deploy")), name="deploy",
                 skill_description="Generates deployment configs for Railway, Render, Vercel, Fly.io.",
             ),
             "reviewer": ADKAgentRunner(
-                create_reviewer_agent(llm), name="reviewer",
+                create_reviewer_agent(llm("reviewer")), name="reviewer",
                 skill_description="Reviews all generated code for correctness and consistency.",
             ),
         }
@@ -123,10 +175,9 @@ class BuildOrchestrator:
             self._run_adk(spec, rules)
             return
 
-        if self._can_resume(spec):
-            print("Resuming previous build...")
-            print("")
-            self._execute_remaining_tasks(spec, rules)
+        if self.state.tasks and not feature and not self.full:
+            if not self._phase_incremental(spec, rules):
+                return
         else:
             self._init_state(spec)
             self._phase_plan(spec, rules, feature)
@@ -139,6 +190,7 @@ class BuildOrchestrator:
         self.state.completed_at = datetime.now().isoformat()
         self._save_state()
 
+        self._report_cache()
         self._collect_feedback()
 
     def _run_adk(self, spec: str, rules: str):
@@ -150,20 +202,50 @@ class BuildOrchestrator:
         self._save_state()
 
         print("Phase 1-7: ADK Multi-Agent Pipeline")
-        print("  PlannerAgent → BackendAgent → FrontendAgent →")
-        print("  SecurityAgent → CIAgent → DeployAgent → ReviewerAgent")
+        if self.adk_static:
+            print("  PlannerAgent → {BackendAgent, CIAgent, DeployAgent} →")
+            print("  FrontendAgent → SecurityAgent → ReviewerAgent  (static DAG)")
+        else:
+            print("  PlannerAgent → BackendAgent → FrontendAgent →")
+            print("  SecurityAgent → CIAgent → DeployAgent → ReviewerAgent")
         print("")
 
+        # Generated files are checked and written as each one is streamed,
+        # while the agent is still producing the rest. The ADK tools pass on
+        # only revisions the artifact store accepted, so a path another
+        # agent already produced is not overwritten.
+        handled: dict[str, str] = {}
+        written: list[str] = []
+
+        def _on_file(agent_name: str, filepath: str, content: str):
+            with self._state_lock:
+                if handled.get(filepath) == content:
+                    return
+                handled[filepath] = content
+                if self._write_adk_file(filepath, content) and filepath not in written:
+                    written.append(filepath)
+
         agents = self._init_adk_agents()
         orchestrator = ForgeADKOrchestrator(
             provider=self.provider,
             forge_path=self.forge_path,
             agents=agents,
+            on_file=_on_file,
         )
 
-        result = orchestrator.run(spec, rules, verbose=self.verbose)
-
-        # Surface agent errors before writing anything
+        try:
+            if self.adk_static:
+                result = orchestrator.run_static(spec, rules, verbose=self.verbose)
+            else:
+                result = orchestrator.run(spec, rules, verbose=self.verbose)
+        finally:
+            orchestrator.close()
+            for agent in agents.values():
+                # ADKAgentRunner event loop threads
+                if hasattr(agent, "close"):
+                    agent.close()
+
+        # Surface agent errors before writing the rest
         errors = result.get("errors", [])
         for err in errors:
             print(f"   WARNING: {err}")
@@ -175,22 +257,13 @@ class BuildOrchestrator:
             self._save_state()
             raise RuntimeError(f"ADK build failed: {errors[0]}")
 
-        # Write all generated files through the firewall
-        all_files = result.get("files_written", [])
-        written = []
-        for filepath, content in all_files:
-            permitted, reason = self.firewall.validate_file_write(filepath, content)
-            if permitted:
-                try:
-                    self.coder.write_files([(filepath, content)])
-                    written.append(filepath)
-                    print(f"   + {filepath}")
-                except Exception as e:
-                    print(f"   ERROR writing {filepath}: {e}")
-                    self.state.errors.append(f"Write error {filepath}: {e}")
-            else:
-                print(f"   FIREWALL BLOCK: {filepath} ({reason})")
-                self.state.errors.append(f"Firewall blocked {filepath}: {reason}")
+        # Write the remaining files (security patches, anything not streamed)
+        # through the firewall
+        for filepath, content in result.get("files_written", []):
+            if handled.get(filepath) == content:
+                continue
+            if self._write_adk_file(filepath, content) and filepath not in written:
+                written.append(filepath)
 
         self.state.files_written.extend(written)
 
@@ -209,8 +282,47 @@ class BuildOrchestrator:
         self.state.completed_at = datetime.now().isoformat()
         self._save_state()
 
+        self._report_cache()
         self._collect_feedback()
 
+    def _write_adk_file(self, filepath: str, content: str) -> bool:
+        """Validate one ADK-generated file with the firewall and write it."""
+        permitted, reason = self.firewall.validate_file_write(filepath, content)
+        if not permitted:
+            print(f"   FIREWALL BLOCK: {filepath} ({reason})")
+            self.state.errors.append(f"Firewall blocked {filepath}: {reason}")
+            return False
+        try:
+            self.coder.write_files([(filepath, content)])
+        except Exception as e:
+            print(f"   ERROR writing {filepath}: {e}")
+            self.state.errors.append(f"Write error {filepath}: {e}")
+            return False
+        print(f"   + {filepath}")
+        return True
+
+    def _report_cache(self):
+        """Print what the response cache and the provider's prompt cache saved."""
+        lines = []
+        if self.cache is not None:
+            stats = self.cache.stats()
+            served = stats["hits"] + stats["shared_inflight"]
+            if served:
+                lines.append(
+                    f"Cache: {served} response(s) reused, {stats['misses']} miss(es), "
+                    f"{stats['bytes_saved'] / 1024:.1f} KB saved"
+                )
+        usage = self.provider.usage.total()
+        if usage.cache_read_tokens or usage.cache_write_tokens:
+            lines.append(
+                f"Prompt cache: {usage.cache_hit_rate:.0%} of {usage.prompt_tokens:,} input "
+                f"tokens read from cache ({usage.cache_read_tokens:,} read, "
+                f"{usage.cache_write_tokens:,} written)"
+            )
+        if lines:
+            print("\n".join(lines))
+            print("")
+
     def _collect_feedback(self):
         """Prompt user for feedback and save to knowledge base."""
         from .knowledge import collect_feedback
@@ -218,14 +330,92 @@ class BuildOrchestrator:
         tag = self.provider_config.model or ""
         collect_feedback(template=tag)
 
-    def _can_resume(self, spec: str) -> bool:
-        if self.state.status in ("not_started", "completed"):
-            return False
-        current_hash = compute_spec_hash(self.forge_path)
-        if self.state.spec_hash != current_hash:
+    def _phase_incremental(self, spec: str, rules: str) -> bool:
+        """Re-run only the tasks whose inputs changed, keeping the plan.
+
+        Covers plain resume (unfinished tasks) as well as edits to spec.md,
+        rules.md or files a task read. Spec sections no task covers that the
+        build has not seen get new tasks from the planner. Returns False if
+        nothing is stale.
+        """
+        seen = self.state.unplanned_sections
+        if seen is not None:
+            new = [section for section in unplanned_sections(spec, self.state.tasks)
+                   if content_hash(section) not in seen]
+            if new:
+                self._plan_sections(spec, rules, new)
+        tasks = self.state.tasks
+        stale = stale_tasks(
+            tasks, spec, rules, self.state.decisions, self.project_root,
+            task_dependencies(tasks),
+        )
+        spec_hash = compute_spec_hash(self.forge_path)
+        if not stale:
+            # Only whitespace or sections already planned changed
+            self.state.spec_hash = spec_hash
+            self._record_unplanned(spec)
+            self._save_state()
+            print("Nothing to rebuild: all tasks are up to date.")
+            print("Use 'forge build --full' to replan from scratch.")
+            print("")
             return False
-        pending = [t for t in self.state.tasks if t.status in ("pending", "in_progress")]
-        return len(pending) > 0
+
+        if self.state.status != "completed" and self.state.spec_hash == spec_hash:
+            print("Resuming previous build...")
+        else:
+            print(f"Incremental build: {len(stale)} of {len(tasks)} task(s) affected")
+        for i in sorted(stale):
+            if tasks[i].status == "completed":
+                print(f"     - {tasks[i].name}")
+            tasks[i].status = "pending"
+        print("")
+
+        self.state.status = "building"
+        self.state.spec_hash = spec_hash
+        self.state.completed_at = ""
+        self._record_unplanned(spec)
+        self._save_state()
+
+        self._execute_remaining_tasks(spec, rules)
+        return True
+
+    def _plan_sections(self, spec: str, rules: str, sections: list[str]):
+        """Ask the planner for tasks covering new spec sections; append them."""
+        print(f"spec.md has {len(sections)} new section(s) no task covers; planning them...")
+        feature = "\n\n".join(sections)
+        existing_context = build_context_string(self.project_root, max_tokens=2000,
+                                                query=feature)
+        plan = self.planner.plan_incremental(spec, rules, feature, existing_context)
+
+        # The planner numbers its tasks from task_01; give them unused ids
+        taken = {t.id for t in self.state.tasks}
+        ids: dict[str, str] = {}
+        added = []
+        n = len(self.state.tasks)
+        for task_data in plan.get("tasks", []):
+            task = _task_from_plan(n, task_data)
+            new_id = task.id
+            while new_id in taken:
+                n += 1
+                new_id = f"task_{n:02d}"
+            ids[task.id] = new_id
+            taken.add(new_id)
+            task.id = new_id
+            added.append(task)
+        for task in added:
+            task.depends_on = [ids[d] for d in task.depends_on if d in ids]
+
+        self.state.tasks.extend(added)
+        self._save_state()
+        for t in added:
+            print(f"     + {t.name}")
+        print("")
+
+    def _record_unplanned(self, spec: str):
+        """Remember which spec sections no task covers, so they are planned only once."""
+        self.state.unplanned_sections = [
+            content_hash(section) for section in unplanned_sections(spec, self.state.tasks)
+        ]
 
     def _init_state(self, spec: str):
         self.state = BuildState(
@@ -236,13 +426,16 @@ class BuildOrchestrator:
             model=self.provider_config.model,
             spec_hash=compute_spec_hash(self.forge_path),
         )
+        self._usage_base = _saved_usage(self.state)
         self._save_state()
 
     def _phase_plan(self, spec: str, rules: str, feature: Optional[str]):
         print("Phase 1: Planning...")
         print("")
 
-        existing_context = build_context_string(self.project_root, max_tokens=2000)
+        existing_context = build_context_string(
+            self.project_root, max_tokens=2000, query=feature or ""
+        )
 
         if feature:
             plan = self.planner.plan_incremental(spec, rules, feature, existing_context)
@@ -255,15 +448,10 @@ class BuildOrchestrator:
         decisions_path = self.forge_path / "decisions.md"
         decisions_path.write_text(f"# Build Decisions\n\n{self.state.decisions}\n")
 
-        self.state.tasks = []
-        for i, task_data in enumerate(plan.get("tasks", [])):
-            task = TaskState(
-                id=task_data.get("id", f"task_{i+1:02d}"),
-                name=task_data.get("name", "Unnamed task"),
-                description=task_data.get("description", ""),
-                agent=task_data.get("agent", "coder"),
-            )
-            self.state.tasks.append(task)
+        self.state.tasks = [
+            _task_from_plan(i, task_data) for i, task_data in enumerate(plan.get("tasks", []))
+        ]
+        self._record_unplanned(spec)
 
         self.state.status = "building"
         self.state.current_task_index = 0
@@ -280,74 +468,125 @@ class BuildOrchestrator:
         self._execute_remaining_tasks(spec, rules)
 
     def _execute_remaining_tasks(self, spec: str, rules: str):
-        total = len(self.state.tasks)
+        tasks = self.state.tasks
+        deps = task_dependencies(tasks)
+        todo = {
+            i: {d for d in deps[i] if tasks[d].status != "completed"}
+            for i, t in enumerate(tasks) if t.status != "completed"
+        }
 
-        for i in range(self.state.current_task_index, total):
-            task = self.state.tasks[i]
+        try:
+            run_dag(
+                todo,
+                lambda i: self._run_task(i, spec, rules),
+                max_workers=self.jobs,
+            )
+        except KeyboardInterrupt:
+            with self._state_lock:
+                for task in tasks:
+                    if task.status == "in_progress":
+                        task.status = "pending"
+                self._save_state()
+            raise
 
-            if task.status == "completed":
-                continue
+        print("")
 
-            print(f"   [{i+1}/{total}] {task.name}")
+    def _run_task(self, i: int, spec: str, rules: str):
+        """Execute one planned task (called from a scheduler worker thread)."""
+        task = self.state.tasks[i]
+        total = len(self.state.tasks)
+        tag = f"[{i+1}/{total}]"
 
+        with self._state_lock:
+            print(f"   {tag} {task.name}")
             task.status = "in_progress"
+            task.error = ""
             task.started_at = datetime.now().isoformat()
-            self.state.current_task_index = i
+            self._update_resume_index()
             self._save_state()
 
-            try:
-                project_context = build_context_string(
-                    self.project_root, max_tokens=3000
-                )
+        try:
+            fingerprint = task_fingerprint(task, spec, rules, self.state.decisions)
+            input_hashes = hash_files(self.project_root, task.files)
 
-                task_dict = {
-                    "name": task.name,
-                    "description": task.description,
-                    "files": [],
-                }
-
-                response = self.coder.generate_files(
-                    task_dict, spec, rules,
-                    self.state.decisions, project_context
-                )
+            project_context = build_context_string(
+                self.project_root, max_tokens=3000,
+                focus_files=task.files,
+                query=f"{task.name} {task.description}",
+            )
 
-                files = self.coder.extract_files(response)
-                
-                # Apply Agentic Firewall
-                allowed_files = []
-                for filepath, content in files:
-                    permitted, reason = self.firewall.validate_file_write(filepath, content)
-                    if permitted:
-                        allowed_files.append((filepath, content))
-                    else:
-                        print(f"      🚨 FIREWALL BLOCK: {filepath} ({reason})")
-                        self.state.errors.append(f"Firewall blocked {filepath}: {reason}")
+            task_dict = {
+                "name": task.name,
+                "description": task.description,
+                "files": task.files,
+            }
 
-                written = self.coder.write_files(allowed_files)
+            with usage_scope(task=task.id):
+                written = self._generate_and_write(
+                    task_dict, spec, rules, self.state.decisions, project_context,
+                    tag=tag if self.jobs > 1 else "",
+                )
 
+            with self._state_lock:
                 task.files_written = written
+                task.fingerprint = fingerprint
+                task.input_hashes = input_hashes
                 task.status = "completed"
                 task.completed_at = datetime.now().isoformat()
-                self.state.files_written.extend(written)
-
-                for f in written:
-                    print(f"      + {f}")
-
-            except KeyboardInterrupt:
-                task.status = "pending"
+                self.state.files_written.extend(
+                    f for f in written if f not in self.state.files_written
+                )
+                self._update_resume_index()
                 self._save_state()
-                raise
-            except Exception as e:
+
+        except Exception as e:
+            with self._state_lock:
                 task.status = "failed"
                 task.error = str(e)
                 self.state.errors.append(f"Task '{task.name}': {e}")
                 self._save_state()
-                print(f"      ERROR: {e}")
-                continue
+                print(f"      {tag + ' ' if self.jobs > 1 else ''}ERROR: {e}")
 
-            self._save_state()
+    def _update_resume_index(self):
+        """Point current_task_index at the first task that is not completed."""
+        self.state.current_task_index = next(
+            (i for i, t in enumerate(self.state.tasks) if t.status != "completed"),
+            len(self.state.tasks),
+        )
 
-        print("")
+    def _generate_and_write(self, task_dict: dict, spec: str, rules: str,
+                            decisions: str, project_context: str,
+                            tag: str = "") -> list[str]:
+        """Run the coder for one task and write its files through the firewall.
+
+        In streaming mode each file is validated and written as soon as its
+        block closes, while the model is still generating the next one.
+        `tag` prefixes output lines so parallel tasks stay readable.
+        """
+        prefix = f"      {tag} " if tag else "      "
+        if self.stream:
+            files = self.coder.stream_task_files(
+                task_dict, spec, rules, decisions, project_context
+            )
+        else:
+            response = self.coder.generate_files(
+                task_dict, spec, rules, decisions, project_context
+            )
+            files = self.coder.extract_files(response)
+
+        written = []
+        for filepath, content in files:
+            # Apply Agentic Firewall
+            permitted, reason = self.firewall.validate_file_write(filepath, content)
+            if not permitted:
+                print(f"{prefix}🚨 FIREWALL BLOCK: {filepath} ({reason})")
+                with self._state_lock:
+                    self.state.errors.append(f"Firewall blocked {filepath}: {reason}")
+                continue
+            for f in self.coder.write_files([(filepath, content)]):
+                written.append(f)
+                print(f"{prefix}+ {f}")
+        return written
 
     def _phase_review(self, spec: str, rules: str):
         print("Phase 3: Reviewing...")
@@ -399,6 +638,7 @@ class BuildOrchestrator:
                             written = self.coder.write_files(fixed_files)
                             for f in written:
                                 print(f"      ~ {f} (fixed)")
+                            self._refresh_input_hashes(written)
                         except Exception as e:
                             print(f"      Could not fix {filepath}: {e}")
 
@@ -408,6 +648,14 @@ class BuildOrchestrator:
 
         print("")
 
+    def _refresh_input_hashes(self, paths: list[str]):
+        """Accept review fixes as the baseline, so they don't mark readers stale."""
+        fresh = hash_files(self.project_root, paths)
+        for task in self.state.tasks:
+            for path, h in fresh.items():
+                if path in task.input_hashes:
+                    task.input_hashes[path] = h
+
     def _read_forge_file(self, name: str) -> str:
         path = self.forge_path / name
         if path.exists():
@@ -418,39 +666,84 @@ class BuildOrchestrator:
         if not text:
             return
 
-        patterns = [
-            r"\bexfiltrat(e|ion|ing)\b",
-            r"\bleak\b",
-            r"\bsecret(s)?\b",
-            r"\btoken(s)?\b",
-            r"\bapi[- _]?key(s)?\b",
-            r"\bpassword(s)?\b",
-            r"\bprivate key\b",
-            r"\bssh\b",
-            r"\bcredential(s)?\b",
-            r"\bupload\b",
-            r"\btransfer\b",
-            r"\bsend to\b",
-            r"\bhttp(s)?://\b",
-            r"\bcurl\b",
-            r"\bwget\b",
-            r"\bpastebin\b",
-            r"\bgist\b",
-            r"\bdrive\.google\b",
-            r"\bdropbox\b",
-        ]
-
-        hits = []
-        for pat in patterns:
-            if re.search(pat, text, re.IGNORECASE):
-                hits.append(pat.strip("\\b").replace("\\", ""))
+        hits = [_SUSPICIOUS_LABELS[pat] for pat in _SUSPICIOUS.matching(text)]
 
         if hits:
             unique = ", ".join(sorted(set(hits)))
             print(f"WARNING: Suspicious pattern(s) found in .forge/{name}: {unique}")
 
     def _save_state(self):
-        save_build_state(self.forge_path, self.state)
+        with self._state_lock:
+            self._sync_usage()
+            save_build_state(self.forge_path, self.state)
+
+    def _sync_usage(self):
+        """Copy the usage meter's per-agent and per-task totals into state.
+
+        Fresh dicts are assigned each time, so the journal sees the change.
+        """
+        saved_agents, saved_tasks = self._usage_base
+        by_agent = self.provider.usage.by_agent()
+        agents = list(saved_agents) + [a for a in by_agent if a not in saved_agents]
+        self.state.usage = {a: merge_stats(saved_agents.get(a), by_agent.get(a))
+                            for a in agents}
+        by_task = self.provider.usage.by_task()
+        for task in self.state.tasks:
+            if task.id in by_task or task.id in saved_tasks:
+                task.usage = merge_stats(saved_tasks.get(task.id), by_task.get(task.id))
+
+
+def _saved_usage(state: BuildState) -> tuple[dict, dict]:
+    """(per-agent, per-task) usage already recorded in a loaded build state."""
+    return (dict(state.usage or {}),
+            {t.id: t.usage for t in state.tasks if t.usage})
+
+
+_SUSPICIOUS_PATTERNS = [
+    r"\bexfiltrat(e|ion|ing)\b",
+    r"\bleak\b",
+    r"\bsecret(s)?\b",
+    r"\btoken(s)?\b",
+    r"\bapi[- _]?key(s)?\b",
+    r"\bpassword(s)?\b",
+    r"\bprivate key\b",
+    r"\bssh\b",
+    r"\bcredential(s)?\b",
+    r"\bupload\b",
+    r"\btransfer\b",
+    r"\bsend to\b",
+    r"\bhttp(s)?://\b",
+    r"\bcurl\b",
+    r"\bwget\b",
+    r"\bpastebin\b",
+    r"\bgist\b",
+    r"\bdrive\.google\b",
+    r"\bdropbox\b",
+]
+# Scanned in one pass; labels are what the warning prints for each pattern
+_SUSPICIOUS = PatternSet(_SUSPICIOUS_PATTERNS, re.IGNORECASE)
+_SUSPICIOUS_LABELS = {p: p.strip("\\b").replace("\\", "") for p in _SUSPICIOUS_PATTERNS}
+
+
+def _task_from_plan(i: int, task_data: dict) -> TaskState:
+    """TaskState for the i-th (0-based) task of a planner's plan."""
+    return TaskState(
+        id=str(task_data.get("id", f"task_{i+1:02d}")),
+        name=task_data.get("name", "Unnamed task"),
+        description=task_data.get("description", ""),
+        agent=task_data.get("agent", "coder"),
+        files=_as_str_list(task_data.get("files")),
+        depends_on=_as_str_list(task_data.get("depends_on")),
+    )
+
+
+def _as_str_list(value) -> list[str]:
+    """Normalize a planner list field (list, comma string or None) to list[str]."""
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = value.split(",")
+    return [str(v).strip() for v in value if str(v).strip()]
 
 
 def _format_decisions(decisions: dict) -> str:
@@ -0,0 +1,397 @@
+"""Project index -- imports, symbols and routes per file, for context ranking.
+
+Python files are parsed with `ast`; JS/TS files with a few regexes (no
+Node toolchain needed). Imports that resolve to other project files become
+edges of an undirected file graph, and `ProjectIndex.rank()` orders files by
+graph distance from a task's declared files and description keywords.
+
+`outline_file()` renders the cheap context tier: signatures, classes, route
+decorators, exported components and SQL table definitions.
+"""
+
+import ast
+import hashlib
+import re
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import PurePosixPath
+from typing import Iterable, Optional, Sequence
+
+PY_SUFFIXES = {".py"}
+JS_SUFFIXES = {".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs"}
+# Order in which an extensionless JS import is resolved
+_JS_RESOLVE = [".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs"]
+
+HTTP_METHODS = {"get", "post", "put", "patch", "delete", "head", "options", "route", "api_route", "websocket"}
+
+_WORD = re.compile(r"[a-z][a-z0-9]{2,}")
+_CAMEL = re.compile(r"([a-z0-9])([A-Z])")
+
+# Words too generic to tie a task to a file or spec section
+STOPWORDS = {
+    "the", "and", "for", "all", "new", "app", "add", "set", "use", "get",
+    "can", "are", "not", "any", "its", "one", "via", "per", "out", "has",
+    "but", "you", "our", "was", "with", "from", "that", "this", "into",
+    "each", "their", "them", "then", "have", "will", "should", "using",
+    "used", "make", "create", "build", "file", "project", "setup",
+    "structure", "task", "page", "basic", "simple", "support", "implement",
+    "application", "index", "init", "main", "src", "lib",
+}
+
+_JS_IMPORT = re.compile(
+    r"""(?:\bimport\s+(?:[\w*{}\s,$]+?\s+from\s+)?|\bexport\s+[\w*{}\s,$]+?\s+from\s+|\brequire\(\s*|\bimport\(\s*)['"]([^'"]+)['"]"""
+)
+_JS_EXPORT = re.compile(
+    r"\bexport\s+(?:default\s+)?(?:async\s+)?(?:function\*?|class|const|let|var|interface|type|enum)\s+([A-Za-z_$][\w$]*)"
+)
+_JS_EXPORT_LIST = re.compile(r"\bexport\s*\{([^}]*)\}")
+_JS_ROUTE = re.compile(
+    r"""\b(?:app|router|server|api)\.(get|post|put|patch|delete|all|use)\(\s*['"`]([^'"`]+)['"`]"""
+)
+_JSX_ROUTE = re.compile(r"""<Route\b[^>]*\bpath=\s*['"{]+([^'"}]+)""")
+
+
+@dataclass
+class FileInfo:
+    """What one file imports, defines and serves."""
+    imports: list[str] = field(default_factory=list)   # raw module specifiers
+    symbols: list[str] = field(default_factory=list)   # top-level/exported names
+    routes: list[str] = field(default_factory=list)    # "GET /users", "/login"
+
+
+def extract_keywords(text: str) -> set[str]:
+    """Significant lowercase words in text (camelCase/snake_case split, plurals folded)."""
+    text = _CAMEL.sub(r"\1 \2", text).replace("_", " ").lower()
+    words = set()
+    for w in _WORD.findall(text):
+        if len(w) > 4 and w.endswith("s") and not w.endswith("ss"):
+            w = w[:-1]
+        if w not in STOPWORDS:
+            words.add(w)
+    return words
+
+
+_analysis_cache: dict[str, FileInfo] = {}
+_analysis_lock = threading.Lock()
+
+
+def analyze_file(path: str, content: str) -> FileInfo:
+    """Extract imports, symbols and routes. Cached by content hash."""
+    suffix = PurePosixPath(path).suffix.lower()
+    if suffix not in PY_SUFFIXES and suffix not in JS_SUFFIXES:
+        return FileInfo()
+
+    key = suffix + ":" + hashlib.sha1(content.encode()).hexdigest()
+    with _analysis_lock:
+        cached = _analysis_cache.get(key)
+    if cached is not None:
+        return cached
+
+    info = _analyze_python(content) if suffix in PY_SUFFIXES else _analyze_js(content)
+    with _analysis_lock:
+        _analysis_cache[key] = info
+    return info
+
+
+def _analyze_python(content: str) -> FileInfo:
+    info = FileInfo()
+    try:
+        tree = ast.parse(content)
+    except (SyntaxError, ValueError):
+        return info
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            info.imports.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = "." * node.level + (node.module or "")
+            info.imports.append(base)
+            # `from . import models` / `from app import routes` may name modules
+            for alias in node.names:
+                if alias.name != "*":
+                    sep = "" if base.endswith(".") else "."
+                    info.imports.append(f"{base}{sep}{alias.name}")
+
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            info.symbols.append(node.name)
+            info.routes.extend(_python_routes(node))
+        elif isinstance(node, ast.Assign):
+            info.symbols.extend(t.id for t in node.targets if isinstance(t, ast.Name))
+    return info
+
+
+def _python_routes(node) -> list[str]:
+    """Routes from decorators like @app.get("/x") or @router.route("/x")."""
+    routes = []
+    for dec in getattr(node, "decorator_list", []):
+        if not (isinstance(dec, ast.Call) and isinstance(dec.func, ast.Attribute)):
+            continue
+        method = dec.func.attr.lower()
+        if method not in HTTP_METHODS or not dec.args:
+            continue
+        arg = dec.args[0]
+        if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+            verb = "" if method in ("route", "api_route") else method.upper() + " "
+            routes.append(f"{verb}{arg.value}")
+    return routes
+
+
+def _analyze_js(content: str) -> FileInfo:
+    info = FileInfo()
+    info.imports = _JS_IMPORT.findall(content)
+    info.symbols = _JS_EXPORT.findall(content)
+    for group in _JS_EXPORT_LIST.findall(content):
+        for name in group.split(","):
+            name = name.split(" as ")[-1].strip()
+            if name:
+                info.symbols.append(name)
+    info.routes = [f"{m.upper()} {p}" for m, p in _JS_ROUTE.findall(content) if m != "use"]
+    info.routes.extend(_JSX_ROUTE.findall(content))
+    return info
+
+
+class ProjectIndex:
+    """File graph over a project's (relative_path, content) pairs."""
+
+    def __init__(self, files: Iterable[tuple[object, str]]):
+        self.files: dict[str, str] = {str(PurePosixPath(p)): c for p, c in files}
+        self.info: dict[str, FileInfo] = {p: analyze_file(p, c) for p, c in self.files.items()}
+        self.edges: dict[str, set[str]] = {p: set() for p in self.files}
+        self._py_modules = self._python_module_map()
+
+        for path, info in self.info.items():
+            for spec in info.imports:
+                target = self._resolve(path, spec)
+                if target and target != path:
+                    self.edges[path].add(target)
+                    self.edges[target].add(path)
+
+    def terms(self, path: str) -> set[str]:
+        """Keywords describing a file: its path, symbols and routes."""
+        info = self.info.get(path, FileInfo())
+        text = " ".join([path.replace("/", " ").replace(".", " ")] + info.symbols + info.routes)
+        return extract_keywords(text)
+
+    def rank(self, focus: Sequence[str] = (), query: str = "") -> list[str]:
+        """Paths ordered by relevance to a task.
+
+        Declared files start at distance 0, files whose path, symbols or
+        routes share keywords with the task at distance 1; everything else
+        is ordered by graph distance from those. Ties go to files in the
+        declared files' directories, then more keyword hits, then config
+        files, then smaller files.
+        """
+        from .context import CONFIG_NAMES
+
+        keywords = extract_keywords(" ".join([query] + [f.replace("/", " ") for f in focus]))
+        hits = {p: len(keywords & self.terms(p)) for p in self.files} if keywords else {}
+
+        dist: dict[str, int] = {}
+        for f in focus:
+            f = str(PurePosixPath(f))
+            if f in self.files:
+                dist[f] = 0
+        for p, n in hits.items():
+            if n and p not in dist:
+                dist[p] = 1
+
+        # Multi-source BFS; sources are enqueued in distance order (0s then 1s)
+        queue = deque(sorted(dist, key=dist.get))
+        while queue:
+            node = queue.popleft()
+            for nxt in self.edges[node]:
+                if nxt not in dist or dist[nxt] > dist[node] + 1:
+                    dist[nxt] = dist[node] + 1
+                    queue.append(nxt)
+
+        unreachable = len(self.files) + 1
+        focus_dirs = [PurePosixPath(f).parent.parts for f in focus]
+
+        def nearness(p):
+            # Shared leading directories with the closest declared file
+            parts = PurePosixPath(p).parent.parts
+            best = 0
+            for d in focus_dirs:
+                n = 0
+                while n < min(len(d), len(parts)) and d[n] == parts[n]:
+                    n += 1
+                best = max(best, n)
+            return best
+
+        def key(p):
+            is_config = PurePosixPath(p).name in CONFIG_NAMES
+            return (dist.get(p, unreachable), -nearness(p), -hits.get(p, 0),
+                    0 if is_config else 1, len(self.files[p]), p)
+
+        return sorted(self.files, key=key)
+
+    def _python_module_map(self) -> dict[str, str]:
+        """Dotted module name → path, for every suffix of each .py path.
+
+        "src/app/models.py" registers "src.app.models", "app.models" and
+        "models", so both absolute and source-root-relative imports resolve.
+        """
+        modules: dict[str, str] = {}
+        for path in sorted(self.files, key=lambda p: p.count("/")):
+            pp = PurePosixPath(path)
+            if pp.suffix != ".py":
+                continue
+            parts = list(pp.with_suffix("").parts)
+            if parts[-1] == "__init__":
+                parts = parts[:-1]
+            for i in range(len(parts)):
+                modules.setdefault(".".join(parts[i:]), path)
+        return modules
+
+    def _resolve(self, importer: str, spec: str) -> Optional[str]:
+        suffix = PurePosixPath(importer).suffix
+        if suffix in PY_SUFFIXES:
+            return self._resolve_python(importer, spec)
+        if suffix in JS_SUFFIXES:
+            return self._resolve_js(importer, spec)
+        return None
+
+    def _resolve_python(self, importer: str, spec: str) -> Optional[str]:
+        if spec.startswith("."):
+            level = len(spec) - len(spec.lstrip("."))
+            base = PurePosixPath(importer).parent
+            for _ in range(level - 1):
+                base = base.parent
+            rest = spec[level:].replace(".", "/")
+            stem = PurePosixPath(base, rest) if rest else base
+            for candidate in (f"{stem}.py", str(stem / "__init__.py")):
+                if candidate in self.files:
+                    return candidate
+            return None
+        return self._py_modules.get(spec)
+
+    def _resolve_js(self, importer: str, spec: str) -> Optional[str]:
+        if spec.startswith("."):
+            target = PurePosixPath(importer).parent / spec
+        elif spec.startswith(("@/", "~/")):
+            target = PurePosixPath(spec[2:])
+        else:
+            return None  # package import
+
+        parts = []
+        for part in target.parts:
+            if part == "..":
+                if parts:
+                    parts.pop()
+            elif part != ".":
+                parts.append(part)
+        stem = "/".join(parts)
+
+        candidates = [stem] + [stem + ext for ext in _JS_RESOLVE] + [f"{stem}/index{ext}" for ext in _JS_RESOLVE]
+        for candidate in candidates:
+            if candidate in self.files:
+                return candidate
+        if spec.startswith(("@/", "~/")):
+            # Alias root is usually src/
+            for candidate in candidates:
+                if f"src/{candidate}" in self.files:
+                    return f"src/{candidate}"
+        return None
+
+
+# --- Outlines: a compact structural view of a file for the context tier ---
+
+SQL_SUFFIXES = {".sql"}
+
+_JS_OUTLINE_LINE = re.compile(
+    r"^\s*(?:export\s+(?:default\s+)?)?(?:async\s+)?"
+    r"(?:function\*?\s+\w+|class\s+\w+|interface\s+\w+|type\s+\w+\s*=|enum\s+\w+"
+    r"|(?:const|let)\s+\w+\s*(?::[^=]+)?=\s*(?:async\s*)?(?:\([^)]*\)|\w+)\s*=>)"
+)
+_SQL_STATEMENT = re.compile(
+    r"\bCREATE\s+(?:TABLE|VIEW|INDEX|UNIQUE\s+INDEX|TYPE)\b.*?;", re.IGNORECASE | re.DOTALL
+)
+
+_outline_cache: dict[str, Optional[str]] = {}
+_outline_lock = threading.Lock()
+
+
+def outline_file(path: str, content: str) -> Optional[str]:
+    """Signatures, classes, routes, exported components and SQL tables.
+
+    Returns None for file types without an outline (configs, markdown, ...).
+    Cached by content hash.
+    """
+    suffix = PurePosixPath(path).suffix.lower()
+    if suffix in PY_SUFFIXES:
+        build = _outline_python
+    elif suffix in JS_SUFFIXES:
+        build = _outline_js
+    elif suffix in SQL_SUFFIXES:
+        build = _outline_sql
+    else:
+        return None
+
+    key = suffix + ":" + hashlib.sha1(content.encode()).hexdigest()
+    with _outline_lock:
+        if key in _outline_cache:
+            return _outline_cache[key]
+
+    outline = build(content) or None
+    with _outline_lock:
+        _outline_cache[key] = outline
+    return outline
+
+
+def _outline_python(content: str) -> str:
+    try:
+        tree = ast.parse(content)
+    except (SyntaxError, ValueError):
+        return ""
+
+    lines = []
+
+    def visit(node, indent):
+        pad = "    " * indent
+        for dec in getattr(node, "decorator_list", []):
+            lines.append(f"{pad}@{ast.unparse(dec)}")
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            prefix = "async def" if isinstance(node, ast.AsyncFunctionDef) else "def"
+            returns = f" -> {ast.unparse(node.returns)}" if node.returns else ""
+            lines.append(f"{pad}{prefix} {node.name}({ast.unparse(node.args)}){returns}: ...")
+        elif isinstance(node, ast.ClassDef):
+            bases = ", ".join(ast.unparse(b) for b in node.bases + node.keywords)
+            lines.append(f"{pad}class {node.name}({bases}):" if bases else f"{pad}class {node.name}:")
+            body = [n for n in node.body
+                    if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef,
+                                      ast.Assign, ast.AnnAssign))]
+            for child in body:
+                visit(child, indent + 1)
+            if not body:
+                lines.append(f"{pad}    ...")
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            # Class fields and module constants: keep short ones verbatim
+            text = ast.unparse(node)
+            lines.append(f"{pad}{text if len(text) <= 80 else text[:77] + '...'}")
+
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            visit(node, 0)
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            if any(isinstance(t, ast.Name) and t.id.isupper() for t in targets):
+                visit(node, 0)
+    return "\n".join(lines)
+
+
+def _outline_js(content: str) -> str:
+    lines = []
+    for line in content.splitlines():
+        if _JS_OUTLINE_LINE.match(line):
+            sig = re.sub(r"\s*\{\s*\}?\s*$", "", line.rstrip())
+            lines.append(sig if len(sig) <= 120 else sig[:117] + "...")
+    lines.extend(f"// route {r}" for r in _analyze_js(content).routes)
+    return "\n".join(lines)
+
+
+def _outline_sql(content: str) -> str:
+    return "\n".join(
+        " ".join(stmt.split()) for stmt in _SQL_STATEMENT.findall(content)
+    )
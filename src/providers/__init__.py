@@ -3,22 +3,35 @@
 from .base import BaseProvider, ProviderConfig
 
 
-def create_provider(config: ProviderConfig) -> BaseProvider:
-    """Create the appropriate provider from config."""
+def create_provider(config: ProviderConfig, cache=None) -> BaseProvider:
+    """Create the appropriate provider from config.
+
+    Args:
+        config: provider settings
+        cache: optional ResponseCache used by chat_with_retry
+    """
     name = config.name.lower()
 
-    if name == "anthropic":
+    from .router import RouterConfig
+    if isinstance(config, RouterConfig):
+        from .router import RouterProvider
+        # Members share the router's response cache instead of their own
+        provider = RouterProvider(config, [create_provider(route) for route in config.routes])
+    elif name == "anthropic":
         from .anthropic import AnthropicProvider
-        return AnthropicProvider(config)
+        provider = AnthropicProvider(config)
     elif name in ("openai", "together", "groq"):
         from .openai_compat import OpenAIProvider
-        return OpenAIProvider(config)
+        provider = OpenAIProvider(config)
     elif name == "ollama":
         from .ollama import OllamaProvider
-        return OllamaProvider(config)
+        provider = OllamaProvider(config)
     else:
         from .openai_compat import OpenAIProvider
-        return OpenAIProvider(config)
+        provider = OpenAIProvider(config)
+
+    provider.cache = cache
+    return provider
 
 
 __all__ = ["BaseProvider", "ProviderConfig", "create_provider"]
@@ -1,8 +1,17 @@
-"""Anthropic Claude provider."""
+"""Anthropic Claude provider.
 
-from typing import Generator
+Requests carry prompt-cache breakpoints: the system prompt and the end of
+each cacheable segment run (see providers/prompt.py) are sent with
+cache_control, so the spec/rules/decisions prefix repeated across a
+build's calls is billed as cache reads after the first call.
+"""
+
+from typing import AsyncGenerator, Generator, Optional
 
 from .base import BaseProvider, ProviderConfig
+from .limiter import Transient, retry_after, status_kind
+from .prompt import anthropic_messages, anthropic_system
+from .usage import Usage
 
 
 class AnthropicProvider(BaseProvider):
@@ -12,25 +21,64 @@ class AnthropicProvider(BaseProvider):
         import anthropic
         self.client = anthropic.Anthropic(api_key=config.api_key)
 
-    def chat(self, messages: list[dict], system: str = "") -> str:
+    def _request_kwargs(self, messages: list[dict], system) -> dict:
         kwargs = {
             "model": self.config.model,
             "max_tokens": self.config.max_tokens,
-            "messages": messages,
+            "messages": anthropic_messages(messages),
         }
         if system:
-            kwargs["system"] = system
-        response = self.client.messages.create(**kwargs)
+            kwargs["system"] = anthropic_system(system)
+        return kwargs
+
+    def _record(self, usage):
+        self._record_usage(Usage(
+            input_tokens=usage.input_tokens or 0,
+            output_tokens=usage.output_tokens or 0,
+            cache_read_tokens=getattr(usage, "cache_read_input_tokens", None) or 0,
+            cache_write_tokens=getattr(usage, "cache_creation_input_tokens", None) or 0,
+        ))
+
+    def _aclient(self):
+        import anthropic
+        return self._async_client(lambda: anthropic.AsyncAnthropic(api_key=self.config.api_key))
+
+    def classify_error(self, e: Exception) -> Optional[Transient]:
+        import anthropic
+        wait = retry_after(getattr(e, "response", None))
+        if isinstance(e, anthropic.RateLimitError):
+            return Transient("rate_limit", wait)
+        if isinstance(e, anthropic.APITimeoutError):
+            return Transient("timeout")
+        if isinstance(e, anthropic.APIConnectionError):
+            return Transient("connection")
+        if isinstance(e, anthropic.APIStatusError):
+            # Overload can also arrive as an error event inside a 200 stream
+            body = e.body if isinstance(e.body, dict) else {}
+            if (body.get("error") or {}).get("type") == "overloaded_error":
+                return Transient("overloaded", wait)
+            kind = status_kind(e.status_code)
+            return Transient(kind, wait) if kind else None
+        return super().classify_error(e)
+
+    def chat(self, messages: list[dict], system: str = "") -> str:
+        response = self.client.messages.create(**self._request_kwargs(messages, system))
+        self._record(response.usage)
         return response.content[0].text
 
     def stream(self, messages: list[dict], system: str = "") -> Generator[str, None, None]:
-        kwargs = {
-            "model": self.config.model,
-            "max_tokens": self.config.max_tokens,
-            "messages": messages,
-        }
-        if system:
-            kwargs["system"] = system
-        with self.client.messages.stream(**kwargs) as s:
+        with self.client.messages.stream(**self._request_kwargs(messages, system)) as s:
             for text in s.text_stream:
                 yield text
+            self._record(s.get_final_message().usage)
+
+    async def achat(self, messages: list[dict], system: str = "") -> str:
+        response = await self._aclient().messages.create(**self._request_kwargs(messages, system))
+        self._record(response.usage)
+        return response.content[0].text
+
+    async def astream(self, messages: list[dict], system: str = "") -> AsyncGenerator[str, None]:
+        async with self._aclient().messages.stream(**self._request_kwargs(messages, system)) as s:
+            async for text in s.text_stream:
+                yield text
+            self._record((await s.get_final_message()).usage)
@@ -1,9 +1,15 @@
 """Base provider interface for LLM backends."""
 
+import asyncio
+import threading
 import time
+import weakref
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Generator, Optional
+from typing import AsyncGenerator, Callable, Generator, Optional
+
+from .limiter import Transient, classify_http, estimate_tokens, limiter_for
+from .usage import CallRecord, CallTimer, Usage, UsageMeter, current_call, current_scope
 
 
 @dataclass
@@ -14,16 +20,43 @@ class ProviderConfig:
     model: str = ""
     base_url: Optional[str] = None
     max_tokens: int = 8192
+    # Account limits shared by every call to this provider (see limiter.py)
+    rpm: Optional[int] = None
+    tpm: Optional[int] = None
+    max_concurrency: Optional[int] = None
 
     def __str__(self):
         return f"{self.name} ({self.model})"
 
 
 class BaseProvider(ABC):
-    """Abstract base for all LLM providers."""
+    """Abstract base for all LLM providers.
+
+    Sync API:  chat / stream / chat_with_retry
+    Async API: achat / astream / achat_with_retry
+
+    The async defaults run the sync methods in a worker thread; providers with
+    a native async SDK override achat/astream so many concurrent calls can
+    share one event loop.
+
+    Message content and `system` may be plain strings or segment lists
+    with cacheable parts (see providers/prompt.py). Providers report the
+    tokens each call used, including prompt-cache reads/writes; the retry
+    paths time each call and add it to `usage` (see providers/usage.py).
+
+    The *_with_retry methods go through the account's shared RateLimiter
+    and retry only errors classify_error() reports as transient.
+    """
 
     def __init__(self, config: ProviderConfig):
         self.config = config
+        # Optional ResponseCache shared across providers (see providers/cache.py)
+        self.cache = None
+        self.limiter = limiter_for(config)
+        self.usage = UsageMeter()
+        # Async SDK clients are bound to the event loop that created them
+        self._async_clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+        self._async_clients_lock = threading.Lock()
 
     @abstractmethod
     def chat(self, messages: list[dict], system: str = "") -> str:
@@ -35,18 +68,232 @@ class BaseProvider(ABC):
         """Stream response tokens one at a time."""
         ...
 
+    def _record_usage(self, usage: Usage):
+        """Add usage reported by the SDK to the call being timed, if any."""
+        call = current_call()
+        if call is not None:
+            call.add(usage)
+            return
+        agent, task = current_scope()
+        self.usage.record(CallRecord(self.config.name, self.config.model, usage,
+                                     latency=0.0, agent=agent, task=task))
+
+    def _finish_call(self, call: CallTimer, ok: bool):
+        self.usage.record(call.finish(self.config.name, self.config.model, ok))
+
+    def classify_error(self, e: Exception) -> Optional[Transient]:
+        """Transient kind and Retry-After of an error, or None if permanent.
+
+        Providers override this with their SDK's exception types.
+        """
+        return classify_http(e)
+
+    async def achat(self, messages: list[dict], system: str = "") -> str:
+        """Async chat. Default: run the sync chat() in a worker thread."""
+        return await asyncio.to_thread(self.chat, messages, system)
+
+    async def astream(self, messages: list[dict], system: str = "") -> AsyncGenerator[str, None]:
+        """Async token stream. Default: drain the sync stream() in a worker thread."""
+        queue: asyncio.Queue = asyncio.Queue()
+        loop = asyncio.get_running_loop()
+        done = object()
+        stop = threading.Event()
+
+        def _pump():
+            try:
+                for chunk in self.stream(messages, system):
+                    if stop.is_set():
+                        break
+                    loop.call_soon_threadsafe(queue.put_nowait, chunk)
+            except BaseException as e:
+                loop.call_soon_threadsafe(queue.put_nowait, e)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, done)
+
+        worker = loop.run_in_executor(None, _pump)
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            await worker
+
     def chat_with_retry(self, messages: list[dict], system: str = "",
                         max_retries: int = 3) -> str:
-        """Chat with exponential backoff retry on transient failures."""
-        for attempt in range(max_retries):
-            try:
-                return self.chat(messages, system)
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    raise
-                err_str = str(e).lower()
-                if "rate" in err_str or "timeout" in err_str or "529" in err_str or "overloaded" in err_str:
-                    wait = 2 ** attempt
-                    time.sleep(wait)
-                else:
-                    raise
+        """Chat with exponential backoff retry on transient failures.
+
+        When a response cache is attached, byte-identical requests are served
+        from the cache and concurrent duplicates share one in-flight call.
+        """
+        if self.cache is None:
+            return self._chat_with_backoff(messages, system, max_retries)
+
+        from .cache import cache_key
+        key = cache_key(self.config.name, self.config.model,
+                        self.config.max_tokens, system, messages)
+        return self.cache.get_or_compute(
+            key, lambda: self._chat_with_backoff(messages, system, max_retries)
+        )
+
+    def discard_cached(self, messages: list[dict], system: str = ""):
+        """Drop the cached response to a request the caller rejected."""
+        if self.cache is None:
+            return
+        from .cache import cache_key
+        self.cache.discard(cache_key(self.config.name, self.config.model,
+                                     self.config.max_tokens, system, messages))
+
+    def stream_with_retry(self, messages: list[dict], system: str = "",
+                          max_retries: int = 3) -> Generator[str, None, None]:
+        """Stream with the same caching and retry policy as chat_with_retry.
+
+        A cached response is replayed as a single chunk. Transient errors are
+        only retried before the first chunk arrives; once text has been
+        yielded a failure is raised to the caller.
+        """
+        key = None
+        if self.cache is not None:
+            from .cache import cache_key
+            key = cache_key(self.config.name, self.config.model,
+                            self.config.max_tokens, system, messages)
+            cached = self.cache.get(key)
+            if cached is not None:
+                yield cached
+                return
+
+        chunks = []
+        for chunk in self._stream_with_backoff(messages, system, max_retries):
+            chunks.append(chunk)
+            yield chunk
+
+        if key is not None:
+            self.cache.put(key, "".join(chunks))
+
+    def _stream_with_backoff(self, messages: list[dict], system: str,
+                             max_retries: int) -> Generator[str, None, None]:
+        estimate = estimate_tokens(messages, system)
+        call, ok = CallTimer(), False
+        try:
+            for attempt in range(max_retries):
+                call.retries = attempt
+                chunks = []
+                failure, delay = None, None
+                self.limiter.acquire(estimate)
+                try:
+                    for chunk in self.stream(messages, system):
+                        call.first_chunk()
+                        chunks.append(chunk)
+                        yield chunk
+                    ok = True
+                    return
+                except Exception as e:
+                    failure = self.classify_error(e)
+                    delay = _delay(attempt, failure) if failure else None
+                    if chunks or attempt == max_retries - 1 or failure is None:
+                        raise
+                finally:
+                    self.limiter.release(_output_tokens(chunks), failure, ok, pause=delay)
+                if not failure.throttled:
+                    time.sleep(delay)
+        except GeneratorExit:
+            ok = True  # closed by the consumer (e.g. a losing hedge), not a failure
+            raise
+        finally:
+            self._finish_call(call, ok)
+
+    async def achat_with_retry(self, messages: list[dict], system: str = "",
+                               max_retries: int = 3) -> str:
+        """Async chat_with_retry: same caching and backoff, without blocking the loop."""
+        if self.cache is None:
+            return await self._achat_with_backoff(messages, system, max_retries)
+
+        from .cache import cache_key
+        key = cache_key(self.config.name, self.config.model,
+                        self.config.max_tokens, system, messages)
+        return await self.cache.aget_or_compute(
+            key, lambda: self._achat_with_backoff(messages, system, max_retries)
+        )
+
+    def _chat_with_backoff(self, messages: list[dict], system: str,
+                           max_retries: int) -> str:
+        estimate = estimate_tokens(messages, system)
+        call, text = CallTimer(), None
+        try:
+            for attempt in range(max_retries):
+                call.retries = attempt
+                failure, delay = None, None
+                self.limiter.acquire(estimate)
+                try:
+                    text = self.chat(messages, system)
+                    return text
+                except Exception as e:
+                    failure = self.classify_error(e)
+                    delay = _delay(attempt, failure) if failure else None
+                    if attempt == max_retries - 1 or failure is None:
+                        raise
+                finally:
+                    self.limiter.release(_output_tokens([text or ""]), failure,
+                                         ok=text is not None, pause=delay)
+                # Throttled calls wait in acquire() until the limiter's pause ends
+                if not failure.throttled:
+                    time.sleep(delay)
+        finally:
+            self._finish_call(call, ok=text is not None)
+
+    async def _achat_with_backoff(self, messages: list[dict], system: str,
+                                  max_retries: int) -> str:
+        estimate = estimate_tokens(messages, system)
+        call, text = CallTimer(), None
+        try:
+            for attempt in range(max_retries):
+                call.retries = attempt
+                failure, delay = None, None
+                await self.limiter.aacquire(estimate)
+                try:
+                    text = await self.achat(messages, system)
+                    return text
+                except Exception as e:
+                    failure = self.classify_error(e)
+                    delay = _delay(attempt, failure) if failure else None
+                    if attempt == max_retries - 1 or failure is None:
+                        raise
+                finally:
+                    self.limiter.release(_output_tokens([text or ""]), failure,
+                                         ok=text is not None, pause=delay)
+                if not failure.throttled:
+                    await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            text = ""  # cancelled (e.g. a losing hedge), not a failure
+            raise
+        finally:
+            self._finish_call(call, ok=text is not None)
+
+    def _async_client(self, factory: Callable):
+        """Return this provider's async SDK client for the running event loop.
+
+        httpx-based async clients keep connection pools tied to the loop that
+        created them, so each loop gets its own (collected with the loop).
+        """
+        loop = asyncio.get_running_loop()
+        with self._async_clients_lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                client = factory()
+                self._async_clients[loop] = client
+            return client
+
+
+def _delay(attempt: int, failure: Transient) -> float:
+    """Seconds before retrying: the server's Retry-After, else exponential."""
+    if failure.retry_after is not None:
+        return failure.retry_after
+    return float(2 ** attempt)
+
+
+def _output_tokens(chunks: list[str]) -> int:
+    return sum(len(c) for c in chunks) // 4
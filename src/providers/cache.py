@@ -0,0 +1,386 @@
+"""Content-addressed LLM response cache -- memory LRU + disk tier.
+
+Responses are keyed by a SHA256 of (provider, model, max_tokens, system,
+messages), so a retry, resume or --feature run that re-sends a byte-identical
+prompt is answered locally instead of paying for another LLM call.
+
+Tiers:
+  - memory: small LRU (OrderedDict), per process
+  - disk:   one JSON file per key under ~/.forge/cache, bounded by total size
+            (least-recently-used files are evicted first) and by TTL.
+            A file's mtime is its creation time, which the TTL is measured
+            from; reads move only its atime, which orders LRU eviction.
+
+Concurrent identical requests (e.g. parallel ADK agents) are de-duplicated:
+the first caller runs the request, the others wait and share its result.
+
+A caller that rejects a response (e.g. a plan that does not parse) calls
+discard(key), so a rerun asks the model again instead of replaying it.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+from ..config import CONFIG_DIR
+
+CACHE_DIR = CONFIG_DIR / "cache"
+
+DEFAULT_MEMORY_ENTRIES = 256
+DEFAULT_MAX_DISK_MB = 200
+DEFAULT_TTL_DAYS = 14
+
+
+def cache_key(provider: str, model: str, max_tokens: int,
+              system, messages: list) -> str:
+    """Stable hash of everything that determines an LLM response."""
+    payload = json.dumps(
+        {
+            "provider": provider.lower(),
+            "model": model,
+            "max_tokens": max_tokens,
+            "system": system,
+            "messages": messages,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class _InFlight:
+    """A request currently being computed by another thread."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Optional[str] = None
+        self.error: Optional[BaseException] = None
+
+
+class ResponseCache:
+    """Two-tier response cache with single-flight de-duplication."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = CACHE_DIR,
+        max_memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_MB * 1024 * 1024,
+        ttl_seconds: Optional[float] = DEFAULT_TTL_DAYS * 86400,
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.ttl_seconds = ttl_seconds
+
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._inflight: dict[str, _InFlight] = {}
+        self._ainflight: dict[tuple, asyncio.Future] = {}  # (loop id, key) → future
+        self._lock = threading.Lock()
+        self._disk_bytes: Optional[int] = None  # computed lazily on first write
+
+        self.hits = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.shared = 0  # callers served by another thread's in-flight request
+        self.bytes_saved = 0
+
+    # ── Public API ───────────────────────────────────────────────────────────
+
+    def get_or_compute(self, key: str, compute: Callable[[], str]) -> str:
+        """Return the cached response for key, or compute and store it.
+
+        Only one thread computes a given key at a time; concurrent callers
+        with the same key block until that result is available.
+        """
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            # Another thread may have finished this key since our lookup
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                self.memory_hits += 1
+                self.bytes_saved += len(self._memory[key].encode())
+                return self._memory[key]
+            flight = self._inflight.get(key)
+            owner = flight is None
+            if owner:
+                flight = _InFlight()
+                self._inflight[key] = flight
+                self.misses += 1
+
+        if not owner:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            with self._lock:
+                self.shared += 1
+                self.bytes_saved += len(flight.value.encode())
+            return flight.value
+
+        try:
+            value = compute()
+            self.put(key, value)
+            flight.value = value
+            return value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
+
+    async def aget_or_compute(self, key: str,
+                              compute: Callable[[], Awaitable[str]]) -> str:
+        """Async get_or_compute: concurrent coroutines on one loop share a call."""
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        loop = asyncio.get_running_loop()
+        slot = (id(loop), key)
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                self.memory_hits += 1
+                self.bytes_saved += len(self._memory[key].encode())
+                return self._memory[key]
+            future = self._ainflight.get(slot)
+            owner = future is None
+            if owner:
+                future = loop.create_future()
+                self._ainflight[slot] = future
+                self.misses += 1
+
+        if not owner:
+            value = await asyncio.shield(future)
+            with self._lock:
+                self.shared += 1
+                self.bytes_saved += len(value.encode())
+            return value
+
+        try:
+            value = await compute()
+            self.put(key, value)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved; waiters (if any) still see it
+            raise
+        finally:
+            with self._lock:
+                self._ainflight.pop(slot, None)
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up key in memory, then on disk. Counts a hit or a miss."""
+        value = self._lookup(key)
+        if value is None:
+            with self._lock:
+                self.misses += 1
+        return value
+
+    def _lookup(self, key: str) -> Optional[str]:
+        """Look up key in both tiers, counting hits but not misses."""
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                self.memory_hits += 1
+                self.bytes_saved += len(value.encode())
+                return value
+
+        value = self._disk_get(key)
+        if value is None:
+            return None
+        with self._lock:
+            self.hits += 1
+            self.disk_hits += 1
+            self.bytes_saved += len(value.encode())
+            self._memory_put(key, value)
+        return value
+
+    def put(self, key: str, value: str):
+        """Store a response in both tiers."""
+        if not value:
+            return
+        with self._lock:
+            self._memory_put(key, value)
+        self._disk_put(key, value)
+
+    def discard(self, key: str):
+        """Forget one response in both tiers."""
+        with self._lock:
+            self._memory.pop(key, None)
+        if self.cache_dir:
+            self._disk_remove(self._path_for(key))
+
+    def stats(self) -> dict:
+        """Counters describing how much work the cache saved."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "shared_inflight": self.shared,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+                "bytes_saved": self.bytes_saved,
+                "memory_entries": len(self._memory),
+            }
+
+    def clear(self):
+        """Drop every cached response (memory and disk)."""
+        with self._lock:
+            self._memory.clear()
+            self._disk_bytes = 0
+        if self.cache_dir and self.cache_dir.exists():
+            for path in self.cache_dir.glob("*/*.json"):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    # ── Memory tier ──────────────────────────────────────────────────────────
+
+    def _memory_put(self, key: str, value: str):
+        """Insert into the LRU. Caller must hold self._lock."""
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    # ── Disk tier ────────────────────────────────────────────────────────────
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _disk_get(self, key: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        path = self._path_for(key)
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        created = entry.get("created", 0)
+        if self.ttl_seconds and time.time() - created > self.ttl_seconds:
+            self._disk_remove(path)
+            return None
+
+        # Record the read in atime for LRU eviction; mtime stays the creation time
+        try:
+            os.utime(path, (time.time(), created))
+        except OSError:
+            pass
+        return entry.get("response")
+
+    def _disk_put(self, key: str, value: str):
+        if not self.cache_dir or self.max_disk_bytes <= 0:
+            return
+        path = self._path_for(key)
+        created = time.time()
+        data = json.dumps({"created": created, "response": value})
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp.write_text(data)
+            os.utime(tmp, (created, created))
+            os.replace(tmp, path)
+        except OSError:
+            return
+
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = self._scan_disk_bytes()
+            else:
+                self._disk_bytes += len(data)
+            over = self._disk_bytes > self.max_disk_bytes
+        if over:
+            self._evict_disk()
+
+    def _scan_disk_bytes(self) -> int:
+        total = 0
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                total += path.stat().st_size
+            except OSError:
+                pass
+        return total
+
+    def _disk_remove(self, path: Path):
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except OSError:
+            return
+        with self._lock:
+            if self._disk_bytes is not None:
+                self._disk_bytes = max(0, self._disk_bytes - size)
+
+    def _evict_disk(self):
+        """Delete expired entries, then least-recently-used until under budget.
+
+        Expiry uses mtime (the creation time, as in _disk_get); recency uses atime.
+        """
+        entries = []
+        now = time.time()
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            expired = bool(self.ttl_seconds) and now - st.st_mtime > self.ttl_seconds
+            entries.append((not expired, st.st_atime, st.st_size, path))
+
+        total = sum(size for _, _, size, _ in entries)
+        # Evict down to 90% of the budget so we don't rescan on every write
+        target = int(self.max_disk_bytes * 0.9)
+        for fresh, _, size, path in sorted(entries):
+            if total <= target and fresh:
+                break
+            try:
+                path.unlink()
+                total -= size
+            except OSError:
+                pass
+
+        with self._lock:
+            self._disk_bytes = total
+
+
+def response_cache_from_config(config: dict) -> Optional[ResponseCache]:
+    """Build a ResponseCache from the `cache:` section of ~/.forge/config.yaml.
+
+    Caching is on by default; set `cache: {enabled: false}` to turn it off.
+    """
+    settings = config.get("cache") or {}
+    if settings.get("enabled", True) is False:
+        return None
+
+    cache_dir = settings.get("dir")
+    ttl_days = settings.get("ttl_days", DEFAULT_TTL_DAYS)
+    return ResponseCache(
+        cache_dir=Path(cache_dir).expanduser() if cache_dir else CACHE_DIR,
+        max_memory_entries=int(settings.get("memory_entries", DEFAULT_MEMORY_ENTRIES)),
+        max_disk_bytes=int(float(settings.get("max_disk_mb", DEFAULT_MAX_DISK_MB)) * 1024 * 1024),
+        ttl_seconds=float(ttl_days) * 86400 if ttl_days else None,
+    )
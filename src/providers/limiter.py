@@ -0,0 +1,265 @@
+"""Per-provider rate limiting -- token buckets plus adaptive concurrency.
+
+Every provider instance for the same account (provider name, base URL and
+API key) shares one RateLimiter, so parallel agents, the task scheduler's
+worker threads and ADK tools all draw from the same budget instead of
+each discovering the limit by hitting 429s.
+
+Before a call, acquire() waits until:
+  - the request bucket (rpm) holds a request,
+  - the token bucket (tpm) covers the prompt's estimated tokens, and
+  - fewer than `limit` calls are in flight.
+
+`limit` adapts AIMD-style: each success adds 1/limit (about +1 per round
+of calls) up to max_concurrency; a 429 or overload halves it and pauses
+new calls for the server's Retry-After. Output tokens are charged to the
+token bucket after the call, which may drive it negative and delay the
+next calls until it refills.
+
+Limits come from the provider entry in ~/.forge/config.yaml:
+
+    providers:
+      - name: anthropic
+        rpm: 50                # requests per minute
+        tpm: 40000             # tokens per minute (input + output)
+        max_concurrency: 8     # ceiling for adaptive concurrency
+
+Errors are classified by each provider's SDK exception types (see
+BaseProvider.classify_error); classify_http() covers plain httpx/requests.
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from .prompt import text_of
+
+DEFAULT_MAX_CONCURRENCY = 16
+MAX_RETRY_AFTER = 120.0   # seconds; longer server hints are capped
+POLL_INTERVAL = 0.05      # seconds between async admission checks
+
+# Transient failure kinds; the first two mean "slow down"
+THROTTLED = ("rate_limit", "overloaded")
+
+
+@dataclass(frozen=True)
+class Transient:
+    """A retryable provider failure."""
+    kind: str                             # rate_limit | overloaded | timeout | connection | server
+    retry_after: Optional[float] = None   # seconds, from the response headers
+
+    @property
+    def throttled(self) -> bool:
+        return self.kind in THROTTLED
+
+
+def estimate_tokens(messages: list[dict], system="") -> int:
+    """Rough prompt size in tokens (~4 characters per token)."""
+    chars = len(text_of(system)) + sum(len(text_of(m.get("content", ""))) for m in messages)
+    return chars // 4
+
+
+def status_kind(status: Optional[int]) -> Optional[str]:
+    """Transient kind for an HTTP status code, or None if not retryable."""
+    if status is None:
+        return None
+    if status == 429:
+        return "rate_limit"
+    if status in (503, 529):
+        return "overloaded"
+    if status == 408:
+        return "timeout"
+    if status >= 500:
+        return "server"
+    return None
+
+
+def retry_after(response) -> Optional[float]:
+    """Seconds to wait from Retry-After / retry-after-ms response headers."""
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return min(MAX_RETRY_AFTER, max(0.0, float(value) / 1000))
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        seconds = (when - datetime.now(timezone.utc)).total_seconds()
+    return min(MAX_RETRY_AFTER, max(0.0, seconds))
+
+
+def classify_http(e: Exception) -> Optional[Transient]:
+    """Classify httpx / requests exceptions; None if the error is permanent."""
+    response = getattr(e, "response", None)
+    try:
+        import httpx
+    except ImportError:
+        httpx = None
+    if httpx is not None:
+        if isinstance(e, httpx.TimeoutException):
+            return Transient("timeout")
+        if isinstance(e, httpx.TransportError):
+            return Transient("connection")
+        if isinstance(e, httpx.HTTPStatusError):
+            kind = status_kind(e.response.status_code)
+            return Transient(kind, retry_after(response)) if kind else None
+    try:
+        import requests
+    except ImportError:
+        requests = None
+    if requests is not None:
+        if isinstance(e, requests.Timeout):
+            return Transient("timeout")
+        if isinstance(e, requests.ConnectionError):
+            return Transient("connection")
+        if isinstance(e, requests.HTTPError) and response is not None:
+            kind = status_kind(response.status_code)
+            return Transient(kind, retry_after(response)) if kind else None
+    if isinstance(e, TimeoutError):
+        return Transient("timeout")
+    if isinstance(e, ConnectionError):
+        return Transient("connection")
+    return None
+
+
+class RateLimiter:
+    """Request/token buckets and an adaptive in-flight limit, shared across threads."""
+
+    def __init__(self, rpm: Optional[int] = None, tpm: Optional[int] = None,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = float(self.max_concurrency)
+        self.in_flight = 0
+        self._requests = float(rpm or 0)
+        self._tokens = float(tpm or 0)
+        self._refilled = time.monotonic()
+        self._paused_until = 0.0
+        self._cond = threading.Condition()
+        self.calls = 0
+        self.throttled = 0
+
+    # ── Admission ─────────────────────────────────────────────────────────────
+
+    def acquire(self, tokens: int = 0):
+        """Block until a call estimated at `tokens` prompt tokens may start."""
+        with self._cond:
+            while True:
+                wait = self._try_take(tokens)
+                if wait == 0:
+                    return
+                self._cond.wait(wait)
+
+    async def aacquire(self, tokens: int = 0):
+        """acquire() without blocking the event loop."""
+        while True:
+            with self._cond:
+                wait = self._try_take(tokens)
+            if wait == 0:
+                return
+            await asyncio.sleep(min(wait, POLL_INTERVAL))
+
+    def release(self, tokens: int = 0, failure: Optional[Transient] = None,
+                ok: bool = True, pause: Optional[float] = None):
+        """Finish a call started with acquire().
+
+        `tokens` are charged on top of the prompt estimate (the output).
+        A throttled `failure` halves the concurrency limit and stops new
+        calls for `pause` seconds; a successful call (`ok`) raises the
+        limit additively. Other errors leave the limit alone.
+        """
+        with self._cond:
+            self.in_flight -= 1
+            if self.tpm:
+                self._tokens -= tokens
+            if failure is not None and failure.throttled:
+                self.throttled += 1
+                self.limit = max(1.0, self.limit / 2)
+                if pause:
+                    self._paused_until = max(self._paused_until, time.monotonic() + pause)
+                if failure.kind == "rate_limit" and self.rpm:
+                    self._requests = min(self._requests, 0.0)
+            elif ok:
+                self.limit = min(float(self.max_concurrency), self.limit + 1 / self.limit)
+            self._cond.notify_all()
+
+    def _try_take(self, tokens: int) -> float:
+        """Take a slot and return 0, or return the seconds to wait. Lock held."""
+        now = time.monotonic()
+        self._refill(now)
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self.in_flight >= int(self.limit):
+            return 1.0  # woken by release()
+        if self.rpm and self._requests < 1:
+            return (1 - self._requests) * 60 / self.rpm
+        need = min(tokens, self.tpm) if self.tpm else 0
+        if self.tpm and self._tokens < need:
+            return (need - self._tokens) * 60 / self.tpm
+        self.in_flight += 1
+        self.calls += 1
+        if self.rpm:
+            self._requests -= 1
+        if self.tpm:
+            self._tokens -= tokens
+        return 0
+
+    def _refill(self, now: float):
+        elapsed = now - self._refilled
+        self._refilled = now
+        if self.rpm:
+            self._requests = min(float(self.rpm), self._requests + elapsed * self.rpm / 60)
+        if self.tpm:
+            self._tokens = min(float(self.tpm), self._tokens + elapsed * self.tpm / 60)
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "calls": self.calls,
+                "throttled": self.throttled,
+                "in_flight": self.in_flight,
+                "concurrency_limit": int(self.limit),
+            }
+
+
+_limiters: dict = {}
+_limiters_lock = threading.Lock()
+
+
+def limiter_for(config) -> RateLimiter:
+    """The shared RateLimiter for a ProviderConfig's account.
+
+    Providers configured with the same name, base URL and API key share
+    one limiter; its limits come from the first config seen.
+    """
+    key_hash = hashlib.sha256((config.api_key or "").encode()).hexdigest()[:16]
+    key = (config.name.lower(), config.base_url or "", key_hash)
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = RateLimiter(
+                rpm=config.rpm,
+                tpm=config.tpm,
+                max_concurrency=config.max_concurrency or DEFAULT_MAX_CONCURRENCY,
+            )
+            _limiters[key] = limiter
+        return limiter
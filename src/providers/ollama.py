@@ -1,9 +1,11 @@
 """Ollama local model provider."""
 
 import json
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
 from .base import BaseProvider, ProviderConfig
+from .prompt import text_of
+from .usage import Usage
 
 
 class OllamaProvider(BaseProvider):
@@ -12,29 +14,48 @@ class OllamaProvider(BaseProvider):
         super().__init__(config)
         self.base_url = (config.base_url or "http://localhost:11434").rstrip("/")
 
-    def chat(self, messages: list[dict], system: str = "") -> str:
-        import requests
+    def _payload(self, messages: list[dict], system, stream: bool) -> dict:
         msgs = []
         if system:
-            msgs.append({"role": "system", "content": system})
-        msgs.extend(messages)
+            msgs.append({"role": "system", "content": text_of(system)})
+        msgs.extend({**m, "content": text_of(m["content"])} for m in messages)
+        return {"model": self.config.model, "messages": msgs, "stream": stream}
+
+    def _record(self, data: dict):
+        """Record usage from a final (done) response object."""
+        if data.get("done"):
+            self._record_usage(Usage(
+                input_tokens=data.get("prompt_eval_count") or 0,
+                output_tokens=data.get("eval_count") or 0,
+            ))
+
+    def _aclient(self):
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "httpx is required for async Ollama calls. "
+                "Install with: pip install 'forge-ai[ollama]'"
+            )
+        return self._async_client(lambda: httpx.AsyncClient(base_url=self.base_url, timeout=300))
+
+    def chat(self, messages: list[dict], system: str = "") -> str:
+        import requests
         response = requests.post(
             f"{self.base_url}/api/chat",
-            json={"model": self.config.model, "messages": msgs, "stream": False},
+            json=self._payload(messages, system, stream=False),
             timeout=300,
         )
         response.raise_for_status()
-        return response.json()["message"]["content"]
+        data = response.json()
+        self._record(data)
+        return data["message"]["content"]
 
     def stream(self, messages: list[dict], system: str = "") -> Generator[str, None, None]:
         import requests
-        msgs = []
-        if system:
-            msgs.append({"role": "system", "content": system})
-        msgs.extend(messages)
         response = requests.post(
             f"{self.base_url}/api/chat",
-            json={"model": self.config.model, "messages": msgs, "stream": True},
+            json=self._payload(messages, system, stream=True),
             stream=True,
             timeout=300,
         )
@@ -42,5 +63,30 @@ class OllamaProvider(BaseProvider):
         for line in response.iter_lines():
             if line:
                 data = json.loads(line)
+                self._record(data)
                 if "message" in data:
                     yield data["message"].get("content", "")
+
+    async def achat(self, messages: list[dict], system: str = "") -> str:
+        response = await self._aclient().post(
+            "/api/chat",
+            json=self._payload(messages, system, stream=False),
+        )
+        response.raise_for_status()
+        data = response.json()
+        self._record(data)
+        return data["message"]["content"]
+
+    async def astream(self, messages: list[dict], system: str = "") -> AsyncGenerator[str, None]:
+        async with self._aclient().stream(
+            "POST",
+            "/api/chat",
+            json=self._payload(messages, system, stream=True),
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if line:
+                    data = json.loads(line)
+                    self._record(data)
+                    if "message" in data:
+                        yield data["message"].get("content", "")
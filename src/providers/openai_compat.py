@@ -1,8 +1,16 @@
-"""OpenAI-compatible provider (covers OpenAI, Together AI, Groq)."""
+"""OpenAI-compatible provider (covers OpenAI, Together AI, Groq).
 
-from typing import Generator
+Segmented prompts are sent as plain text in segment order; OpenAI caches
+long identical prefixes automatically and reports the cached share in
+usage.prompt_tokens_details.
+"""
+
+from typing import AsyncGenerator, Generator, Optional
 
 from .base import BaseProvider, ProviderConfig
+from .limiter import Transient, retry_after, status_kind
+from .prompt import text_of
+from .usage import Usage
 
 BASE_URLS = {
     "together": "https://api.together.xyz/v1",
@@ -15,35 +23,100 @@ class OpenAIProvider(BaseProvider):
     def __init__(self, config: ProviderConfig):
         super().__init__(config)
         from openai import OpenAI
-        base_url = config.base_url or BASE_URLS.get(config.name.lower())
-        kwargs = {"api_key": config.api_key}
+        self.client = OpenAI(**self._client_kwargs())
+
+    def _client_kwargs(self) -> dict:
+        base_url = self.config.base_url or BASE_URLS.get(self.config.name.lower())
+        kwargs = {"api_key": self.config.api_key}
         if base_url:
             kwargs["base_url"] = base_url
-        self.client = OpenAI(**kwargs)
+        return kwargs
 
-    def chat(self, messages: list[dict], system: str = "") -> str:
+    def _aclient(self):
+        from openai import AsyncOpenAI
+        return self._async_client(lambda: AsyncOpenAI(**self._client_kwargs()))
+
+    def _build_messages(self, messages: list[dict], system) -> list[dict]:
         msgs = []
         if system:
-            msgs.append({"role": "system", "content": system})
-        msgs.extend(messages)
+            msgs.append({"role": "system", "content": text_of(system)})
+        msgs.extend({**m, "content": text_of(m["content"])} for m in messages)
+        return msgs
+
+    def _stream_kwargs(self) -> dict:
+        # Only OpenAI itself is known to accept stream_options
+        if self.config.name.lower() == "openai" and not self.config.base_url:
+            return {"stream": True, "stream_options": {"include_usage": True}}
+        return {"stream": True}
+
+    def _record(self, usage):
+        if usage is None:
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = (getattr(details, "cached_tokens", None) or 0) if details else 0
+        self._record_usage(Usage(
+            input_tokens=(usage.prompt_tokens or 0) - cached,
+            output_tokens=usage.completion_tokens or 0,
+            cache_read_tokens=cached,
+        ))
+
+    def classify_error(self, e: Exception) -> Optional[Transient]:
+        import openai
+        wait = retry_after(getattr(e, "response", None))
+        if isinstance(e, openai.RateLimitError):
+            # Quota exhaustion is also a 429 but will not clear by waiting
+            if getattr(e, "code", None) == "insufficient_quota":
+                return None
+            return Transient("rate_limit", wait)
+        if isinstance(e, openai.APITimeoutError):
+            return Transient("timeout")
+        if isinstance(e, openai.APIConnectionError):
+            return Transient("connection")
+        if isinstance(e, openai.APIStatusError):
+            kind = status_kind(e.status_code)
+            return Transient(kind, wait) if kind else None
+        return super().classify_error(e)
+
+    def chat(self, messages: list[dict], system: str = "") -> str:
         response = self.client.chat.completions.create(
             model=self.config.model,
-            messages=msgs,
+            messages=self._build_messages(messages, system),
             max_tokens=self.config.max_tokens,
         )
+        self._record(response.usage)
         return response.choices[0].message.content
 
     def stream(self, messages: list[dict], system: str = "") -> Generator[str, None, None]:
-        msgs = []
-        if system:
-            msgs.append({"role": "system", "content": system})
-        msgs.extend(messages)
         response = self.client.chat.completions.create(
             model=self.config.model,
-            messages=msgs,
+            messages=self._build_messages(messages, system),
             max_tokens=self.config.max_tokens,
-            stream=True,
+            **self._stream_kwargs(),
         )
         for chunk in response:
-            if chunk.choices[0].delta.content:
+            if getattr(chunk, "usage", None):
+                self._record(chunk.usage)
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    async def achat(self, messages: list[dict], system: str = "") -> str:
+        response = await self._aclient().chat.completions.create(
+            model=self.config.model,
+            messages=self._build_messages(messages, system),
+            max_tokens=self.config.max_tokens,
+        )
+        self._record(response.usage)
+        return response.choices[0].message.content
+
+    async def astream(self, messages: list[dict], system: str = "") -> AsyncGenerator[str, None]:
+        response = await self._aclient().chat.completions.create(
+            model=self.config.model,
+            messages=self._build_messages(messages, system),
+            max_tokens=self.config.max_tokens,
+            **self._stream_kwargs(),
+        )
+        async for chunk in response:
+            if getattr(chunk, "usage", None):
+                self._record(chunk.usage)
+            if chunk.choices and chunk.choices[0].delta.content:
                 yield chunk.choices[0].delta.content
@@ -0,0 +1,104 @@
+"""Structured prompts -- text segments marked as cacheable.
+
+A message's content (and the system prompt) may be a plain string or a
+list of segments:
+
+    [{"type": "text", "text": "## Project Specification ...", "cache": True},
+     {"type": "text", "text": "## Current Task ..."}]
+
+Cacheable segments hold the stable prefix that many calls in a build
+share: spec, rules, architecture decisions. Agents put them first, built
+by project_prefix() so the bytes are identical from call to call and
+from agent to agent; whatever varies per call goes after them.
+
+  - AnthropicProvider turns the end of each cacheable run into a
+    `cache_control` breakpoint (anthropic_system / anthropic_messages),
+    so later calls read the prefix from the prompt cache.
+  - OpenAI-compatible and Ollama providers send text_of(content); the
+    unchanged leading bytes are what automatic prefix caching matches.
+"""
+
+from typing import Optional, Union
+
+Content = Union[str, list]
+
+# Anthropic accepts at most four cache_control blocks per request
+MAX_BREAKPOINTS = 4
+EPHEMERAL = {"type": "ephemeral"}
+
+# Segments read as consecutive sections; providers without content blocks
+# join them with a blank line
+SEPARATOR = "\n\n"
+
+
+def segment(text: str, cache: bool = False) -> dict:
+    seg = {"type": "text", "text": text}
+    if cache:
+        seg["cache"] = True
+    return seg
+
+
+def project_prefix(spec: str, rules: Optional[str] = None,
+                   decisions: Optional[str] = None) -> dict:
+    """The cacheable spec/rules/decisions block every agent prompt starts with."""
+    parts = [f"## Project Specification\n{spec}"]
+    if rules is not None:
+        parts.append(f"## Build Rules\n{rules}")
+    if decisions is not None:
+        parts.append(f"## Architecture Decisions\n{decisions}")
+    return segment("\n\n".join(parts), cache=True)
+
+
+def text_of(content: Content) -> str:
+    """Plain text of a string or segment list (segments joined by a blank line)."""
+    if isinstance(content, str):
+        return content
+    return SEPARATOR.join(seg.get("text", "") for seg in content if seg.get("text"))
+
+
+def anthropic_system(system: Content):
+    """System prompt for the Messages API; the whole system is one cached block."""
+    if not system:
+        return system
+    if isinstance(system, str):
+        return [{"type": "text", "text": system, "cache_control": EPHEMERAL}]
+    return _blocks(system, _run_ends(system))
+
+
+def anthropic_messages(messages: list[dict], breakpoints: int = MAX_BREAKPOINTS - 1) -> list[dict]:
+    """Messages with segment lists turned into content blocks.
+
+    The last `breakpoints` ends of cacheable runs get cache_control; the
+    cache covers everything before a breakpoint, so only run ends matter.
+    """
+    ends = [(i, j) for i, m in enumerate(messages) if isinstance(m.get("content"), list)
+            for j in _run_ends(m["content"])]
+    keep = set(ends[-breakpoints:]) if breakpoints > 0 else set()
+    out = []
+    for i, m in enumerate(messages):
+        content = m.get("content")
+        if isinstance(content, list):
+            marked = [j for (mi, j) in keep if mi == i]
+            m = {**m, "content": _blocks(content, marked)}
+        out.append(m)
+    return out
+
+
+def _run_ends(segments: list) -> list[int]:
+    """Indexes of cacheable segments followed by a non-cacheable one (or the end)."""
+    return [
+        j for j, seg in enumerate(segments)
+        if seg.get("cache") and (j + 1 == len(segments) or not segments[j + 1].get("cache"))
+    ]
+
+
+def _blocks(segments: list, marked) -> list[dict]:
+    blocks = []
+    for j, seg in enumerate(segments):
+        if not seg.get("text"):
+            continue  # the API rejects empty text blocks
+        block = {"type": "text", "text": seg.get("text", "")}
+        if j in marked:
+            block["cache_control"] = EPHEMERAL
+        blocks.append(block)
+    return blocks
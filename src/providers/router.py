@@ -0,0 +1,366 @@
+"""Routing across several providers -- failover, hedging and health scoring.
+
+RouterProvider is a BaseProvider over an ordered list of configured
+providers. Every call goes to the provider the routing policy ranks first;
+if it fails (after that provider's own retries), the call fails over to
+the next one. Providers that keep failing are put on cooldown and only
+tried when nothing healthier is left.
+
+Policies (`routing.policy` in ~/.forge/config.yaml):
+  priority       -- the order providers are listed in
+  least-latency  -- lowest recent latency, penalised by recent error rate
+  weighted       -- random pick proportional to `routing.weights`
+
+Latency is kept in two windows per provider: total latency of chat
+calls, and time to the first chunk of streams. Chats are hedged and
+ranked on the first, streams on the second.
+
+With hedging on, a call the first provider has not answered within the
+hedge delay (its p95 latency, or a fixed `hedge_after` in seconds) is also
+sent to the runner-up, and whichever answers first wins. For streams the
+race is to the first chunk; the losing stream is closed. A losing sync
+chat request cannot be aborted and still completes in the background.
+
+    routing:
+      enabled: true
+      providers: [anthropic, openai]   # default: every provider with an API key
+      policy: priority
+      weights: {anthropic: 3, openai: 1}
+      hedge: true
+      hedge_after: p95                 # or seconds, e.g. 20
+"""
+
+import asyncio
+import contextvars
+import queue
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass, field
+from typing import AsyncGenerator, Generator, Optional
+
+from .base import BaseProvider, ProviderConfig
+
+POLICIES = ("priority", "least-latency", "weighted")
+
+LATENCY_WINDOW = 100        # latency samples kept per provider and kind
+LATENCY_KINDS = ("chat", "stream")  # total chat latency; time to first stream chunk
+MIN_HEDGE_SAMPLES = 10      # no p95 hedging before this many samples
+FAILURES_TO_COOLDOWN = 3    # consecutive failures before a cooldown
+COOLDOWN = 30.0             # seconds; doubles per further failure
+MAX_COOLDOWN = 300.0
+
+
+@dataclass
+class RouterConfig(ProviderConfig):
+    """ProviderConfig for a router; `routes` are the member providers."""
+    routes: list = field(default_factory=list)
+    policy: str = "priority"
+    weights: dict = field(default_factory=dict)
+    hedge: bool = False
+    hedge_after: Optional[float] = None  # seconds; None = p95 of observed latency
+
+    def __str__(self):
+        return f"router[{self.policy}] ({', '.join(str(r) for r in self.routes)})"
+
+
+class ProviderHealth:
+    """Latency and error history for one routed provider.
+
+    Chat latencies and stream first-chunk latencies are kept apart: a
+    stream's first chunk comes long before a chat's full answer, so one
+    window would make hedge delays and rankings depend on the call mix.
+    """
+
+    def __init__(self):
+        self.latencies = {kind: deque(maxlen=LATENCY_WINDOW) for kind in LATENCY_KINDS}
+        self.error_rate = 0.0  # EWMA over calls
+        self.consecutive_failures = 0
+        self.cooldown_until = 0.0
+        self.calls = 0
+        self.failures = 0
+        self._lock = threading.Lock()
+
+    def success(self, latency: float, kind: str = "chat"):
+        with self._lock:
+            self.calls += 1
+            self.latencies[kind].append(latency)
+            self.error_rate *= 0.9
+            self.consecutive_failures = 0
+            self.cooldown_until = 0.0
+
+    def failure(self):
+        with self._lock:
+            self.calls += 1
+            self.failures += 1
+            self.error_rate = 0.9 * self.error_rate + 0.1
+            self.consecutive_failures += 1
+            extra = self.consecutive_failures - FAILURES_TO_COOLDOWN
+            if extra >= 0:
+                self.cooldown_until = time.monotonic() + min(MAX_COOLDOWN, COOLDOWN * 2 ** extra)
+
+    @property
+    def cooling_down(self) -> bool:
+        return time.monotonic() < self.cooldown_until
+
+    def mean_latency(self, kind: str = "chat") -> float:
+        with self._lock:
+            window = self.latencies[kind]
+            return sum(window) / len(window) if window else 0.0
+
+    def p95(self, kind: str = "chat") -> Optional[float]:
+        with self._lock:
+            if len(self.latencies[kind]) < MIN_HEDGE_SAMPLES:
+                return None
+            ordered = sorted(self.latencies[kind])
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    def stats(self) -> dict:
+        data = {
+            "calls": self.calls,
+            "failures": self.failures,
+            "error_rate": round(self.error_rate, 3),
+        }
+        for kind in LATENCY_KINDS:
+            p95 = self.p95(kind)
+            data[f"{kind}_mean_latency"] = round(self.mean_latency(kind), 2)
+            data[f"{kind}_p95_latency"] = round(p95, 2) if p95 is not None else None
+        data["cooling_down"] = self.cooling_down
+        return data
+
+
+class RouterProvider(BaseProvider):
+    """A BaseProvider that spreads calls over several providers."""
+
+    def __init__(self, config: RouterConfig, providers: list[BaseProvider]):
+        if not providers:
+            raise ValueError("Router needs at least one provider")
+        self.providers = providers
+        super().__init__(config)
+        self.health = {id(p): ProviderHealth() for p in providers}
+
+    @property
+    def usage(self):
+        return self._usage
+
+    @usage.setter
+    def usage(self, meter):
+        # One meter for the router and its members: each member records the
+        # calls it served, under its own provider and model
+        self._usage = meter
+        for p in self.providers:
+            p.usage = meter
+
+    # ── Routing ───────────────────────────────────────────────────────────────
+
+    def _order(self, kind: str = "chat") -> list[BaseProvider]:
+        """Providers to try for a `kind` call, best first; those on cooldown go last."""
+        policy = self.config.policy
+        providers = list(self.providers)
+        if policy == "least-latency":
+            providers.sort(key=lambda p: self._health(p).mean_latency(kind)
+                           * (1 + 4 * self._health(p).error_rate))
+        elif policy == "weighted":
+            providers = self._weighted(providers)
+        return sorted(providers, key=lambda p: self._health(p).cooling_down)
+
+    def _weighted(self, providers: list[BaseProvider]) -> list[BaseProvider]:
+        """Weighted random order: each pick proportional to weight × success rate."""
+        remaining, ordered = list(providers), []
+        while remaining:
+            weights = [
+                max(0.0, float(self.config.weights.get(p.config.name, 1)))
+                * (1 - self._health(p).error_rate) + 1e-9
+                for p in remaining
+            ]
+            pick = random.choices(remaining, weights)[0]
+            remaining.remove(pick)
+            ordered.append(pick)
+        return ordered
+
+    def _health(self, provider: BaseProvider) -> ProviderHealth:
+        return self.health[id(provider)]
+
+    def _hedge_delay(self, provider: BaseProvider, kind: str = "chat") -> Optional[float]:
+        if not self.config.hedge or len(self.providers) < 2:
+            return None
+        if self.config.hedge_after is not None:
+            return self.config.hedge_after
+        return self._health(provider).p95(kind)
+
+    def _failed(self, provider: BaseProvider, e: BaseException, others: bool):
+        self._health(provider).failure()
+        if others:
+            print(f"   WARNING: {provider.config} failed ({e}); failing over")
+
+    def stats(self) -> dict:
+        return {str(p.config): self._health(p).stats() for p in self.providers}
+
+    # ── Calls ─────────────────────────────────────────────────────────────────
+
+    def chat(self, messages: list[dict], system: str = "") -> str:
+        return self._chat_with_backoff(messages, system, max_retries=1)
+
+    def stream(self, messages: list[dict], system: str = "") -> Generator[str, None, None]:
+        return self._stream_with_backoff(messages, system, max_retries=1)
+
+    async def achat(self, messages: list[dict], system: str = "") -> str:
+        return await self._achat_with_backoff(messages, system, max_retries=1)
+
+    async def astream(self, messages: list[dict], system: str = "") -> AsyncGenerator[str, None]:
+        # Native async streaming is not routed; drain the routed sync stream
+        async for chunk in super().astream(messages, system):
+            yield chunk
+
+    def _timed_chat(self, provider: BaseProvider, messages, system, max_retries) -> str:
+        started = time.monotonic()
+        text = provider._chat_with_backoff(messages, system, max_retries)
+        self._health(provider).success(time.monotonic() - started)
+        return text
+
+    def _chat_with_backoff(self, messages: list[dict], system: str, max_retries: int) -> str:
+        order = self._order()
+        pending: dict = {}  # future → provider
+        error: Optional[BaseException] = None
+        launch = True
+        while order or pending:
+            if launch and order:
+                provider = order.pop(0)
+                pending[_in_thread(self._timed_chat, provider, messages,
+                                   system, max_retries)] = provider
+            # Wait for an answer; past the hedge delay, start the next provider too
+            delay = self._hedge_delay(provider) if order else None
+            done, _ = wait(pending, timeout=delay, return_when=FIRST_COMPLETED)
+            for future in done:
+                finished = pending.pop(future)
+                try:
+                    return future.result()
+                except Exception as e:
+                    error = e
+                    self._failed(finished, e, others=bool(order or pending))
+            # Hedge on timeout; fail over once nothing is left in flight
+            launch = not done or not pending
+        raise error
+
+    async def _achat_with_backoff(self, messages: list[dict], system: str,
+                                  max_retries: int) -> str:
+        order = self._order()
+        pending: dict = {}  # task → provider
+        error: Optional[BaseException] = None
+
+        async def _timed(provider):
+            started = time.monotonic()
+            text = await provider._achat_with_backoff(messages, system, max_retries)
+            self._health(provider).success(time.monotonic() - started)
+            return text
+
+        try:
+            launch = True
+            while order or pending:
+                if launch and order:
+                    provider = order.pop(0)
+                    pending[asyncio.ensure_future(_timed(provider))] = provider
+                delay = self._hedge_delay(provider) if order else None
+                done, _ = await asyncio.wait(pending, timeout=delay,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    finished = pending.pop(task)
+                    try:
+                        return task.result()
+                    except Exception as e:
+                        error = e
+                        self._failed(finished, e, others=bool(order or pending))
+                launch = not done or not pending
+        finally:
+            for task in pending:
+                task.cancel()  # the hedge that lost
+        raise error
+
+    def _stream_with_backoff(self, messages: list[dict], system: str,
+                             max_retries: int) -> Generator[str, None, None]:
+        """Race providers to the first chunk, then stream from the winner.
+
+        Failover happens only before the first chunk; a stream that breaks
+        after text has been yielded raises, as in BaseProvider.
+        """
+        order = self._order("stream")
+        events: queue.Queue = queue.Queue()
+        stops: dict = {}  # provider → threading.Event
+        error: Optional[BaseException] = None
+        winner = None
+
+        def _pump(provider, stop):
+            started = time.monotonic()
+            first = True
+            try:
+                for chunk in provider._stream_with_backoff(messages, system, max_retries):
+                    if stop.is_set():
+                        return
+                    if first:
+                        self._health(provider).success(time.monotonic() - started, "stream")
+                        first = False
+                    events.put((provider, chunk))
+                events.put((provider, _END))
+            except BaseException as e:
+                events.put((provider, e))
+
+        def _start(provider):
+            stops[provider] = threading.Event()
+            context = contextvars.copy_context()  # keeps the caller's usage scope
+            threading.Thread(target=context.run, args=(_pump, provider, stops[provider]),
+                             name=f"forge-route-{provider.config.name}", daemon=True).start()
+
+        try:
+            _start(order.pop(0))
+            while stops:
+                current = list(stops)[-1]
+                delay = self._hedge_delay(current, "stream") if order and winner is None else None
+                try:
+                    provider, item = events.get(timeout=delay)
+                except queue.Empty:
+                    _start(order.pop(0))  # hedge: the first chunk is late
+                    continue
+                if provider not in stops:
+                    continue  # a stopped loser
+                if winner is None and isinstance(item, BaseException):
+                    error = item
+                    del stops[provider]
+                    self._failed(provider, item, others=bool(order or stops))
+                    if order and not stops:
+                        _start(order.pop(0))
+                    continue
+                if winner is None:
+                    winner = provider
+                    for other in [p for p in stops if p is not provider]:
+                        stops.pop(other).set()
+                if item is _END:
+                    return
+                if isinstance(item, BaseException):
+                    self._health(provider).failure()
+                    raise item
+                yield item
+        finally:
+            for stop in stops.values():
+                stop.set()
+        if error is not None:
+            raise error
+
+
+_END = object()
+
+
+def _in_thread(fn, *args) -> Future:
+    """Run fn on a daemon thread, so a losing hedge never delays exit."""
+    future: Future = Future()
+    context = contextvars.copy_context()
+
+    def _run():
+        try:
+            future.set_result(context.run(fn, *args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=_run, name="forge-route", daemon=True).start()
+    return future
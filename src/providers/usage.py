@@ -0,0 +1,286 @@
+"""Token usage, latency and cost of provider calls.
+
+BaseProvider's *_with_retry paths time every call and collect the Usage
+the provider reports during it into a CallRecord: tokens (including
+prompt-cache reads/writes), total latency, time to first token for
+streams, retries and model. The record is tagged with the agent and task
+from usage_scope() and added to the provider's UsageMeter, which keeps
+UsageStats per agent → model and per task → model.
+
+Agents open the agent scope around their calls; the orchestrator opens
+the task scope around each task, so every call lands in both breakdowns:
+
+    with usage_scope(task=task.id):
+        coder.generate_files(...)       # recorded as agent "coder", this task
+
+Cost is estimated from a price table in $ per million tokens, keyed by
+model name prefix. DEFAULT_PRICES can be overridden or extended with a
+`pricing:` section in ~/.forge/config.yaml:
+
+    pricing:
+      claude-sonnet-4: {input: 3.0, output: 15.0, cache_read: 0.3, cache_write: 3.75}
+      llama3.1: {input: 0, output: 0}
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, fields
+from typing import Optional
+
+
+@dataclass
+class Usage:
+    """Tokens billed for one or more calls.
+
+    input_tokens excludes cached tokens: cache_read_tokens were served from
+    the provider's prompt cache, cache_write_tokens were written to it.
+    """
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+
+    @property
+    def prompt_tokens(self) -> int:
+        return self.input_tokens + self.cache_read_tokens + self.cache_write_tokens
+
+    @property
+    def cache_hit_rate(self) -> float:
+        """Fraction of prompt tokens read from the cache."""
+        total = self.prompt_tokens
+        return self.cache_read_tokens / total if total else 0.0
+
+    def __add__(self, other: "Usage") -> "Usage":
+        return Usage(**{k: getattr(self, k) + getattr(other, k) for k in asdict(self)})
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class CallRecord:
+    """One provider call, across all of its retry attempts."""
+    provider: str
+    model: str
+    usage: Usage
+    latency: float                # seconds, from the first attempt to the end
+    ttft: Optional[float] = None  # seconds to the first streamed chunk
+    retries: int = 0
+    ok: bool = True
+    agent: str = ""
+    task: str = ""
+
+
+@dataclass
+class UsageStats:
+    """Aggregate of CallRecords; what build state persists per agent and task."""
+    calls: int = 0
+    failures: int = 0
+    retries: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    latency_s: float = 0.0   # summed over calls
+    ttft_s: float = 0.0      # summed over streamed calls
+    streamed: int = 0
+
+    def add(self, call: CallRecord):
+        self.calls += 1
+        self.failures += 0 if call.ok else 1
+        self.retries += call.retries
+        for name in ("input_tokens", "output_tokens", "cache_read_tokens", "cache_write_tokens"):
+            setattr(self, name, getattr(self, name) + getattr(call.usage, name))
+        self.latency_s += call.latency
+        if call.ttft is not None:
+            self.ttft_s += call.ttft
+            self.streamed += 1
+
+    def merge(self, other: "UsageStats") -> "UsageStats":
+        return UsageStats(**{f.name: getattr(self, f.name) + getattr(other, f.name)
+                             for f in fields(self)})
+
+    @property
+    def usage(self) -> Usage:
+        return Usage(self.input_tokens, self.output_tokens,
+                     self.cache_read_tokens, self.cache_write_tokens)
+
+    @property
+    def mean_latency(self) -> float:
+        return self.latency_s / self.calls if self.calls else 0.0
+
+    @property
+    def mean_ttft(self) -> Optional[float]:
+        return self.ttft_s / self.streamed if self.streamed else None
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["latency_s"] = round(self.latency_s, 3)
+        data["ttft_s"] = round(self.ttft_s, 3)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "UsageStats":
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in (data or {}).items() if k in known})
+
+
+class UsageMeter:
+    """Running totals of CallRecords, safe to update from concurrent calls.
+
+    Calls without an agent or task scope are counted in the total only.
+    """
+
+    def __init__(self):
+        self._total = UsageStats()
+        self._by_agent: dict = {}  # agent → model → UsageStats
+        self._by_task: dict = {}   # task id → model → UsageStats
+        self._lock = threading.Lock()
+
+    def record(self, call: CallRecord):
+        with self._lock:
+            self._total.add(call)
+            if call.agent:
+                _stats(self._by_agent, call.agent, call.model).add(call)
+            if call.task:
+                _stats(self._by_task, call.task, call.model).add(call)
+
+    @property
+    def calls(self) -> int:
+        with self._lock:
+            return self._total.calls
+
+    def total(self) -> Usage:
+        with self._lock:
+            return self._total.usage
+
+    def by_agent(self) -> dict:
+        """{agent: {model: stats dict}}, freshly built."""
+        with self._lock:
+            return _dump(self._by_agent)
+
+    def by_task(self) -> dict:
+        """{task id: {model: stats dict}}, freshly built."""
+        with self._lock:
+            return _dump(self._by_task)
+
+
+def _stats(table: dict, key: str, model: str) -> UsageStats:
+    return table.setdefault(key, {}).setdefault(model or "unknown", UsageStats())
+
+
+def _dump(table: dict) -> dict:
+    return {key: {model: s.to_dict() for model, s in models.items()}
+            for key, models in table.items()}
+
+
+def merge_stats(*tables: dict) -> dict:
+    """Sum {model: stats dict} tables (e.g. a resumed build's saved usage and this run's)."""
+    merged: dict = {}
+    for table in tables:
+        for model, data in (table or {}).items():
+            merged[model] = merged.get(model, UsageStats()).merge(UsageStats.from_dict(data))
+    return {model: s.to_dict() for model, s in merged.items()}
+
+
+# ── Scopes ────────────────────────────────────────────────────────────────────
+
+_scope: ContextVar = ContextVar("forge_usage_scope", default=("", ""))
+_current_call: ContextVar = ContextVar("forge_usage_call", default=None)
+
+
+@contextmanager
+def usage_scope(agent: Optional[str] = None, task: Optional[str] = None):
+    """Attribute provider calls made inside the block to an agent and/or task.
+
+    Unset arguments keep the enclosing scope's value. Context variables
+    follow asyncio tasks and asyncio.to_thread; plain threads start empty.
+    """
+    outer_agent, outer_task = _scope.get()
+    token = _scope.set((outer_agent if agent is None else agent,
+                        outer_task if task is None else task))
+    try:
+        yield
+    finally:
+        _reset(_scope, token)
+
+
+def current_scope() -> tuple:
+    """(agent, task) calls are currently attributed to."""
+    return _scope.get()
+
+
+class CallTimer:
+    """Times one call through BaseProvider's retry path.
+
+    While it is open, usage the provider reports (BaseProvider._record_usage)
+    is added to this call instead of being recorded on its own.
+    """
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.ttft: Optional[float] = None
+        self.retries = 0
+        self.usage = Usage()
+        self._token = _current_call.set(self)
+
+    def first_chunk(self):
+        if self.ttft is None:
+            self.ttft = time.monotonic() - self.started
+
+    def add(self, usage: Usage):
+        self.usage = self.usage + usage
+
+    def finish(self, provider: str, model: str, ok: bool) -> CallRecord:
+        _reset(_current_call, self._token)
+        agent, task = _scope.get()
+        return CallRecord(provider, model, self.usage, time.monotonic() - self.started,
+                          self.ttft, self.retries, ok, agent, task)
+
+
+def current_call() -> Optional[CallTimer]:
+    return _current_call.get()
+
+
+def _reset(var: ContextVar, token):
+    try:
+        var.reset(token)
+    except ValueError:
+        pass  # a generator closed from another context; its scope ends with it
+
+
+# ── Cost ──────────────────────────────────────────────────────────────────────
+
+# $ per million tokens; matched by the longest model-name prefix.
+# List prices at the time of writing -- override them under `pricing:`.
+DEFAULT_PRICES = {
+    "claude-opus-4": {"input": 15.0, "output": 75.0, "cache_read": 1.5, "cache_write": 18.75},
+    "claude-sonnet-4": {"input": 3.0, "output": 15.0, "cache_read": 0.3, "cache_write": 3.75},
+    "claude-3-7-sonnet": {"input": 3.0, "output": 15.0, "cache_read": 0.3, "cache_write": 3.75},
+    "claude-3-5-sonnet": {"input": 3.0, "output": 15.0, "cache_read": 0.3, "cache_write": 3.75},
+    "claude-3-5-haiku": {"input": 0.8, "output": 4.0, "cache_read": 0.08, "cache_write": 1.0},
+    "gpt-4o": {"input": 2.5, "output": 10.0, "cache_read": 1.25},
+    "gpt-4o-mini": {"input": 0.15, "output": 0.6, "cache_read": 0.075},
+    "gpt-4.1": {"input": 2.0, "output": 8.0, "cache_read": 0.5},
+    "gpt-4.1-mini": {"input": 0.4, "output": 1.6, "cache_read": 0.1},
+    "o3-mini": {"input": 1.1, "output": 4.4, "cache_read": 0.55},
+}
+
+
+def price_for(model: str, prices: dict) -> Optional[dict]:
+    """Price entry for a model (longest matching prefix), or None if unknown."""
+    matches = [key for key in prices if model == key or model.startswith(key)]
+    return prices[max(matches, key=len)] if matches else None
+
+
+def estimate_cost(stats: UsageStats, price: Optional[dict]) -> Optional[float]:
+    """Dollars for `stats` at `price`; cache tokens default to the input price."""
+    if price is None:
+        return None
+    rate_in = float(price.get("input", 0))
+    return (stats.input_tokens * rate_in
+            + stats.output_tokens * float(price.get("output", 0))
+            + stats.cache_read_tokens * float(price.get("cache_read", rate_in))
+            + stats.cache_write_tokens * float(price.get("cache_write", rate_in))) / 1e6
@@ -0,0 +1,94 @@
+"""Dependency-aware task scheduling -- runs a DAG on a bounded thread pool."""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Hashable, Mapping, Sequence
+
+
+def run_dag(
+    deps: Mapping[Hashable, set],
+    run: Callable[[Hashable], None],
+    max_workers: int = 4,
+) -> None:
+    """Run every node once all of its dependencies have finished.
+
+    Args:
+        deps: node → set of nodes it depends on. Dependencies that are not
+              themselves keys (e.g. already-completed tasks) are ignored.
+              Ready nodes start in the mapping's iteration order.
+        run: called once per node, from a worker thread. It should handle
+             its own errors; an exception aborts the whole run.
+        max_workers: upper bound on concurrently running nodes.
+
+    Raises:
+        ValueError: if the graph has a cycle.
+    """
+    remaining = {node: set(d) & deps.keys() for node, d in deps.items()}
+    dependents: dict = {node: [] for node in remaining}
+    for node, needs in remaining.items():
+        for dep in needs:
+            dependents[dep].append(node)
+
+    ready = [node for node, needs in remaining.items() if not needs]
+    finished = set()
+
+    pool = ThreadPoolExecutor(max_workers=max(1, max_workers))
+    running = {}
+    try:
+        while ready or running:
+            while ready:
+                node = ready.pop(0)
+                running[pool.submit(run, node)] = node
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                node = running.pop(future)
+                future.result()
+                finished.add(node)
+                for child in dependents[node]:
+                    remaining[child].discard(node)
+                    if not remaining[child]:
+                        ready.append(child)
+    except BaseException:
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    pool.shutdown(wait=True)
+
+    stuck = [node for node in remaining if node not in finished]
+    if stuck:
+        raise ValueError(f"Dependency cycle between: {', '.join(map(str, stuck))}")
+
+
+def task_dependencies(tasks: Sequence) -> dict[int, set[int]]:
+    """Derive scheduling edges (by task index) from planner output.
+
+    Each task may declare `depends_on` (task ids) and `files`. Edges:
+      - every declared dependency on an EARLIER task (later/unknown ids are
+        ignored, so the graph is acyclic by construction)
+      - an implicit edge to the most recent earlier task touching any of the
+        same files, so two tasks never write one file concurrently and the
+        later one sees the earlier one's output
+
+    Plans that declare no depends_on at all (older planners, hand-edited
+    state) fall back to a strict chain, i.e. the old sequential behaviour.
+    """
+    if not any(getattr(t, "depends_on", None) for t in tasks):
+        return {i: ({i - 1} if i else set()) for i in range(len(tasks))}
+
+    index_by_id: dict[str, int] = {}
+    for i, task in enumerate(tasks):
+        index_by_id.setdefault(task.id, i)
+
+    deps: dict[int, set[int]] = {}
+    last_writer: dict[str, int] = {}
+    for i, task in enumerate(tasks):
+        edges = set()
+        for dep_id in getattr(task, "depends_on", None) or []:
+            j = index_by_id.get(str(dep_id))
+            if j is not None and j < i:
+                edges.add(j)
+        for path in getattr(task, "files", None) or []:
+            if path in last_writer:
+                edges.add(last_writer[path])
+            last_writer[path] = i
+        deps[i] = edges
+    return deps
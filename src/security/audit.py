@@ -0,0 +1,261 @@
+"""Firewall audit log -- buffered background writer, rotation, streaming queries.
+
+AgenticFirewall hands each decision to an AuditWriter instead of opening
+the log per event. A daemon thread drains a bounded queue and writes
+batches; the log rotates by size or age into gzip archives next to it
+(firewall_audit.log.20260101T120000.gz), and pending entries are flushed at
+interpreter exit. iter_audit() streams archives and the live log line by
+line for `forge audit`.
+"""
+
+import atexit
+import gzip
+import json
+import os
+import queue
+import re
+import shutil
+import threading
+import time
+from datetime import datetime, timedelta
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Iterator, Optional
+
+MAX_QUEUE = 10_000          # entries; writers block (never drop) when full
+BATCH_SIZE = 512            # entries per write
+FLUSH_INTERVAL = 0.5        # seconds a partial batch may wait
+MAX_BYTES = 5 * 1024 * 1024 # rotate when the live log reaches this size
+MAX_AGE = 7 * 24 * 3600     # ... or when it was started this long ago
+BACKUPS = 10                # gzip archives to keep
+
+
+class AuditWriter:
+    """Append JSON lines to one audit log from a background thread."""
+
+    def __init__(self, path: Path, max_bytes: int = MAX_BYTES,
+                 max_age: Optional[float] = MAX_AGE, backups: int = BACKUPS):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.backups = backups
+        self._queue: queue.Queue = queue.Queue(maxsize=MAX_QUEUE)
+        self._started_at: Optional[datetime] = None  # first entry of the live log
+        self._closed = False
+        # Makes "not closed, so enqueue" atomic with close()'s sentinel
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run, name=f"audit-{self.path.name}", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, entry: dict):
+        """Queue one entry. Blocks only if the writer is MAX_QUEUE entries behind.
+
+        After close() entries are written synchronously.
+        """
+        with self._lock:
+            if not self._closed:
+                self._queue.put(entry)
+                return
+            self._write_batch([entry])
+
+    def flush(self):
+        """Block until every queued entry is on disk."""
+        if self._thread.is_alive():
+            self._queue.join()
+
+    def close(self):
+        """Flush and stop the writer thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            batch, done = [], item is None
+            if not done:
+                batch.append(item)
+            deadline = time.monotonic() + FLUSH_INTERVAL
+            while not done and len(batch) < BATCH_SIZE:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if item is None:
+                    done = True
+                else:
+                    batch.append(item)
+
+            try:
+                if batch:
+                    self._write_batch(batch)
+            except Exception as e:
+                print(f"WARNING: audit log write failed ({self.path}): {e}")
+            finally:
+                for _ in range(len(batch) + (1 if done else 0)):
+                    self._queue.task_done()
+            if done:
+                return
+
+    def _write_batch(self, batch: list[dict]):
+        data = "".join(json.dumps(entry) + "\n" for entry in batch)
+        self._maybe_rotate(len(data))
+        with open(self.path, "a") as f:
+            f.write(data)
+
+    def _maybe_rotate(self, incoming: int):
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            return
+        if self._started_at is None:
+            self._started_at = _first_timestamp(self.path) or datetime.now()
+        too_big = st.st_size and st.st_size + incoming > self.max_bytes
+        too_old = (self.max_age is not None
+                   and (datetime.now() - self._started_at).total_seconds() > self.max_age)
+        if too_big or too_old:
+            self.rotate()
+            self._started_at = datetime.now()
+
+    def rotate(self):
+        """Compress the live log into a timestamped archive and prune old ones."""
+        if not self.path.exists():
+            return
+        stamp = datetime.now().strftime("%Y%m%dT%H%M%S")
+        archive = self.path.with_name(f"{self.path.name}.{stamp}.gz")
+        n = 1
+        while archive.exists():
+            archive = self.path.with_name(f"{self.path.name}.{stamp}-{n}.gz")
+            n += 1
+        tmp = archive.with_suffix(".gz.tmp")
+        with open(self.path, "rb") as src, gzip.open(tmp, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.replace(tmp, archive)
+        self.path.unlink()
+
+        for old in archives(self.path)[:-self.backups or None]:
+            old.unlink(missing_ok=True)
+
+
+def _first_timestamp(path: Path) -> Optional[datetime]:
+    """When the first entry of a log was written, if it can be read."""
+    try:
+        with open(path) as f:
+            first = json.loads(f.readline())
+        return datetime.fromisoformat(first["timestamp"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _archive_stamp(archive: Path) -> tuple[str, int]:
+    """(timestamp, same-second counter) from name.<stamp>[-n].gz."""
+    stamp, _, n = archive.name.rsplit(".", 2)[-2].partition("-")
+    return stamp, int(n) if n.isdigit() else 0
+
+
+def _archive_time(archive: Path) -> Optional[datetime]:
+    """Rotation time encoded in an archive name (its newest possible entry)."""
+    try:
+        return datetime.strptime(_archive_stamp(archive)[0], "%Y%m%dT%H%M%S")
+    except ValueError:
+        return None
+
+
+def archives(path: Path) -> list[Path]:
+    """Rotated archives of a log, oldest first."""
+    return sorted(path.parent.glob(f"{path.name}.*.gz"), key=_archive_stamp)
+
+
+_writers: dict[Path, AuditWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_audit_writer(path: Path) -> AuditWriter:
+    """The shared writer for a log path (one thread per file per process)."""
+    key = Path(path).resolve()
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = _writers[key] = AuditWriter(path)
+        return writer
+
+
+@atexit.register
+def close_all():
+    """Flush every audit writer (runs at interpreter exit)."""
+    with _writers_lock:
+        writers = list(_writers.values())
+    for writer in writers:
+        writer.close()
+
+
+# --- Queries ---
+
+_RELATIVE = re.compile(r"^(\d+)\s*([smhdw])$")
+_UNITS = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days", "w": "weeks"}
+
+
+def parse_time(value: str) -> datetime:
+    """'30m', '2h', '7d' (ago) or an ISO date/time."""
+    m = _RELATIVE.match(value.strip())
+    if m:
+        return datetime.now() - timedelta(**{_UNITS[m.group(2)]: int(m.group(1))})
+    return datetime.fromisoformat(value.strip())
+
+
+def iter_audit(
+    path: Path,
+    action: Optional[str] = None,
+    target: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> Iterator[dict]:
+    """Stream matching entries from archives (oldest first) and the live log.
+
+    `action` matches action or detail prefix case-insensitively (e.g.
+    "denied", "BLOCKED_PATH"); `target` is a glob, or a substring if it has
+    no wildcard.
+    """
+    action = action.upper() if action else None
+    since_s = since.isoformat() if since else None
+    until_s = until.isoformat() if until else None
+
+    sources = archives(path) + ([path] if path.exists() else [])
+    for source in sources:
+        if since and source.suffix == ".gz":
+            rotated = _archive_time(source)
+            if rotated and rotated < since:
+                continue  # every entry predates the window
+        opener = gzip.open if source.suffix == ".gz" else open
+        with opener(source, "rt") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                ts = entry.get("timestamp", "")
+                if since_s and ts < since_s:
+                    continue
+                if until_s and ts > until_s:
+                    continue
+                if action and not (
+                    entry.get("action", "").upper() == action
+                    or entry.get("detail", "").upper().startswith(action)
+                ):
+                    continue
+                if target:
+                    name = entry.get("target", "")
+                    if any(c in target for c in "*?["):
+                        if not fnmatch(name, target):
+                            continue
+                    elif target not in name:
+                        continue
+                yield entry
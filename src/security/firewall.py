@@ -6,6 +6,9 @@ from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 from datetime import datetime
 
+from .audit import get_audit_writer
+from .matcher import ContentRules, PatternSet
+
 DEFAULT_POLICY = {
     "allowed_paths": [
         "src/.*",
@@ -83,32 +86,33 @@ class AgenticFirewall:
                 self.policy = json.load(f)
         
         self.audit_log = audit_log or Path("firewall_audit.log")
+        self._audit = get_audit_writer(self.audit_log)
+        self._compile()
+
+    def _compile(self):
+        """Compile each rule list once, so a check is one scan however many rules exist."""
+        self._blocked_paths = PatternSet(self.policy.get("blocked_paths", []))
+        self._allowed_paths = PatternSet(self.policy.get("allowed_paths", []))
+        self._blocked_patterns = ContentRules(self.policy.get("blocked_patterns", []))
 
     def validate_file_write(self, filepath: str, content: str) -> Tuple[bool, str]:
         """Validate if a file write is permitted."""
         
         # Check Blocked Paths
-        for pattern in self.policy.get("blocked_paths", []):
-            if re.search(pattern, filepath):
-                self._log_violation(filepath, "BLOCKED_PATH")
-                return False, f"Access to sensitive path '{filepath}' is prohibited by policy."
+        if self._blocked_paths.search(filepath):
+            self._log_violation(filepath, "BLOCKED_PATH")
+            return False, f"Access to sensitive path '{filepath}' is prohibited by policy."
 
         # Check Allowed Paths
-        is_allowed = False
-        for pattern in self.policy.get("allowed_paths", []):
-            if re.search(pattern, filepath):
-                is_allowed = True
-                break
-        
-        if not is_allowed:
+        if not self._allowed_paths.search(filepath):
             self._log_violation(filepath, "PATH_NOT_IN_ALLOWLIST")
             return False, f"Path '{filepath}' is not in the allowlist. Only project-related files can be edited."
 
         # Check for Malicious Patterns in Content
-        for pattern in self.policy.get("blocked_patterns", []):
-            if re.search(pattern, content):
-                self._log_violation(filepath, f"MALICIOUS_CONTENT_PATTERN: {pattern}")
-                return False, f"Potentially malicious code pattern detected in '{filepath}'."
+        pattern = self._blocked_patterns.search(content)
+        if pattern:
+            self._log_violation(filepath, f"MALICIOUS_CONTENT_PATTERN: {pattern}")
+            return False, f"Potentially malicious code pattern detected in '{filepath}'."
 
         self._log_event(filepath, "PERMITTED")
         return True, "Success"
@@ -120,8 +124,7 @@ class AgenticFirewall:
             "action": action,
             "detail": detail
         }
-        with open(self.audit_log, "a") as f:
-            f.write(json.dumps(log_entry) + "\n")
+        self._audit.write(log_entry)
 
     def _log_violation(self, target: str, violation_type: str):
         print(f"⚠️  SECURITY VIOLATION: {violation_type} on {target}")
@@ -0,0 +1,192 @@
+"""Compiled rule sets -- many regexes, one scan of the input.
+
+PatternSet combines short-input rules (paths, spec text) into one
+alternation. ContentRules handles file contents, where CPython's regex
+engine would try every branch of an alternation at every position: it
+prefilters on each rule's required literal and only runs the rules whose
+literal occurs.
+"""
+
+import re
+from typing import Optional, Sequence
+
+# Backreferences are numbered/named relative to the whole pattern, so a rule
+# that uses them cannot be embedded in a combined alternation
+_BACKREF = re.compile(r"\\[1-9]|\(\?P=")
+
+
+class PatternSet:
+    """A list of regex rules compiled into a single alternation.
+
+    `search()` behaves like `any(re.search(p, text) for p in patterns)` but
+    scans the text once however many rules there are, and reports which
+    rule fired. When several rules match, the one matching earliest in the
+    text is reported (ties go to the earlier rule).
+
+    Rules that can't be combined (backreferences, their own named groups,
+    mid-pattern flags) are kept as separate compiled regexes and checked
+    after the combined pass.
+    """
+
+    def __init__(self, patterns: Sequence[str], flags: int = 0):
+        self.patterns = list(patterns)
+        self._by_group: dict[str, str] = {}
+        self._separate: list[tuple[str, re.Pattern]] = []
+
+        branches = []
+        for i, pattern in enumerate(self.patterns):
+            compiled = re.compile(pattern, flags)
+            if compiled.groupindex or _BACKREF.search(pattern):
+                self._separate.append((pattern, compiled))
+                continue
+            name = f"r{i}"
+            self._by_group[name] = pattern
+            branches.append(f"(?P<{name}>{pattern})")
+
+        self._combined = None
+        if branches:
+            try:
+                self._combined = re.compile("|".join(branches), flags)
+            except re.error:
+                # e.g. a global flag like (?i) in the middle of the alternation
+                self._separate = [(p, re.compile(p, flags)) for p in self._by_group.values()] + self._separate
+                self._by_group = {}
+
+    def search(self, text: str) -> Optional[str]:
+        """The rule that matched `text`, or None."""
+        if self._combined is not None:
+            m = self._combined.search(text)
+            if m:
+                # The outer named group closes last, so it is lastgroup
+                return self._by_group[m.lastgroup]
+        for pattern, compiled in self._separate:
+            if compiled.search(text):
+                return pattern
+        return None
+
+    def matching(self, text: str) -> set[str]:
+        """Rules matching somewhere in `text`, in one scan.
+
+        Matches are non-overlapping, so a rule whose only hits lie inside
+        another rule's match is not reported.
+        """
+        found = set()
+        if self._combined is not None:
+            for m in self._combined.finditer(text):
+                found.add(self._by_group[m.lastgroup])
+        for pattern, compiled in self._separate:
+            if compiled.search(text):
+                found.add(pattern)
+        return found
+
+
+try:
+    from re import _parser as _sre_parse, _constants as _sre_constants
+except ImportError:  # Python < 3.11
+    import sre_parse as _sre_parse
+    import sre_constants as _sre_constants
+
+# Up to this many literals, per-literal substring checks (C memmem) beat a
+# regex pass; above it, one trie-regex pass over the text is cheaper
+SMALL_LITERAL_SET = 24
+
+# Literals shorter than this prefilter almost nothing; such rules are
+# always confirmed with their own regex
+MIN_LITERAL = 3
+
+
+def required_literal(pattern: str, flags: int = 0) -> Optional[str]:
+    """Longest run of literal characters every match of `pattern` contains.
+
+    Only top-level literals count (alternations, groups and repeats end a
+    run). Returns None for case-insensitive patterns or short runs.
+    """
+    try:
+        parsed = _sre_parse.parse(pattern, flags)
+    except re.error:
+        return None
+    if parsed.state.flags & re.IGNORECASE:
+        return None
+
+    best, run = "", []
+    for op, av in parsed:
+        if op is _sre_constants.LITERAL:
+            run.append(chr(av))
+            continue
+        if len(run) > len(best):
+            best = "".join(run)
+        run = []
+    if len(run) > len(best):
+        best = "".join(run)
+    return best if len(best) >= MIN_LITERAL else None
+
+
+def _trie_regex(words: Sequence[str]) -> str:
+    """Regex matching any of `words`, with shared prefixes factored out."""
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def emit(node: dict) -> str:
+        ends = "" in node
+        alts = [re.escape(ch) + emit(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        if len(alts) == 1 and not ends:
+            return alts[0]
+        body = "(?:" + "|".join(alts) + ")"
+        return body + "?" if ends else body
+
+    return emit(trie)
+
+
+class ContentRules:
+    """Content rules checked with a literal prefilter, same answers as re.search.
+
+    Each rule's required literal (see required_literal) must occur in the
+    text before its regex can match. Small rule sets check literals with
+    `in`; large ones find every literal in one pass of a trie-shaped regex,
+    so adding rules barely changes the scan cost. Surviving candidates (and
+    rules without a usable literal) are confirmed in policy order, so
+    `search()` reports exactly the rule the one-search-per-rule loop would.
+    """
+
+    def __init__(self, patterns: Sequence[str], flags: int = 0):
+        self.patterns = list(patterns)
+        self._rules = [(p, re.compile(p, flags), required_literal(p, flags)) for p in self.patterns]
+        literals = sorted({lit for _, _, lit in self._rules if lit})
+        self._literals = literals
+        self._scanner = None
+        if len(literals) > SMALL_LITERAL_SET:
+            self._scanner = re.compile(_trie_regex(literals))
+            # A found literal implies every literal that is a prefix of it
+            self._prefixes = {
+                lit: [other for other in literals if lit.startswith(other)]
+                for lit in literals
+            }
+
+    def present_literals(self, text: str) -> set[str]:
+        if self._scanner is None:
+            return {lit for lit in self._literals if lit in text}
+        found = set()
+        pos = 0
+        while True:
+            m = self._scanner.search(text, pos)
+            if m is None:
+                return found
+            found.update(self._prefixes[m.group()])
+            # Resume one character later so overlapping occurrences are seen
+            pos = m.start() + 1
+
+    def search(self, text: str) -> Optional[str]:
+        """The first rule (in policy order) that matches `text`, or None."""
+        present = self.present_literals(text) if self._literals else set()
+        for pattern, compiled, literal in self._rules:
+            if literal is not None and literal not in present:
+                continue
+            if compiled.search(text):
+                return pattern
+        return None
@@ -1,10 +1,22 @@
-"""Build state management -- YAML-based, file-stored, resumable."""
+"""Build state management -- YAML snapshot plus append-only journal, resumable.
 
+.forge/build-state.yaml is a periodic snapshot; every save in between
+appends one JSON line of changes to .forge/build-journal.jsonl, so a save
+costs the same at task 1 and task 100. Loading replays the journal tail on
+top of the snapshot.
+"""
+
+import copy
 import hashlib
+import json
+import os
+import tempfile
+import threading
 import yaml
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, asdict, fields
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 
 @dataclass
@@ -15,15 +27,22 @@ class TaskState:
     description: str = ""
     status: str = "pending"
     agent: str = ""
+    files: list[str] = field(default_factory=list)
+    depends_on: list[str] = field(default_factory=list)
     files_written: list[str] = field(default_factory=list)
+    # Incremental rebuilds (see fingerprint.py)
+    fingerprint: str = ""
+    input_hashes: dict[str, str] = field(default_factory=dict)
     error: str = ""
     started_at: str = ""
     completed_at: str = ""
+    # {model: UsageStats dict} of the calls made for this task (providers/usage.py)
+    usage: dict = field(default_factory=dict)
 
 
 @dataclass
 class BuildState:
-    """Full build state, serialized to .forge/build-state.yaml."""
+    """Full build state, persisted via BuildJournal (snapshot + journal)."""
     build_id: str = ""
     status: str = "not_started"
     started_at: str = ""
@@ -31,39 +50,259 @@ class BuildState:
     provider: str = ""
     model: str = ""
     spec_hash: str = ""
+    # Hashes of the spec sections no task matched when last planned
+    # (fingerprint.unplanned_sections); None for builds from before they were kept
+    unplanned_sections: Optional[list[str]] = None
     tasks: list[TaskState] = field(default_factory=list)
     decisions: str = ""
     current_task_index: int = 0
     files_written: list[str] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
+    # {agent: {model: UsageStats dict}} of every provider call in the build
+    usage: dict = field(default_factory=dict)
 
 
 STATE_FILE = "build-state.yaml"
+JOURNAL_FILE = "build-journal.jsonl"
+
+# Fold the journal into a fresh snapshot after this many records
+COMPACT_EVERY = 200
+
+_SCALARS = [f.name for f in fields(BuildState)
+            if f.name not in ("tasks", "files_written", "errors")]
+_APPEND_ONLY = ("files_written", "errors")
+_TASK_FIELDS = [f.name for f in fields(TaskState)]
 
 
 def load_build_state(forge_path: Path) -> BuildState:
-    """Load build state from .forge/build-state.yaml, or return fresh state."""
-    state_path = forge_path / STATE_FILE
-    if not state_path.exists():
-        return BuildState()
+    """Load build state from the snapshot plus journal, or return fresh state."""
+    return _journal_for(forge_path).load()
 
-    with open(state_path) as f:
-        data = yaml.safe_load(f) or {}
 
-    tasks = []
-    for t in data.pop("tasks", []):
-        tasks.append(TaskState(**t))
-    data["tasks"] = tasks
+def save_build_state(forge_path: Path, state: BuildState):
+    """Persist build state: append the changes since the last save."""
+    _journal_for(forge_path).save(state)
 
-    return BuildState(**data)
 
+class BuildJournal:
+    """Snapshot + append-only JSONL journal for one .forge/ directory.
 
-def save_build_state(forge_path: Path, state: BuildState):
-    """Persist build state to .forge/build-state.yaml."""
-    state_path = forge_path / STATE_FILE
-    data = asdict(state)
-    with open(state_path, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+    Each save diffs the state against what was last persisted and appends a
+    single record: changed scalars, changed fields per task, and new items of
+    the append-only lists (files_written, errors). Records carry a sequence
+    number; the snapshot stores the last one it includes (journal_seq), so a
+    crash between writing a snapshot and truncating the journal is harmless.
+    A torn final line (a crash mid-append, or a build in another process
+    still writing it) is ignored on load and only cut off by this
+    journal's next save, so read-only loaders such as `forge status` never
+    modify the file; any other unreadable line is reported as corruption.
+    """
+
+    def __init__(self, forge_path: Path):
+        self.snapshot_path = forge_path / STATE_FILE
+        self.journal_path = forge_path / JOURNAL_FILE
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._records = 0          # records in the journal since the snapshot
+        self._persisted: Optional[dict] = None
+        self._torn_at: Optional[int] = None  # offset of a torn last line to cut
+
+    def load(self) -> BuildState:
+        with self._lock:
+            data, seq = self._read_snapshot()
+            journal, good_end, torn = self._read_journal()
+            self._torn_at = good_end if torn else None
+            records = 0
+            for record in journal:
+                if record.get("seq", 0) <= seq:
+                    continue
+                _apply(data, record)
+                seq = record["seq"]
+                records += 1
+
+            state = _from_dict(data) if data else BuildState()
+            self._seq = seq
+            self._records = records
+            self._persisted = _baseline(state) if data else None
+            return state
+
+    def save(self, state: BuildState):
+        with self._lock:
+            before = self._persisted
+            if (before is None or before["build_id"] != state.build_id
+                    or self._records >= COMPACT_EVERY
+                    or (state.status != before["status"]
+                        and state.status in ("completed", "failed"))):
+                self._compact(state)
+                return
+
+            record = _diff(before, state)
+            if not record:
+                return
+            self._seq += 1
+            record = {"seq": self._seq, **record}
+            line = json.dumps(record, default=str) + "\n"
+            if self._torn_at is not None:
+                # Drop the partial line, or this append would extend it and
+                # every later record would be lost on replay
+                with open(self.journal_path, "r+b") as f:
+                    f.truncate(self._torn_at)
+                self._torn_at = None
+            with open(self.journal_path, "a") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self._records += 1
+            self._persisted = _baseline(state)
+
+    def _compact(self, state: BuildState):
+        """Write a full snapshot atomically, then start an empty journal."""
+        data = asdict(state)
+        data["journal_seq"] = self._seq
+        _atomic_write(
+            self.snapshot_path,
+            yaml.dump(data, default_flow_style=False, sort_keys=False),
+        )
+        _atomic_write(self.journal_path, "")
+        self._torn_at = None
+        self._records = 0
+        self._persisted = _baseline(state)
+
+    def _read_snapshot(self) -> tuple[dict, int]:
+        if not self.snapshot_path.exists():
+            return {}, 0
+        with open(self.snapshot_path) as f:
+            data = yaml.safe_load(f) or {}
+        seq = int(data.pop("journal_seq", 0) or 0)
+        data.setdefault("tasks", [])
+        return data, seq
+
+    def _read_journal(self) -> tuple[list[dict], int, bool]:
+        """(records, byte offset after the last good line, torn tail?).
+
+        Only the final line can be a torn write; an unreadable line before
+        it means the journal is corrupted and raises ValueError rather
+        than silently dropping the records after it.
+        """
+        try:
+            raw = self.journal_path.read_bytes()
+        except OSError:
+            return [], 0, False
+        lines = raw.split(b"\n")
+        complete, tail = lines[:-1], lines[-1]  # tail: bytes after the last newline
+        records, offset = [], 0
+        for lineno, line in enumerate(complete, 1):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                if lineno == len(complete) and not tail.strip():
+                    return records, offset, True  # torn last write
+                raise ValueError(
+                    f"{self.journal_path}: line {lineno} is corrupted; delete the "
+                    f"journal to resume from the last snapshot ({STATE_FILE})"
+                )
+            offset += len(line) + 1
+            if isinstance(record, dict) and "seq" in record:
+                records.append(record)
+        return records, offset, bool(tail)
+
+
+def _baseline(state: BuildState) -> dict:
+    """What was persisted, in a form cheap to diff the next save against."""
+    base = {name: copy.copy(getattr(state, name)) for name in _SCALARS}
+    base["tasks"] = [
+        {name: copy.copy(getattr(t, name)) for name in _TASK_FIELDS}
+        for t in state.tasks
+    ]
+    for name in _APPEND_ONLY:
+        items = getattr(state, name)
+        base[name] = (len(items), items[-1] if items else None)
+    return base
+
+
+def _diff(before: dict, state: BuildState) -> dict:
+    """Journal record for the changes since `before` (empty if none).
+
+    Cost is proportional to the number of tasks, not to the length of the
+    files_written/errors lists.
+    """
+    record = {}
+
+    scalars = {n: getattr(state, n) for n in _SCALARS if getattr(state, n) != before[n]}
+    if scalars:
+        record["set"] = scalars
+
+    if len(state.tasks) != len(before["tasks"]):
+        record["tasks"] = [asdict(t) for t in state.tasks]
+    else:
+        changed = {}
+        for i, (t, old) in enumerate(zip(state.tasks, before["tasks"])):
+            delta = {n: getattr(t, n) for n in _TASK_FIELDS if getattr(t, n) != old[n]}
+            if delta:
+                changed[str(i)] = delta
+        if changed:
+            record["task"] = changed
+
+    for name in _APPEND_ONLY:
+        items = getattr(state, name)
+        old_len, old_last = before[name]
+        if len(items) == old_len and (not items or items[-1] == old_last):
+            continue
+        if len(items) > old_len and (old_len == 0 or items[old_len - 1] == old_last):
+            record.setdefault("append", {})[name] = items[old_len:]
+        else:
+            record.setdefault("set", {})[name] = list(items)
+
+    return record
+
+
+def _apply(data: dict, record: dict):
+    """Apply one journal record to a snapshot dict in place."""
+    data.update(record.get("set", {}))
+    if "tasks" in record:
+        data["tasks"] = record["tasks"]
+    for i, delta in record.get("task", {}).items():
+        i = int(i)
+        if i < len(data["tasks"]):
+            data["tasks"][i].update(delta)
+    for name, items in record.get("append", {}).items():
+        data.setdefault(name, []).extend(items)
+
+
+def _from_dict(data: dict) -> BuildState:
+    known_task = set(_TASK_FIELDS)
+    known_state = {f.name for f in fields(BuildState)}
+    tasks = [TaskState(**{k: v for k, v in t.items() if k in known_task})
+             for t in data.get("tasks") or []]
+    state = {k: v for k, v in data.items() if k in known_state and k != "tasks"}
+    return BuildState(tasks=tasks, **state)
+
+
+def _atomic_write(path: Path, text: str):
+    """Write via temp file + fsync + rename, so readers never see a partial file."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+_journals: dict[Path, BuildJournal] = {}
+_journals_lock = threading.Lock()
+
+
+def _journal_for(forge_path: Path) -> BuildJournal:
+    key = forge_path.resolve()
+    with _journals_lock:
+        journal = _journals.get(key)
+        if journal is None:
+            journal = _journals[key] = BuildJournal(forge_path)
+        return journal
 
 
 def compute_spec_hash(forge_path: Path) -> str:
@@ -0,0 +1,85 @@
+"""ADK tools take no arguments: build inputs come from BuildArtifacts."""
+
+import inspect
+
+import pytest
+
+from src.a2a.blobs import BlobStore
+from src.a2a.client import A2AClient
+from src.a2a.types import Artifact, FilePart, TaskResult, TaskStatus
+from src.adk.tools import BuildArtifacts, make_agent_tools
+
+PLAN = {"decisions": {"stack": {"backend": "fastapi"}}, "tasks": [{"id": "task_01"}]}
+
+
+class _Agent:
+    """Records each task; answers with a plan or one generated file."""
+
+    def __init__(self, name):
+        self.name = name
+        self.tasks = []
+
+    def handle_a2a_task(self, task):
+        self.tasks.append(task)
+        if self.name == "planner":
+            artifacts = [Artifact(type="data", data=PLAN)]
+        else:
+            artifacts = [Artifact(parts=[FilePart(path=f"{self.name}.txt", content="x\n")])]
+        return TaskResult(id=task.id, status=TaskStatus.completed, artifacts=artifacts)
+
+
+@pytest.fixture
+def build():
+    agents = {name: _Agent(name) for name in
+              ("planner", "backend", "frontend", "security", "ci", "deploy", "reviewer")}
+    blobs = BlobStore()
+    clients = {name: A2AClient(agent=agent, blobs=blobs) for name, agent in agents.items()}
+    artifacts = BuildArtifacts(spec="SPEC: a todo app", rules="RULES: use pytest",
+                               deploy_template="DEPLOY: railway", learnings="LEARNED: pin deps")
+    tools = {tool.__name__: tool for tool in make_agent_tools(clients, artifacts)}
+    return agents, artifacts, tools
+
+
+def _prompt(task):
+    return task.message.parts[0].text
+
+
+def test_tools_take_no_build_inputs_as_arguments(build):
+    _, _, tools = build
+    for name, tool in tools.items():
+        params = list(inspect.signature(tool).parameters)
+        assert params == (["agent_names"] if name == "run_parallel_agents" else []), name
+
+
+def test_planner_reads_spec_rules_and_learnings(build):
+    agents, artifacts, tools = build
+    assert tools["call_planner"]().startswith("Plan ready. 1 tasks.")
+    prompt = _prompt(agents["planner"].tasks[0])
+    for text in ("SPEC: a todo app", "RULES: use pytest", "LEARNED: pin deps"):
+        assert text in prompt
+    assert artifacts.decisions == PLAN["decisions"]
+
+
+def test_code_agents_get_the_inputs_and_decisions_from_artifacts(build):
+    agents, artifacts, tools = build
+    tools["call_planner"]()
+    tools["run_parallel_agents"]("backend,ci,deploy")
+
+    backend = agents["backend"].tasks[0]
+    assert "SPEC: a todo app" in _prompt(backend) and "fastapi" in _prompt(backend)
+    assert backend.context["rules"] == "RULES: use pytest"
+    assert agents["ci"].tasks[0].context["decisions"] == PLAN["decisions"]
+    assert agents["deploy"].tasks[0].context["deploy_template"] == "DEPLOY: railway"
+    assert sorted(artifacts.files.paths()) == ["backend.txt", "ci.txt", "deploy.txt"]
+
+
+def test_reviewer_gets_every_generated_file(build):
+    agents, artifacts, tools = build
+    tools["call_backend_agent"]()
+    tools["call_frontend_agent"]()
+    assert tools["call_reviewer_agent"]() == "Review complete."
+
+    review = agents["reviewer"].tasks[0]
+    assert review.context["spec"] == "SPEC: a todo app"
+    assert review.context["files"] == {"backend.txt": "x\n", "frontend.txt": "x\n"}
+    assert agents["frontend"].tasks[0].context["backend_files"] == ["backend.txt"]
@@ -0,0 +1,170 @@
+"""Admission control: lanes, reservations, and the server's 429/503 answers."""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from src.a2a.admission import AdmissionController, Rejected
+from src.a2a.server import create_a2a_app
+from src.a2a.tasks import TaskManager
+from src.a2a.types import Message, Task, TaskResult, TaskStatus, TextPart
+
+
+def test_interactive_waiters_are_granted_before_batch():
+    async def scenario():
+        admission = AdmissionController(max_in_flight=1, max_queue=4)
+        order = []
+
+        async def job(name, lane):
+            async with admission.slot(lane):
+                order.append(name)
+                await asyncio.sleep(0)
+
+        async with admission.slot():
+            jobs = [asyncio.ensure_future(job("batch-1", "batch")),
+                    asyncio.ensure_future(job("batch-2", "batch")),
+                    asyncio.ensure_future(job("interactive", "interactive"))]
+            await asyncio.sleep(0)
+        await asyncio.gather(*jobs)
+        return order
+
+    assert asyncio.run(scenario()) == ["interactive", "batch-1", "batch-2"]
+
+
+def test_reservations_count_against_the_queue_at_once():
+    async def scenario():
+        admission = AdmissionController(max_in_flight=1, max_queue=2)
+        granted = admission.reserve()
+        queued = [admission.reserve(), admission.reserve()]
+        assert granted.done() and not any(f.done() for f in queued)
+        with pytest.raises(Rejected) as e:
+            admission.reserve()
+        assert e.value.status_code == 429 and e.value.retry_after >= 1
+
+        admission.abandon(queued[0])   # leaves the queue
+        admission.abandon(granted)     # hands the slot to the next waiter
+        assert queued[1].done()
+        assert (admission.in_flight, admission.queued) == (1, 0)
+
+    asyncio.run(scenario())
+
+
+def test_batch_may_only_fill_its_share_of_the_queue():
+    async def scenario():
+        admission = AdmissionController(max_in_flight=1, max_queue=2)
+        admission.reserve()
+        admission.reserve("batch")
+        with pytest.raises(Rejected):
+            admission.reserve("batch")
+        admission.reserve("interactive")
+
+    asyncio.run(scenario())
+
+
+class _Agent:
+    """Blocks every task until `gate` is set."""
+    name = "fake"
+
+    def __init__(self):
+        self.gate = threading.Event()
+
+    def handle_a2a_task(self, task):
+        self.gate.wait(5)
+        return TaskResult(id=task.id, status=TaskStatus.completed)
+
+
+def _task(task_id=None):
+    message = Message(role="user", parts=[TextPart(text="go")])
+    return (Task(id=task_id, message=message) if task_id else Task(message=message)).model_dump()
+
+
+def _serve(agent, scenario, **options):
+    app = create_a2a_app(agent, task_db=":memory:", **options)
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://agent") as client:
+            return await scenario(client, app.state.admission)
+
+    return asyncio.run(run())
+
+
+async def _until(predicate):
+    for _ in range(500):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not reached")
+
+
+async def _finish(client, task_id):
+    for _ in range(500):
+        result = (await client.post("/tasks/get", json={"id": task_id})).json()
+        if result["status"] != "submitted" and result["status"] != "working":
+            return result["status"]
+        await asyncio.sleep(0.01)
+    return result["status"]
+
+
+def test_send_answers_429_with_retry_after_when_the_queue_is_full():
+    agent = _Agent()
+
+    async def scenario(client, admission):
+        first = asyncio.ensure_future(client.post("/tasks/send", json=_task()))
+        await _until(lambda: admission.in_flight == 1)
+        busy = await client.post("/tasks/send", json=_task())
+        agent.gate.set()
+        return (await first).status_code, busy
+
+    status, busy = _serve(agent, scenario, max_in_flight=1, max_queue=0)
+    assert status == 200
+    assert busy.status_code == 429
+    assert int(busy.headers["Retry-After"]) >= 1
+    assert busy.json()["retry_after"] == int(busy.headers["Retry-After"])
+
+
+def test_send_answers_503_after_the_queue_timeout():
+    agent = _Agent()
+
+    async def scenario(client, admission):
+        first = asyncio.ensure_future(client.post("/tasks/send", json=_task()))
+        await _until(lambda: admission.in_flight == 1)
+        late = await client.post("/tasks/send", json=_task())
+        agent.gate.set()
+        await first
+        return late
+
+    late = _serve(agent, scenario, max_in_flight=1, max_queue=1, queue_timeout=0.05)
+    assert late.status_code == 503
+    assert "Retry-After" in late.headers
+
+
+def test_burst_of_submits_is_admitted_or_rejected_up_front():
+    agent = _Agent()
+
+    async def scenario(client, admission):
+        responses = await asyncio.gather(
+            *(client.post("/tasks/submit", json=_task()) for _ in range(5)))
+        agent.gate.set()
+        accepted = [r.json()["id"] for r in responses if r.status_code == 202]
+        finished = [await _finish(client, task_id) for task_id in accepted]
+        return sorted(r.status_code for r in responses), finished
+
+    statuses, finished = _serve(agent, scenario, max_in_flight=1, max_queue=1)
+    assert statuses == [202, 202, 429, 429, 429]
+    assert finished == ["completed", "completed"]
+
+
+def test_submitted_task_that_cannot_run_is_marked_failed(monkeypatch):
+    def broken(self, task_id):
+        raise RuntimeError("worker pool is gone")
+
+    monkeypatch.setattr(TaskManager, "run", broken)
+
+    async def scenario(client, admission):
+        submitted = await client.post("/tasks/submit", json=_task())
+        return await _finish(client, submitted.json()["id"])
+
+    assert _serve(_Agent(), scenario) == "failed"
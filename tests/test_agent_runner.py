@@ -0,0 +1,113 @@
+"""ADKAgentRunner: one persistent event loop per runner, sessions freed per task."""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from src.a2a.types import Message, Task, TaskResult, TaskStatus, TextPart
+from src.adk.agent_runner import ADKAgentRunner
+
+
+def _task(text="go"):
+    return Task(message=Message(role="user", parts=[TextPart(text=text)]))
+
+
+@pytest.fixture
+def runner(monkeypatch):
+    """A runner whose ADK call only records the loop and thread it ran on."""
+    runner = ADKAgentRunner(agent=None, name="backend", skill_description="Builds APIs")
+    seen = []
+
+    async def handle(task):
+        seen.append((asyncio.get_running_loop(), threading.current_thread()))
+        if task.message.parts[0].text == "fail":
+            raise RuntimeError("model unavailable")
+        return TaskResult(id=task.id, status=TaskStatus.completed)
+
+    monkeypatch.setattr(runner, "_handle_async", handle)
+    runner.seen = seen
+    yield runner
+    runner.close()
+
+
+def test_sync_calls_from_many_threads_share_one_loop(runner):
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(runner.handle_a2a_task(_task())))
+               for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert [r.status for r in results] == [TaskStatus.completed] * 4
+    assert len({loop for loop, _ in runner.seen}) == 1
+    assert {thread.name for _, thread in runner.seen} == {"adk-backend"}
+
+
+def test_async_callers_are_run_on_the_runner_loop(runner):
+    result = asyncio.run(runner.ahandle_a2a_task(_task()))
+    runner.handle_a2a_task(_task())
+    assert result.status == TaskStatus.completed
+    assert runner.seen[0] == runner.seen[1]
+    assert runner.seen[0][0] is runner._loop
+
+
+def test_errors_become_failed_results(runner):
+    result = runner.handle_a2a_task(_task("fail"))
+    assert result.status == TaskStatus.failed
+    assert result.error == "model unavailable"
+
+
+def test_close_stops_the_loop_and_the_next_task_restarts_it(runner):
+    runner.handle_a2a_task(_task())
+    first_loop, thread = runner.seen[0]
+    runner.close()
+    assert not thread.is_alive() and first_loop.is_closed()
+    assert runner.stats()["loop_running"] is False
+
+    assert runner.handle_a2a_task(_task()).status == TaskStatus.completed
+    assert runner.seen[1][0] is not first_loop
+
+
+class _Sessions:
+    def __init__(self):
+        self.live = set()
+
+    async def create_session(self, app_name, user_id):
+        session = SimpleNamespace(id=f"s{len(self.live)}")
+        self.live.add(session.id)
+        return session
+
+    async def delete_session(self, app_name, user_id, session_id):
+        self.live.discard(session_id)
+
+
+class _Runner:
+    def __init__(self, reply):
+        self.reply = reply
+
+    async def run_async(self, user_id, session_id, new_message):
+        part = SimpleNamespace(text=self.reply)
+        yield SimpleNamespace(is_final_response=lambda: True,
+                              content=SimpleNamespace(parts=[part]))
+
+
+def test_sessions_are_deleted_when_the_task_finishes():
+    pytest.importorskip("google.genai")
+    runner = ADKAgentRunner(agent=None, name="backend", skill_description="Builds APIs")
+    runner._session_service = _Sessions()
+    runner._runner = _Runner("```file:app.py\nprint(1)\n```")
+    try:
+        result = runner.handle_a2a_task(_task())
+    finally:
+        runner.close()
+    assert result.get_files() == [("app.py", "print(1)\n")]
+    assert runner._session_service.live == set()
+    assert runner.stats()["live_sessions"] == 0 and runner.stats()["tasks_handled"] == 1
+
+
+def test_agent_card_advertises_streaming():
+    card = ADKAgentRunner(None, "backend", "Builds APIs").get_agent_card(port=8102)
+    assert card.capabilities["streaming"] is True
+    assert card.url == "http://localhost:8102"
@@ -0,0 +1,52 @@
+"""BaseAgent A2A entry points: the async handler uses the async provider path."""
+
+import asyncio
+
+from src.a2a.types import Message, Task, TextPart
+from src.agents.backend import BackendAgent
+from src.agents.coder import CoderAgent
+from src.providers.base import BaseProvider, ProviderConfig
+
+REPLY = "Done.\n```file:app.py\nprint('hi')\n```\n"
+
+
+class _Provider(BaseProvider):
+    def __init__(self):
+        super().__init__(ProviderConfig(name="fake", model="m"))
+        self.sync_calls = 0
+        self.async_calls = 0
+
+    def chat(self, messages, system=""):
+        self.sync_calls += 1
+        return REPLY
+
+    def stream(self, messages, system=""):
+        yield self.chat(messages, system)
+
+    async def achat(self, messages, system=""):
+        self.async_calls += 1
+        return REPLY
+
+
+def _task():
+    return Task(message=Message(role="user", parts=[TextPart(text="write app.py")]))
+
+
+def test_async_handler_runs_through_ainvoke(tmp_path):
+    provider = _Provider()
+    result = asyncio.run(CoderAgent(provider, tmp_path).ahandle_a2a_task(_task()))
+    assert result.get_files() == [("app.py", "print('hi')\n")]
+    assert (provider.async_calls, provider.sync_calls) == (1, 0)
+
+
+def test_sync_and_async_handlers_agree(tmp_path):
+    agent = CoderAgent(_Provider(), tmp_path)
+    sync = agent.handle_a2a_task(_task())
+    async_ = asyncio.run(agent.ahandle_a2a_task(_task()))
+    assert sync.get_files() == async_.get_files()
+    assert sync.get_text() == async_.get_text()
+
+
+def test_agents_overriding_the_sync_handler_have_no_async_one():
+    assert BackendAgent.ahandle_a2a_task is None
+    assert CoderAgent.ahandle_a2a_task is not None
@@ -0,0 +1,68 @@
+"""ArtifactStore: revisions, duplicate and stale conflicts."""
+
+import threading
+
+from src.adk.artifacts import ArtifactStore
+
+
+def test_revisions_track_agent_and_version():
+    store = ArtifactStore()
+    assert store.put("app.py", "v1", "backend").version == 1
+    assert store.put("app.py", "v1", "backend").version == 1  # identical: no-op
+    assert store.put("app.py", "v2", "backend").version == 2
+    assert [r.content for r in store.history("app.py")] == ["v1", "v2"]
+    assert store.conflicts == []
+
+
+def test_duplicate_from_another_agent_is_rejected_once():
+    store = ArtifactStore()
+    store.put("requirements.txt", "fastapi", "backend")
+    assert store.put("requirements.txt", "flask", "ci") is None
+    assert store.put("requirements.txt", "flask", "ci") is None
+    assert store.get("requirements.txt").agent == "backend"
+    [conflict] = store.conflicts
+    assert conflict.kind == "duplicate"
+    assert "keeping backend's version" in str(conflict)
+
+
+def test_identical_content_from_another_agent_is_not_a_conflict():
+    store = ArtifactStore()
+    store.put("Dockerfile", "FROM python", "ci")
+    assert store.put("Dockerfile", "FROM python", "deploy").agent == "ci"
+    assert store.conflicts == []
+
+
+def test_stale_patch_is_rejected():
+    store = ArtifactStore()
+    base = store.put("app.py", "v1", "backend").version
+    store.put("app.py", "v2", "backend")
+    assert store.patch("app.py", "patched v1", "security", base=base) is None
+    assert store.get("app.py").content == "v2"
+    assert store.conflicts[0].kind == "stale"
+
+
+def test_patch_against_current_version_applies():
+    store = ArtifactStore()
+    base = store.put("app.py", "v1", "backend").version
+    rev = store.patch("app.py", "patched", "security", base=base)
+    assert rev.version == 2 and store.get("app.py").agent == "security"
+
+
+def test_concurrent_agents_get_one_winner_per_path():
+    store = ArtifactStore()
+    accepted = []
+    barrier = threading.Barrier(8)
+
+    def agent(n):
+        barrier.wait()
+        if store.put("shared.txt", f"agent {n}", f"agent{n}") is not None:
+            accepted.append(n)
+
+    threads = [threading.Thread(target=agent, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(accepted) == 1
+    assert len(store.history("shared.txt")) == 1
+    assert len(store.conflicts) == 7
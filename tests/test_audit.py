@@ -0,0 +1,47 @@
+"""AuditWriter: no entry is lost around close()."""
+
+import json
+import threading
+
+from src.security.audit import AuditWriter
+
+
+def _lines(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_entries_are_written_in_order(tmp_path):
+    writer = AuditWriter(tmp_path / "audit.log")
+    for i in range(100):
+        writer.write({"n": i})
+    writer.close()
+    assert [e["n"] for e in _lines(tmp_path / "audit.log")] == list(range(100))
+
+
+def test_writes_racing_close_are_not_lost(tmp_path):
+    for _ in range(20):
+        path = tmp_path / "race.log"
+        path.unlink(missing_ok=True)
+        writer = AuditWriter(path)
+        start = threading.Barrier(5)
+
+        def produce(k):
+            start.wait()
+            for i in range(50):
+                writer.write({"k": k, "i": i})
+
+        threads = [threading.Thread(target=produce, args=(k,)) for k in range(4)]
+        for t in threads:
+            t.start()
+        start.wait()
+        writer.close()
+        for t in threads:
+            t.join()
+        assert len(_lines(path)) == 200
+
+
+def test_write_after_close_is_synchronous(tmp_path):
+    writer = AuditWriter(tmp_path / "audit.log")
+    writer.close()
+    writer.write({"late": True})
+    assert _lines(tmp_path / "audit.log") == [{"late": True}]
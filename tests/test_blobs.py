@@ -0,0 +1,109 @@
+"""Blob store: digests, the LRU cap, hydrate() and the have/want upload exchange."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from src.a2a.blobs import REFS_KEY, BlobStore, MissingBlobs, digest, hydrate
+from src.a2a.client import A2AClient
+from src.a2a.server import create_a2a_app
+from src.a2a.types import Message, Task, TaskResult, TaskStatus, TextPart
+
+
+def _task(refs=None, files=None):
+    context = {}
+    if refs is not None:
+        context[REFS_KEY] = refs
+    if files is not None:
+        context["files"] = files
+    return Task(message=Message(role="user", parts=[TextPart(text="go")]), context=context)
+
+
+def test_put_is_content_addressed_and_checks_the_key():
+    store = BlobStore()
+    key = store.put("x = 1\n")
+    assert key == digest("x = 1\n") and store.get(key) == "x = 1\n"
+    assert store.put("x = 1\n", key) == key
+    with pytest.raises(ValueError, match="does not match"):
+        store.put("x = 2\n", key)
+    assert store.stats() == {"blobs": 1, "bytes": 6}
+
+
+def test_missing_is_the_want_list_without_duplicates():
+    store = BlobStore()
+    have = store.put("a")
+    want = digest("b")
+    assert store.missing([have, want, want]) == [want]
+
+
+def test_least_recently_used_blobs_are_dropped_past_the_byte_cap():
+    store = BlobStore(max_bytes=8)
+    a, b = store.put("aaaa"), store.put("bbbb")
+    store.get(a)                 # a is now more recent than b
+    c = store.put("cccc")
+    assert store.missing([a, b, c]) == [b]
+
+
+def test_hydrate_swaps_refs_for_files():
+    store = BlobStore()
+    refs = store.refs({"a.py": "a = 1\n"})
+    task = hydrate(_task(refs, files={"b.py": "b = 2\n"}), store)
+    assert task.context == {"files": {"b.py": "b = 2\n", "a.py": "a = 1\n"}}
+    assert hydrate(_task(), store).context == {}
+
+    with pytest.raises(MissingBlobs) as e:
+        hydrate(_task({"c.py": digest("c")}), store)
+    assert e.value.digests == [digest("c")]
+
+
+class _Agent:
+    name = "fake"
+
+    def __init__(self):
+        self.files = []
+
+    def handle_a2a_task(self, task):
+        self.files.append(task.context["files"])
+        return TaskResult(id=task.id, status=TaskStatus.completed)
+
+
+def test_http_clients_upload_only_the_blobs_the_server_wants(monkeypatch):
+    agent, server_blobs = _Agent(), BlobStore()
+    app = create_a2a_app(agent, task_db=":memory:", blobs=server_blobs)
+    uploads = []
+
+    async def record(request):
+        if request.url.path == "/blobs":
+            uploads.append(len(json.loads(request.content)["blobs"]))
+
+    def make_async(self):
+        return httpx.AsyncClient(transport=httpx.ASGITransport(app=app),
+                                 event_hooks={"request": [record]})
+
+    monkeypatch.setattr(A2AClient, "_make_async", make_async)
+
+    async def run():
+        client_blobs = BlobStore()
+        async with A2AClient("http://agent", blobs=client_blobs) as client:
+            first = client_blobs.refs({"a.py": "a = 1\n", "b.py": "b = 2\n"})
+            second = client_blobs.refs({"a.py": "a = 1\n", "b.py": "b = 3\n"})
+            return [(await client.asend_task(_task(refs))).status for refs in (first, second)]
+
+    assert asyncio.run(run()) == [TaskStatus.completed] * 2
+    assert uploads == [2, 1]
+    assert agent.files[1] == {"a.py": "a = 1\n", "b.py": "b = 3\n"}
+
+
+def test_unknown_digests_get_409_with_the_missing_list():
+    app = create_a2a_app(_Agent(), task_db=":memory:", blobs=BlobStore())
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://agent") as client:
+            return await client.post("/tasks/send", json=_task({"a.py": digest("a")}).model_dump())
+
+    resp = asyncio.run(run())
+    assert resp.status_code == 409
+    assert resp.json()["missing"] == [digest("a")]
@@ -0,0 +1,86 @@
+"""Response cache: discard, TTL and LRU eviction on disk."""
+
+import json
+import os
+import time
+
+import pytest
+
+from src.agents.planner import PlannerAgent
+from src.providers.base import BaseProvider, ProviderConfig
+from src.providers.cache import ResponseCache
+
+
+def test_discard_drops_both_tiers(tmp_path):
+    cache = ResponseCache(cache_dir=tmp_path)
+    cache.put("k1", "bad answer")
+    cache.discard("k1")
+    assert cache.get("k1") is None
+    assert not list(tmp_path.glob("*/*.json"))
+
+
+def test_expired_entry_is_evicted_even_if_read(tmp_path):
+    cache = ResponseCache(cache_dir=tmp_path, ttl_seconds=100)
+    path = cache._path_for("old")
+    path.parent.mkdir(parents=True)
+    created = time.time() - 90
+    path.write_text(json.dumps({"created": created, "response": "x"}))
+    os.utime(path, (created, created))
+
+    assert cache.get("old") == "x"   # still fresh; the read must not renew it
+    cache.ttl_seconds = 50           # now it is past its TTL
+    cache._evict_disk()
+    assert not path.exists()
+
+
+def test_reads_keep_creation_time_as_mtime(tmp_path):
+    cache = ResponseCache(cache_dir=tmp_path)
+    cache.put("k", "value")
+    path = next(tmp_path.glob("*/*.json"))
+    mtime = path.stat().st_mtime
+    time.sleep(0.01)
+    fresh = ResponseCache(cache_dir=tmp_path)
+    assert fresh.get("k") == "value"
+    assert path.stat().st_mtime == pytest.approx(mtime)
+    assert path.stat().st_atime >= mtime
+
+
+def test_lru_eviction_keeps_recently_read_entries(tmp_path):
+    cache = ResponseCache(cache_dir=tmp_path, max_disk_bytes=10**6)
+    for key in ("a1", "b2", "c3"):
+        cache.put(key, "x" * 100)
+    now = time.time()
+    for i, key in enumerate(("b2", "c3", "a1")):  # a1 read most recently
+        path = cache._path_for(key)
+        os.utime(path, (now + i, path.stat().st_mtime))
+    size = cache._path_for("a1").stat().st_size
+    cache.max_disk_bytes = int(2.2 * size / 0.9)  # room for two entries
+    cache._evict_disk()
+    assert not cache._path_for("b2").exists()
+    assert cache._path_for("a1").exists() and cache._path_for("c3").exists()
+
+
+class _Scripted(BaseProvider):
+    def __init__(self, replies):
+        super().__init__(ProviderConfig(name="scripted", model="m"))
+        self.replies = list(replies)
+        self.calls = 0
+
+    def chat(self, messages, system=""):
+        self.calls += 1
+        return self.replies.pop(0)
+
+    def stream(self, messages, system=""):
+        yield self.chat(messages, system)
+
+
+def test_planner_does_not_replay_an_unparsable_plan(tmp_path):
+    provider = _Scripted(["not: [valid", "tasks:\n  - id: t1\n    name: One\n"])
+    provider.cache = ResponseCache(cache_dir=tmp_path / "cache")
+    planner = PlannerAgent(provider, tmp_path)
+
+    with pytest.raises(Exception):
+        planner.analyze_and_plan("# App", "")
+    plan = planner.analyze_and_plan("# App", "")
+    assert plan["tasks"][0]["id"] == "t1"
+    assert provider.calls == 2
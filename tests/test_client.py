@@ -0,0 +1,110 @@
+"""A2AClient: pooled connections per origin and retries of busy servers."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from src.a2a import client as client_mod
+from src.a2a.client import A2AClient, PoolLimits
+from src.a2a.types import Message, Task, TaskResult, TaskStatus, TextPart
+
+
+@pytest.fixture
+def requests(monkeypatch):
+    """Route every pooled client through a mock transport; answers 200s by default."""
+    seen, answers = [], []
+
+    def handler(request):
+        seen.append(request.url.path)
+        if answers:
+            return answers.pop(0)
+        result = TaskResult(id=json.loads(request.content)["id"], status=TaskStatus.completed)
+        return httpx.Response(200, json=result.model_dump(mode="json"))
+
+    def make_sync(self):
+        return httpx.Client(transport=httpx.MockTransport(handler))
+
+    def make_async(self):
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    monkeypatch.setattr(A2AClient, "_make_sync", make_sync)
+    monkeypatch.setattr(A2AClient, "_make_async", make_async)
+    monkeypatch.setattr(client_mod.time, "sleep", lambda seconds: None)
+    return seen, answers
+
+
+def _task():
+    return Task(message=Message(role="user", parts=[TextPart(text="go")]))
+
+
+def test_clients_for_the_same_origin_share_one_pool(requests):
+    a = A2AClient.for_url("http://localhost:8102")
+    b = A2AClient.for_url("http://localhost:8102/")
+    other = A2AClient.for_url("http://localhost:8103")
+    limited = A2AClient.for_url("http://localhost:8102", limits=PoolLimits(max_connections=5))
+
+    assert a._sync_client() is b._sync_client()
+    assert other._sync_client() is not a._sync_client()
+    assert limited._sync_client() is not a._sync_client()
+    for client in (a, b, other, limited):
+        client.close()
+
+
+def test_the_pool_is_closed_with_its_last_user(requests):
+    a = A2AClient.for_url("http://localhost:8102")
+    b = A2AClient.for_url("http://localhost:8102")
+    pool = a._sync_client()
+    b._sync_client()
+
+    a.close()
+    a.close()  # a second close does not drop b's reference
+    assert not pool.is_closed
+    b.close()
+    assert pool.is_closed
+    with pytest.raises(RuntimeError, match="closed"):
+        a._sync_client()
+
+
+def test_send_task_reuses_the_pooled_client(requests):
+    seen, _ = requests
+    with A2AClient.for_url("http://localhost:8102") as client:
+        assert client.send_task(_task()).status == TaskStatus.completed
+        pool = client._sync_client()
+        assert client.send_task(_task()).status == TaskStatus.completed
+        assert client._sync_client() is pool
+    assert seen == ["/tasks/send", "/tasks/send"]
+
+
+def test_busy_answers_are_retried_then_reported(requests):
+    seen, answers = requests
+    answers.extend([httpx.Response(429, headers={"Retry-After": "2"}),
+                    httpx.Response(503, headers={"Retry-After": "1"})])
+    with A2AClient.for_url("http://localhost:8102", priority="batch") as client:
+        assert client.send_task(_task()).status == TaskStatus.completed
+    assert seen == ["/tasks/send"] * 3
+
+    seen.clear()
+    answers.extend([httpx.Response(429)] * 2)
+    with A2AClient("http://localhost:8102", busy_retries=1) as client:
+        result = client.send_task(_task())
+    assert result.status == TaskStatus.failed
+    assert result.error.startswith("HTTP 429")
+
+
+def test_async_clients_are_pooled_per_event_loop(requests):
+    async def scenario():
+        a = A2AClient.for_url("http://localhost:8102")
+        b = A2AClient.for_url("http://localhost:8102")
+        pool = a._async_client()
+        assert b._async_client() is pool
+        assert (await a.asend_task(_task())).status == TaskStatus.completed
+        await a.aclose()
+        assert not pool.is_closed
+        await b.aclose()
+        assert pool.is_closed
+        return pool
+
+    first = asyncio.run(scenario())
+    assert asyncio.run(scenario()) is not first
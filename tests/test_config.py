@@ -0,0 +1,77 @@
+"""Per-agent provider overrides from the `agents:` section of the config."""
+
+import pytest
+
+from src.config import get_agent_provider_configs, get_provider_config
+from src.orchestrator import BuildOrchestrator
+from src.providers.base import ProviderConfig
+from src.providers.router import RouterConfig
+
+CONFIG = {
+    "providers": [
+        {"name": "anthropic", "api_key": "sk-a", "model": "claude-sonnet-4", "max_tokens": 8192},
+        {"name": "openai", "api_key": "sk-o", "model": "gpt-4o"},
+        {"name": "ollama", "base_url": "http://localhost:11434", "model": "llama3.1"},
+    ],
+}
+
+
+def _configs(agents, config=CONFIG, provider=None):
+    config = {**config, "agents": agents}
+    return get_agent_provider_configs(config, get_provider_config(config, provider))
+
+
+def test_only_agents_with_an_entry_get_a_config():
+    assert _configs({}) == {}
+    assert _configs(None) == {}
+
+
+def test_entries_override_the_build_provider():
+    configs = _configs({
+        "planner": {"model": "claude-opus-4"},
+        "ci": {"provider": "ollama"},
+        "reviewer": {"provider": "openai", "model": "gpt-4o-mini", "max_tokens": 2048},
+        "coder": None,
+    })
+    assert (configs["planner"].name, configs["planner"].model) == ("anthropic", "claude-opus-4")
+    assert configs["planner"].max_tokens == 8192
+    assert (configs["ci"].name, configs["ci"].model) == ("ollama", "llama3.1")
+    assert configs["reviewer"] == ProviderConfig(
+        name="openai", api_key="sk-o", model="gpt-4o-mini", max_tokens=2048)
+    assert configs["coder"] == get_provider_config(CONFIG)
+
+
+def test_unknown_agents_are_rejected():
+    with pytest.raises(ValueError, match="Unknown agent.*tester.*Valid: planner"):
+        _configs({"tester": {"model": "m"}})
+
+
+def test_a_routed_agent_cannot_set_only_a_model():
+    with pytest.raises(ValueError, match="Agent 'backend' sets a model while routing"):
+        _configs({"backend": {"model": "gpt-4o"}}, provider="router")
+    with pytest.raises(ValueError, match="Agent 'backend' sets a model"):
+        _configs({"backend": {"provider": "router", "model": "gpt-4o"}})
+
+
+def test_a_routed_agent_may_cap_max_tokens_on_every_route():
+    configs = _configs({"backend": {"provider": "router", "max_tokens": 1024},
+                        "planner": {"provider": "openai", "model": "gpt-4o-mini"}},
+                       provider="router")
+    backend = configs["backend"]
+    assert isinstance(backend, RouterConfig)
+    assert [(r.name, r.max_tokens) for r in backend.routes] == [
+        ("anthropic", 1024), ("openai", 1024)]
+    assert configs["planner"].model == "gpt-4o-mini"
+
+
+def test_agents_with_the_same_settings_share_a_provider(tmp_path):
+    ollama = ProviderConfig(name="ollama", model="m")
+    orch = BuildOrchestrator(ollama, tmp_path, review=False, agent_configs={
+        "ci": ProviderConfig(name="ollama", model="small"),
+        "deploy": ProviderConfig(name="ollama", model="small"),
+    })
+    assert orch._provider_for("planner") is orch.provider
+    ci = orch._provider_for("ci")
+    assert ci is orch._provider_for("deploy") and ci is not orch.provider
+    assert ci.config.model == "small"
+    assert ci.usage is orch.provider.usage
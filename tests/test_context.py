@@ -0,0 +1,51 @@
+"""FileIndex: pruned walk and the persistent content index."""
+
+import os
+
+from src import context
+from src.context import FileIndex, walk_project
+
+
+def _project(tmp_path):
+    (tmp_path / ".forge").mkdir()
+    (tmp_path / "app.py").write_text("print('hi')\n")
+    (tmp_path / "logo.bin").write_bytes(b"\x89PNG\0\0data")
+    (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+    (tmp_path / "node_modules" / "pkg" / "index.js").write_text("x")
+    (tmp_path / ".env").write_text("SECRET=1")
+    return tmp_path
+
+
+def test_walk_prunes_skipped_dirs_and_sensitive_files(tmp_path):
+    paths = [p.as_posix() for p in walk_project(_project(tmp_path))]
+    assert paths == ["app.py", "logo.bin"]
+
+
+def test_new_process_serves_unchanged_files_from_the_index(tmp_path, monkeypatch):
+    root = _project(tmp_path)
+    assert [(p.as_posix(), c) for p, c in FileIndex(root).files()] == [("app.py", "print('hi')\n")]
+
+    reads = []
+    real = context._read_text
+    monkeypatch.setattr(context, "_read_text", lambda path: reads.append(path) or real(path))
+    assert [c for _, c in FileIndex(root).files()] == ["print('hi')\n"]
+    assert reads == []  # neither the text file nor the binary was read
+
+
+def test_changed_file_is_read_again(tmp_path):
+    root = _project(tmp_path)
+    FileIndex(root).files()
+    path = root / "app.py"
+    path.write_text("print('changed')\n")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert [c for _, c in FileIndex(root).files()] == ["print('changed')\n"]
+
+
+def test_deleted_files_leave_the_index(tmp_path):
+    root = _project(tmp_path)
+    index = FileIndex(root)
+    index.files()
+    (root / "app.py").unlink()
+    assert index.files() == []
+    assert "app.py" not in FileIndex(root)._entries
@@ -0,0 +1,77 @@
+"""Streamed file extraction: blocks are emitted as they close, same as extract_files."""
+
+import pytest
+
+from src.agents.base import BaseAgent
+from src.agents.file_stream import FileBlockParser, FileStream
+
+RESPONSE = """Here is the project.
+
+```file:src/app.py
+def main():
+    print("hi")
+```
+
+Some notes, with an example that is not a file:
+
+```bash
+pip install flask
+```
+
+```file:/README.md
+# App
+```
+Done.
+"""
+
+
+def extract_files(text):
+    return BaseAgent.extract_files(None, text)  # uses no agent state
+
+
+def _chunked(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 64, len(RESPONSE)])
+def test_any_chunking_gives_the_same_files_as_extract_files(size):
+    stream = FileStream(_chunked(RESPONSE, size))
+    assert list(stream) == extract_files(RESPONSE)
+    assert stream.response == RESPONSE
+
+
+def test_a_block_is_emitted_as_soon_as_its_fence_closes():
+    parser = FileBlockParser()
+    assert parser.feed("```file:src/a.py\nx = 1\n") == []
+    assert parser.feed("```\n") == [("src/a.py", "x = 1\n")]
+    assert parser.feed("```file:src/b.py\ny = 2\n") == []
+
+
+def test_files_reach_the_caller_before_the_stream_ends():
+    seen = []
+
+    def chunks():
+        yield "```file:src/a.py\nx = 1\n```\n"
+        seen.append("after first block")
+        yield "```file:src/b.py\ny = 2\n```\n"
+
+    stream = iter(FileStream(chunks()))
+    assert next(stream) == ("src/a.py", "x = 1\n")
+    assert seen == []
+    assert next(stream) == ("src/b.py", "y = 2\n")
+
+
+def test_path_fences_only_count_before_the_first_file_fence():
+    text = "```src/a.py\na\n```\n```file:src/b.py\nb\n```\n```src/c.py\nc\n```\n"
+    assert list(FileStream([text])) == [("src/a.py", "a\n"), ("src/b.py", "b\n")]
+
+
+def test_unterminated_block_is_dropped():
+    assert list(FileStream(["```file:src/a.py\nx = 1\n"])) == []
+
+
+def test_other_formats_fall_back_to_extract_files():
+    text = "--- src/app.py ---\nprint(1)\n--- end ---\n"
+    stream = FileStream([text], fallback=extract_files)
+    assert list(stream) == [("src/app.py", "print(1)\n")]
+    assert stream.files == [("src/app.py", "print(1)\n")]
@@ -0,0 +1,117 @@
+"""Incremental rebuilds: which tasks a spec edit makes stale."""
+
+from src.fingerprint import split_sections, stale_tasks, task_fingerprint, unplanned_sections
+from src.state import TaskState
+
+SPEC = """# Todo App
+A small service.
+
+## Users
+Users register and login with email and password.
+
+## Todos
+Todo items have a title and a done flag.
+"""
+
+
+def _plan(spec, tmp_path):
+    tasks = [
+        TaskState(id="t1", name="User accounts", description="register and login users",
+                  files=["users.py"]),
+        TaskState(id="t2", name="Todo items", description="todo title and done flag",
+                  files=["todos.py"]),
+    ]
+    for task in tasks:
+        task.status = "completed"
+        task.fingerprint = task_fingerprint(task, spec, "", "")
+    return tasks
+
+
+def test_unchanged_spec_is_clean(tmp_path):
+    tasks = _plan(SPEC, tmp_path)
+    assert stale_tasks(tasks, SPEC, "", "", tmp_path) == set()
+
+
+def test_edit_to_one_section_only_stales_its_task(tmp_path):
+    tasks = _plan(SPEC, tmp_path)
+    spec = SPEC.replace("a title and a done flag", "a title, a done flag and a due date")
+    assert stale_tasks(tasks, spec, "", "", tmp_path) == {1}
+
+
+def test_section_no_task_matches_is_unplanned_not_stale(tmp_path):
+    tasks = _plan(SPEC, tmp_path)
+    billing = "## Billing\nCharge monthly subscriptions through Stripe invoices."
+    spec = SPEC + "\n" + billing + "\n"
+    assert stale_tasks(tasks, spec, "", "", tmp_path) == set()
+    assert unplanned_sections(spec, tasks) == [billing]
+
+
+def test_trailing_blank_lines_are_not_edits(tmp_path):
+    tasks = _plan(SPEC, tmp_path)
+    assert split_sections("# A\nx\n") == split_sections("# A\nx\n\n\n")
+    assert stale_tasks(tasks, SPEC + "\n\n\n", "", "", tmp_path) == set()
+
+
+class _Planner:
+    def __init__(self):
+        self.features = []
+
+    def plan_incremental(self, spec, rules, feature, existing_context):
+        self.features.append(feature)
+        return {"tasks": [
+            {"id": "task_01", "name": "Billing", "description": "stripe subscriptions invoices",
+             "files": ["billing.py"]},
+            {"id": "task_02", "name": "Billing routes", "description": "invoice endpoints",
+             "files": ["billing_routes.py"], "depends_on": ["task_01"]},
+        ]}
+
+
+def _orchestrator(tmp_path, spec):
+    from src.orchestrator import BuildOrchestrator
+    from src.providers.base import ProviderConfig
+    from src.state import compute_spec_hash
+
+    forge = tmp_path / ".forge"
+    forge.mkdir()
+    (forge / "spec.md").write_text(spec)
+    orch = BuildOrchestrator(ProviderConfig(name="ollama", model="m"), forge, review=False)
+    orch.state.tasks = _plan(spec, tmp_path)
+    for task in orch.state.tasks:
+        task.id = {"t1": "task_01", "t2": "task_02"}[task.id]
+    orch.state.status = "completed"
+    orch.state.spec_hash = compute_spec_hash(forge)
+    orch._record_unplanned(spec)
+    orch.planner = _Planner()
+    orch.ran = []
+    orch._execute_remaining_tasks = lambda spec, rules: orch.ran.extend(
+        t.id for t in orch.state.tasks if t.status != "completed")
+    return orch
+
+
+def test_new_section_is_planned_instead_of_rebuilding_everything(tmp_path):
+    orch = _orchestrator(tmp_path, SPEC)
+    billing = "## Billing\nCharge monthly subscriptions through Stripe invoices."
+    spec = SPEC + "\n" + billing + "\n"
+    (orch.forge_path / "spec.md").write_text(spec)
+
+    assert orch._phase_incremental(spec, "")
+    assert orch.planner.features == [billing]
+    assert orch.ran == ["task_03", "task_04"]
+    assert orch.state.tasks[3].depends_on == ["task_03"]
+
+    # Planned once: the next build has nothing left to do
+    for task in orch.state.tasks:
+        task.status = "completed"
+        task.fingerprint = task_fingerprint(task, spec, "", "")
+    assert not orch._phase_incremental(spec, "")
+    assert orch.planner.features == [billing]
+
+
+def test_whitespace_only_spec_edit_updates_the_hash(tmp_path):
+    from src.state import compute_spec_hash
+
+    orch = _orchestrator(tmp_path, SPEC)
+    (orch.forge_path / "spec.md").write_text(SPEC + "\n\n\n")
+    assert not orch._phase_incremental(SPEC + "\n\n\n", "")
+    assert orch.state.spec_hash == compute_spec_hash(orch.forge_path)
+    assert orch.ran == [] and orch.planner.features == []
@@ -0,0 +1,157 @@
+"""Compiled firewall rules give the same answers as the one-search-per-rule loop."""
+
+import re
+
+import pytest
+
+from src.orchestrator import BuildOrchestrator, _SUSPICIOUS_PATTERNS
+from src.security.firewall import DEFAULT_POLICY, AgenticFirewall
+from src.security.matcher import ContentRules, PatternSet, SMALL_LITERAL_SET
+
+
+def legacy_decision(policy: dict, filepath: str, content: str) -> tuple[bool, str]:
+    """(allowed, violation) as the firewall decided before rules were compiled."""
+    for pattern in policy.get("blocked_paths", []):
+        if re.search(pattern, filepath):
+            return False, "BLOCKED_PATH"
+    if not any(re.search(p, filepath) for p in policy.get("allowed_paths", [])):
+        return False, "PATH_NOT_IN_ALLOWLIST"
+    for pattern in policy.get("blocked_patterns", []):
+        if re.search(pattern, content):
+            return False, f"MALICIOUS_CONTENT_PATTERN: {pattern}"
+    return True, ""
+
+
+def legacy_first_rule(patterns, text, flags=0):
+    return next((p for p in patterns if re.search(p, text, flags)), None)
+
+
+@pytest.fixture
+def firewall(tmp_path):
+    fw = AgenticFirewall(audit_log=tmp_path / "audit.log")
+    yield fw
+    fw._audit.close()
+
+
+PATHS = [
+    "src/app.py",
+    "app/routes/todos.ts",
+    "README.md",
+    "docs/README.md",
+    "my-README.md",              # unanchored: "README.md" matches inside
+    "notes/readme.md",           # case matters
+    "Dockerfile",
+    "backend/Dockerfile",
+    "docker-compose.yml",
+    "docker-compose.yaml",
+    ".env",
+    ".env.production",
+    "src/.env.local",            # blocked anywhere in the path
+    "src/config/secrets.json",
+    "config/settings.json",
+    "config/secrets.json",
+    ".git/config",
+    "src/.github/workflows/ci.yml",
+    ".github/workflows/ci.yml",
+    "/etc/passwd",
+    "src/../../etc/hosts",
+    "home/user/.bash_history",
+    "random.txt",
+    "",
+]
+
+CONTENTS = [
+    "print('hello')",
+    "result = eval(user_input)",
+    "exec (code)",               # space: no match
+    "os.system('ls')",
+    "import subprocess\nsubprocess.run(['ls'])",
+    "mod = __import__('os')",
+    "value = getattr(obj, name); setattr(obj, name, 1)",
+    "setattr(obj, 'x', 1) then eval(x)",   # policy order, not text order
+    "import importlib\nimportlib.import_module('x')",
+    "evaluate(x)",
+    "",
+]
+
+
+@pytest.mark.parametrize("path", PATHS)
+def test_path_decisions_match_the_legacy_loop(firewall, path):
+    allowed, message = firewall.validate_file_write(path, "print('ok')")
+    legacy_allowed, violation = legacy_decision(DEFAULT_POLICY, path, "print('ok')")
+    assert allowed == legacy_allowed
+    if violation == "BLOCKED_PATH":
+        assert "prohibited" in message
+    elif violation:
+        assert "allowlist" in message
+
+
+@pytest.mark.parametrize("content", CONTENTS)
+def test_content_decisions_match_the_legacy_loop(firewall, content):
+    allowed, _ = firewall.validate_file_write("src/app.py", content)
+    assert allowed == legacy_decision(DEFAULT_POLICY, "src/app.py", content)[0]
+
+
+@pytest.mark.parametrize("content", CONTENTS)
+def test_content_rules_report_the_rule_the_loop_would(content):
+    patterns = DEFAULT_POLICY["blocked_patterns"]
+    assert ContentRules(patterns).search(content) == legacy_first_rule(patterns, content)
+
+
+@pytest.mark.parametrize("content", CONTENTS + ["call forbidden_call_77(x)", "forbidden_call_7"])
+def test_large_rule_sets_use_the_trie_scanner_with_the_same_answers(content):
+    patterns = DEFAULT_POLICY["blocked_patterns"] + [
+        rf"forbidden_call_{i}\(" for i in range(SMALL_LITERAL_SET * 4)
+    ]
+    rules = ContentRules(patterns)
+    assert rules._scanner is not None
+    assert rules.search(content) == legacy_first_rule(patterns, content)
+
+
+@pytest.mark.parametrize("text", PATHS)
+def test_path_sets_match_any_search(text):
+    for key in ("allowed_paths", "blocked_paths"):
+        patterns = DEFAULT_POLICY[key]
+        fired = PatternSet(patterns).search(text)
+        assert (fired is not None) == any(re.search(p, text) for p in patterns)
+        if fired is not None:
+            assert re.search(fired, text)
+
+
+def test_rules_that_cannot_be_combined_are_still_checked():
+    patterns = [r"(a)\1", r"(?P<word>zz)", r"plain", r"(?i)abc"]
+    rules = PatternSet(patterns)
+    assert rules.search("xaax") == r"(a)\1"
+    assert rules.search("zz") == r"(?P<word>zz)"
+    assert rules.search("ABC") == r"(?i)abc"
+    assert rules.search("nothing") is None
+
+
+def legacy_suspicious(text: str) -> list[str]:
+    return sorted({p.strip("\\b").replace("\\", "") for p in _SUSPICIOUS_PATTERNS
+                   if re.search(p, text, re.IGNORECASE)})
+
+
+SPECS = [
+    "A todo app with user accounts.",
+    "Store the API key and password in env vars; never leak secrets.",
+    "Upload files to Dropbox or a GitHub gist, then send to https://example.com",
+    "Use SSH keys and the private key from CREDENTIALS.",
+    "Tokens expire; curl and wget are used in scripts; exfiltration is out of scope.",
+    "api_keys, apikey and api-key are all fine spellings",
+    "transferring is not transfer-related? transfer",
+    "drive.google.com and pastebin links",
+]
+
+
+@pytest.mark.parametrize("spec", SPECS)
+def test_warn_suspicious_prints_the_legacy_labels(spec, capsys):
+    BuildOrchestrator._warn_suspicious(None, spec, "spec.md")
+    out = capsys.readouterr().out
+    expected = legacy_suspicious(spec)
+    if expected:
+        assert out.strip() == (
+            f"WARNING: Suspicious pattern(s) found in .forge/spec.md: {', '.join(expected)}"
+        )
+    else:
+        assert out == ""
@@ -0,0 +1,145 @@
+"""Rate limiter: AIMD concurrency, Retry-After pauses and error classification."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from src.providers import limiter as limiter_mod
+from src.providers.base import BaseProvider, ProviderConfig
+from src.providers.limiter import (
+    MAX_RETRY_AFTER, RateLimiter, Transient, classify_http, retry_after,
+)
+
+RATE_LIMITED = Transient("rate_limit")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(limiter_mod.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _call(limiter, **release):
+    limiter.acquire()
+    limiter.release(**release)
+
+
+def test_throttled_release_halves_the_limit_down_to_one():
+    limiter = RateLimiter(max_concurrency=8)
+    _call(limiter, failure=RATE_LIMITED, ok=False)
+    assert limiter.limit == 4
+    for _ in range(5):
+        _call(limiter, failure=Transient("overloaded"), ok=False)
+    assert limiter.limit == 1
+    assert limiter.throttled == 6
+
+
+def test_success_grows_the_limit_by_one_over_limit_up_to_the_ceiling():
+    limiter = RateLimiter(max_concurrency=4)
+    limiter.limit = 2.0
+    _call(limiter)
+    assert limiter.limit == 2.5
+    for _ in range(20):
+        _call(limiter)
+    assert limiter.limit == 4
+
+
+def test_other_failures_leave_the_limit_alone():
+    limiter = RateLimiter(max_concurrency=4)
+    limiter.limit = 2.0
+    _call(limiter, failure=Transient("timeout"), ok=False)
+    _call(limiter, ok=False)
+    assert limiter.limit == 2.0
+
+
+def test_in_flight_calls_are_capped_at_the_limit(clock):
+    limiter = RateLimiter(max_concurrency=2)
+    assert limiter._try_take(0) == 0
+    assert limiter._try_take(0) == 0
+    assert limiter._try_take(0) > 0
+    limiter.release()
+    assert limiter._try_take(0) == 0
+
+
+def test_retry_after_pauses_new_calls(clock):
+    limiter = RateLimiter()
+    _call(limiter, failure=RATE_LIMITED, ok=False, pause=5.0)
+    assert limiter._try_take(0) == pytest.approx(5.0)
+    clock[0] += 5.0
+    assert limiter._try_take(0) == 0
+
+
+def test_rate_limit_empties_the_request_bucket(clock):
+    limiter = RateLimiter(rpm=60)
+    _call(limiter, failure=RATE_LIMITED, ok=False)
+    assert limiter._try_take(0) == pytest.approx(1.0)  # one request per second
+    clock[0] += 1.0
+    assert limiter._try_take(0) == 0
+
+
+def test_output_tokens_are_charged_to_the_token_bucket(clock):
+    limiter = RateLimiter(tpm=600)
+    limiter.acquire(100)
+    limiter.release(tokens=600)
+    assert limiter._try_take(100) == pytest.approx(20.0)  # 200 tokens short at 10/s
+
+
+def _response(**headers):
+    return httpx.Response(429, headers=headers)
+
+
+def test_retry_after_headers():
+    assert retry_after(_response(**{"retry-after-ms": "1500"})) == 1.5
+    assert retry_after(_response(**{"retry-after": "7"})) == 7.0
+    assert retry_after(_response(**{"retry-after": "3600"})) == MAX_RETRY_AFTER
+    assert retry_after(_response(**{"retry-after": "soon"})) is None
+    assert retry_after(_response()) is None
+
+    when = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert retry_after(_response(**{"retry-after": when})) == pytest.approx(30, abs=2)
+
+
+def _status_error(status, **headers):
+    request = httpx.Request("POST", "https://api.example.com")
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+def test_classify_http():
+    throttled = _status_error(429, **{"retry-after": "2"})
+    assert classify_http(throttled) == Transient("rate_limit", 2.0)
+    assert classify_http(_status_error(529)) == Transient("overloaded")
+    assert classify_http(_status_error(500)) == Transient("server")
+    assert classify_http(_status_error(400)) is None
+    assert classify_http(httpx.ReadTimeout("slow")) == Transient("timeout")
+    assert classify_http(httpx.ConnectError("refused")) == Transient("connection")
+    assert classify_http(ValueError("bad request")) is None
+
+
+class _Throttled(BaseProvider):
+    """Answers with a 429 carrying Retry-After, then succeeds."""
+
+    def __init__(self):
+        super().__init__(ProviderConfig(name="throttled-test", model="m"))
+        self.limiter = RateLimiter(max_concurrency=4)
+        self.calls = 0
+
+    def chat(self, messages, system=""):
+        self.calls += 1
+        if self.calls == 1:
+            raise _status_error(429, **{"retry-after": "0"})
+        return "ok"
+
+    def stream(self, messages, system=""):
+        yield self.chat(messages, system)
+
+
+def test_provider_retries_a_throttled_call_after_the_server_pause():
+    provider = _Throttled()
+    assert provider._chat_with_backoff([{"role": "user", "content": "hi"}], "", 3) == "ok"
+    assert provider.calls == 2
+    assert provider.limiter.throttled == 1
+    assert provider.limiter.limit == 2.5  # halved to 2, then one success
@@ -0,0 +1,89 @@
+"""Segmented prompts: a shared cacheable prefix and where breakpoints go."""
+
+from types import SimpleNamespace
+
+from src.agents.backend import BackendAgent
+from src.agents.frontend import FrontendAgent
+from src.providers.anthropic import AnthropicProvider
+from src.providers.base import BaseProvider, ProviderConfig
+from src.providers.prompt import (
+    EPHEMERAL, MAX_BREAKPOINTS, anthropic_messages, anthropic_system,
+    project_prefix, segment, text_of,
+)
+
+
+class _Provider(BaseProvider):
+    def __init__(self):
+        super().__init__(ProviderConfig(name="fake", model="m"))
+        self.prompts = []
+
+    def chat(self, messages, system=""):
+        self.prompts.append(messages[-1]["content"])
+        return "ok"
+
+    def stream(self, messages, system=""):
+        yield self.chat(messages, system)
+
+
+def test_agents_share_a_byte_identical_cacheable_prefix(tmp_path):
+    provider = _Provider()
+    BackendAgent(provider, tmp_path).generate_backend("SPEC", "RULES", "DECISIONS")
+    FrontendAgent(provider, tmp_path).generate_frontend(
+        "SPEC", "RULES", "DECISIONS", backend_files=["app/main.py"])
+
+    backend, frontend = provider.prompts
+    assert backend[0] == frontend[0] == project_prefix("SPEC", "RULES", "DECISIONS")
+    assert backend[0]["cache"] is True
+    assert "cache" not in backend[1] and backend[1] != frontend[1]
+
+
+def test_project_prefix_sections():
+    assert project_prefix("S")["text"] == "## Project Specification\nS"
+    assert project_prefix("S", decisions="D")["text"] == (
+        "## Project Specification\nS\n\n## Architecture Decisions\nD")
+
+
+def test_text_of_joins_segments_for_providers_without_blocks():
+    assert text_of("plain") == "plain"
+    assert text_of([segment("a", cache=True), segment(""), segment("b")]) == "a\n\nb"
+
+
+def test_breakpoints_mark_the_end_of_each_cacheable_run():
+    content = [segment("a", cache=True), segment("b", cache=True), segment("c"),
+               segment("d", cache=True)]
+    blocks = anthropic_messages([{"role": "user", "content": content}])[0]["content"]
+    assert [b.get("cache_control") for b in blocks] == [None, EPHEMERAL, None, EPHEMERAL]
+    assert [b["text"] for b in blocks] == ["a", "b", "c", "d"]
+
+
+def test_only_the_latest_run_ends_get_breakpoints():
+    messages = [{"role": "user", "content": [segment(str(i), cache=True), segment("q")]}
+                for i in range(MAX_BREAKPOINTS + 1)]
+    marked = [i for i, m in enumerate(anthropic_messages(messages))
+              if m["content"][0].get("cache_control")]
+    assert marked == [2, 3, 4]  # one breakpoint is left for the system prompt
+
+
+def test_string_messages_and_empty_segments():
+    messages = [{"role": "user", "content": "hi"},
+                {"role": "user", "content": [segment(""), segment("x")]}]
+    assert anthropic_messages(messages) == [
+        {"role": "user", "content": "hi"},
+        {"role": "user", "content": [{"type": "text", "text": "x"}]},
+    ]
+
+
+def test_system_prompt_is_one_cached_block():
+    assert anthropic_system("be terse") == [
+        {"type": "text", "text": "be terse", "cache_control": EPHEMERAL}]
+    assert anthropic_system("") == ""
+
+
+def test_anthropic_requests_carry_the_breakpoints():
+    provider = SimpleNamespace(config=ProviderConfig(name="anthropic", model="claude-sonnet-4"))
+    prompt = [project_prefix("SPEC"), segment("task")]
+    kwargs = AnthropicProvider._request_kwargs(provider, [{"role": "user", "content": prompt}],
+                                               "system")
+    assert kwargs["system"][0]["cache_control"] == EPHEMERAL
+    assert kwargs["messages"][0]["content"][0]["cache_control"] == EPHEMERAL
+    assert "cache_control" not in kwargs["messages"][0]["content"][1]
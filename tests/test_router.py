@@ -0,0 +1,111 @@
+"""Router: failover, cooldown, latency windows and the default route set."""
+
+import pytest
+
+from src.config import get_provider_config
+from src.providers import router as router_mod
+from src.providers.base import BaseProvider, ProviderConfig
+from src.providers.router import ProviderHealth, RouterConfig, RouterProvider
+
+
+class _Provider(BaseProvider):
+    def __init__(self, name, fail=False):
+        super().__init__(ProviderConfig(name=name, model="m"))
+        self.fail = fail
+        self.calls = 0
+
+    def chat(self, messages, system=""):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError(f"{self.config.name} is down")
+        return self.config.name
+
+    def stream(self, messages, system=""):
+        yield self.chat(messages, system)
+
+
+def _router(*providers, **settings):
+    return RouterProvider(RouterConfig(name="router", model="m", **settings), list(providers))
+
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+def test_fails_over_to_the_next_provider():
+    down, up = _Provider("a", fail=True), _Provider("b")
+    router = _router(down, up)
+    assert router.chat(MESSAGES) == "b"
+    assert "".join(router.stream(MESSAGES)) == "b"
+    assert router.health[id(down)].failures == 2
+    assert router.health[id(up)].failures == 0
+
+
+def test_raises_the_last_error_when_every_provider_fails():
+    router = _router(_Provider("a", fail=True), _Provider("b", fail=True))
+    with pytest.raises(RuntimeError, match="b is down"):
+        router.chat(MESSAGES)
+
+
+def test_repeated_failures_put_a_provider_on_cooldown(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(router_mod.time, "monotonic", lambda: clock[0])
+    flaky, steady = _Provider("a", fail=True), _Provider("b")
+    router = _router(flaky, steady)
+
+    for _ in range(router_mod.FAILURES_TO_COOLDOWN):
+        router.chat(MESSAGES)
+    health = router.health[id(flaky)]
+    assert health.cooling_down
+    assert router._order() == [steady, flaky]
+
+    router.chat(MESSAGES)
+    assert flaky.calls == router_mod.FAILURES_TO_COOLDOWN  # skipped while cooling down
+
+    clock[0] += router_mod.COOLDOWN
+    assert not health.cooling_down
+    assert router._order() == [flaky, steady]
+
+
+def test_cooldown_doubles_and_success_clears_it(monkeypatch):
+    monkeypatch.setattr(router_mod.time, "monotonic", lambda: 0.0)
+    health = ProviderHealth()
+    for _ in range(router_mod.FAILURES_TO_COOLDOWN + 1):
+        health.failure()
+    assert health.cooldown_until == 2 * router_mod.COOLDOWN
+    health.success(1.0)
+    assert not health.cooling_down
+    assert health.consecutive_failures == 0
+
+
+def test_chat_and_stream_latencies_are_kept_apart():
+    health = ProviderHealth()
+    for _ in range(router_mod.MIN_HEDGE_SAMPLES):
+        health.success(20.0)
+        health.success(0.5, "stream")
+    assert health.p95() == 20.0
+    assert health.p95("stream") == 0.5
+    assert health.mean_latency("stream") == 0.5
+
+
+def test_streams_record_time_to_first_chunk_in_the_stream_window():
+    provider = _Provider("a")
+    router = _router(provider)
+    router.chat(MESSAGES)
+    list(router.stream(MESSAGES))
+    health = router.health[id(provider)]
+    assert len(health.latencies["chat"]) == 1
+    assert len(health.latencies["stream"]) == 1
+
+
+def test_default_routes_skip_base_url_only_providers():
+    config = {
+        "providers": [
+            {"name": "anthropic", "api_key": "sk-a", "model": "claude"},
+            {"name": "ollama", "base_url": "http://localhost:11434", "model": "llama3.1"},
+        ],
+        "routing": {"enabled": True},
+    }
+    assert [r.name for r in get_provider_config(config).routes] == ["anthropic"]
+
+    config["routing"]["providers"] = ["anthropic", "ollama"]
+    assert [r.name for r in get_provider_config(config).routes] == ["anthropic", "ollama"]
@@ -0,0 +1,107 @@
+"""run_dag ordering and failure handling; task_dependencies edges."""
+
+import threading
+import time
+
+import pytest
+
+from src.adk.orchestrator_agent import STATIC_PIPELINE
+from src.scheduler import run_dag, task_dependencies
+from src.state import TaskState
+
+
+def _recorder():
+    order, lock = [], threading.Lock()
+
+    def run(node):
+        with lock:
+            order.append(node)
+
+    return order, run
+
+
+def test_nodes_start_only_after_their_dependencies():
+    deps = {"a": set(), "b": {"a"}, "c": {"a"}, "d": {"b", "c"}}
+    order, run = _recorder()
+    run_dag(deps, run, max_workers=4)
+    assert sorted(order) == ["a", "b", "c", "d"]
+    assert order[0] == "a" and order[-1] == "d"
+
+
+def test_one_worker_follows_the_mapping_order():
+    order, run = _recorder()
+    run_dag({3: set(), 1: set(), 2: {3}}, run, max_workers=1)
+    assert order == [3, 1, 2]
+
+
+def test_dependencies_outside_the_graph_are_ignored():
+    order, run = _recorder()
+    run_dag({"b": {"done-earlier"}}, run)
+    assert order == ["b"]
+
+
+def test_independent_nodes_run_concurrently_up_to_max_workers():
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def run(node):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+
+    run_dag({i: set() for i in range(6)}, run, max_workers=2)
+    assert peak[0] == 2
+
+
+def test_a_failing_node_aborts_the_run_and_skips_its_dependents():
+    order, record = _recorder()
+
+    def run(node):
+        record(node)
+        if node == "a":
+            raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        run_dag({"a": set(), "b": {"a"}, "c": {"b"}}, run)
+    assert order == ["a"]
+
+
+def test_cycles_are_reported():
+    order, run = _recorder()
+    with pytest.raises(ValueError, match="Dependency cycle"):
+        run_dag({"a": set(), "b": {"c"}, "c": {"b"}}, run)
+    assert order == ["a"]
+
+
+def test_task_dependencies_use_declared_and_shared_file_edges():
+    tasks = [
+        TaskState(id="t1", name="models", files=["models.py"]),
+        TaskState(id="t2", name="api", files=["api.py"], depends_on=["t1"]),
+        TaskState(id="t3", name="ui", files=["ui.py"], depends_on=["t9", "t4"]),
+        TaskState(id="t4", name="more models", files=["models.py"]),
+    ]
+    assert task_dependencies(tasks) == {0: set(), 1: {0}, 2: set(), 3: {0}}
+
+
+def test_plans_without_depends_on_run_as_a_chain():
+    tasks = [TaskState(id=f"t{i}", name=str(i)) for i in range(3)]
+    assert task_dependencies(tasks) == {0: set(), 1: {0}, 2: {1}}
+
+
+def test_static_adk_pipeline_audits_after_ci_and_deploy():
+    events, lock = [], threading.Lock()
+
+    def run(node):
+        with lock:
+            events.append(("start", node))
+        time.sleep(0.05 if node in ("ci", "deploy") else 0.01)
+        with lock:
+            events.append(("end", node))
+
+    run_dag(STATIC_PIPELINE, run, max_workers=len(STATIC_PIPELINE))
+    security = events.index(("start", "security"))
+    assert events.index(("end", "ci")) < security
+    assert events.index(("end", "deploy")) < security
+    assert events.index(("end", "security")) < events.index(("start", "reviewer"))
@@ -0,0 +1,134 @@
+"""Build journal: replay, compaction and crash recovery."""
+
+import pytest
+
+from src import state as state_mod
+from src.state import BuildJournal, BuildState, TaskState
+
+
+def _state(n=3) -> BuildState:
+    return BuildState(
+        build_id="b1", status="building",
+        tasks=[TaskState(id=f"t{i}", name=f"Task {i}") for i in range(n)],
+    )
+
+
+def _reload(tmp_path) -> BuildState:
+    return BuildJournal(tmp_path).load()  # a fresh process
+
+
+def test_replay_applies_journal_on_top_of_snapshot(tmp_path):
+    journal = BuildJournal(tmp_path)
+    state = _state()
+    journal.save(state)                       # first save writes the snapshot
+    state.tasks[0].status = "completed"
+    state.files_written.append("app.py")
+    journal.save(state)
+    state.errors.append("boom")
+    state.decisions = "use sqlite"
+    journal.save(state)
+
+    assert len(journal.journal_path.read_text().splitlines()) == 2
+    loaded = _reload(tmp_path)
+    assert loaded.tasks[0].status == "completed"
+    assert loaded.files_written == ["app.py"]
+    assert loaded.errors == ["boom"]
+    assert loaded.decisions == "use sqlite"
+
+
+def test_unchanged_state_appends_nothing(tmp_path):
+    journal = BuildJournal(tmp_path)
+    state = _state()
+    journal.save(state)
+    journal.save(state)
+    assert journal.journal_path.read_text() == ""
+
+
+def test_compaction_folds_journal_into_snapshot(tmp_path, monkeypatch):
+    monkeypatch.setattr(state_mod, "COMPACT_EVERY", 3)
+    journal = BuildJournal(tmp_path)
+    state = _state(5)
+    journal.save(state)
+    for i in range(5):
+        state.tasks[i].status = "completed"
+        journal.save(state)
+
+    # Three appends, then a compaction, then one more append
+    assert len(journal.journal_path.read_text().splitlines()) == 1
+    loaded = _reload(tmp_path)
+    assert [t.status for t in loaded.tasks] == ["completed"] * 5
+
+
+def test_completion_compacts(tmp_path):
+    journal = BuildJournal(tmp_path)
+    state = _state()
+    journal.save(state)
+    state.tasks[0].status = "completed"
+    journal.save(state)
+    state.status = "completed"
+    journal.save(state)
+    assert journal.journal_path.read_text() == ""
+    assert _reload(tmp_path).status == "completed"
+
+
+def test_torn_tail_is_truncated_before_the_next_append(tmp_path):
+    journal = BuildJournal(tmp_path)
+    state = _state()
+    journal.save(state)
+    state.tasks[0].status = "completed"
+    journal.save(state)
+    with open(journal.journal_path, "a") as f:
+        f.write('{"seq": 2, "task')  # crash mid-append
+
+    resumed = BuildJournal(tmp_path)
+    state = resumed.load()
+    assert state.tasks[0].status == "completed"
+    state.tasks[1].status = "completed"
+    resumed.save(state)
+    state.tasks[2].status = "in_progress"
+    resumed.save(state)
+
+    loaded = _reload(tmp_path)
+    assert [t.status for t in loaded.tasks] == ["completed", "completed", "in_progress"]
+
+
+def test_loading_leaves_a_torn_tail_for_its_writer(tmp_path):
+    journal = BuildJournal(tmp_path)
+    state = _state()
+    journal.save(state)
+    state.tasks[0].status = "completed"
+    journal.save(state)
+    with open(journal.journal_path, "a") as f:
+        f.write('{"seq": 2, "task')  # another process mid-append
+    before = journal.journal_path.read_bytes()
+
+    assert _reload(tmp_path).tasks[0].status == "completed"   # e.g. forge status
+    assert journal.journal_path.read_bytes() == before
+
+    with open(journal.journal_path, "a") as f:
+        f.write('": {"1": {"status": "completed"}}}\n')  # the writer finishes
+    assert [t.status for t in _reload(tmp_path).tasks][:2] == ["completed", "completed"]
+
+
+def test_corrupted_line_before_the_end_raises(tmp_path):
+    journal = BuildJournal(tmp_path)
+    state = _state()
+    journal.save(state)
+    for i in range(2):
+        state.tasks[i].status = "completed"
+        journal.save(state)
+    lines = journal.journal_path.read_text().splitlines()
+    journal.journal_path.write_text("\n".join(["{not json", lines[1]]) + "\n")
+
+    with pytest.raises(ValueError, match="line 1 is corrupted"):
+        _reload(tmp_path)
+
+
+def test_new_build_replaces_snapshot(tmp_path):
+    journal = BuildJournal(tmp_path)
+    journal.save(_state())
+    other = BuildState(build_id="b2", status="planning")
+    journal.save(other)
+    loaded = _reload(tmp_path)
+    assert loaded.build_id == "b2"
+    assert loaded.tasks == []
@@ -0,0 +1,98 @@
+"""Streamed A2A tasks: event order, the SSE wire format and cancellation."""
+
+import asyncio
+import threading
+
+import httpx
+
+from src.a2a.server import create_a2a_app
+from src.a2a.streaming import decode_sse, encode_sse, iter_task_events, run_cancellable
+from src.a2a.types import Artifact, FilePart, Message, Task, TaskResult, TaskStatus, TextPart
+from src.agents.coder import CoderAgent
+from src.providers.base import BaseProvider, ProviderConfig
+
+CHUNKS = ["Here.\n```file:a.py\n", "a = 1\n```\n", "```file:b.py\nb = 2\n", "```\n"]
+
+
+class _Provider(BaseProvider):
+    def __init__(self, chunks=CHUNKS):
+        super().__init__(ProviderConfig(name="fake", model="m"))
+        self.chunks = chunks
+
+    def chat(self, messages, system=""):
+        return "".join(self.chunks)
+
+    def stream(self, messages, system=""):
+        yield from self.chunks
+
+
+class _Plain:
+    """A non-streaming agent: its files only exist in the final result."""
+    name = "plain"
+
+    def handle_a2a_task(self, task):
+        artifact = Artifact(parts=[FilePart(path="c.py", content="c = 3\n")])
+        return TaskResult(id=task.id, status=TaskStatus.completed, artifacts=[artifact])
+
+
+def _task():
+    return Task(message=Message(role="user", parts=[TextPart(text="write the files")]))
+
+
+def _shape(events):
+    return [(e.kind, e.file.path if e.file else None) for e in events]
+
+
+def test_events_arrive_status_then_chunks_and_files_then_result(tmp_path):
+    events = list(iter_task_events(CoderAgent(_Provider(), tmp_path), _task()))
+    assert _shape(events) == [
+        ("status", None),
+        ("text", None), ("text", None), ("file", "a.py"),
+        ("text", None), ("text", None), ("file", "b.py"),
+        ("result", None),
+    ]
+    assert "".join(e.text for e in events if e.kind == "text") == "".join(CHUNKS)
+    assert events[-1].final and events[-1].result.get_files() == [
+        ("a.py", "a = 1\n"), ("b.py", "b = 2\n")]
+
+
+def test_files_of_non_streaming_agents_are_sent_before_the_result():
+    events = list(iter_task_events(_Plain(), _task()))
+    assert _shape(events) == [("status", None), ("file", "c.py"), ("result", None)]
+
+
+def test_sse_round_trip():
+    events = list(iter_task_events(_Plain(), _task()))
+    wire = "".join(encode_sse(e) for e in events)
+    assert list(decode_sse(wire.splitlines())) == events
+
+
+def test_send_subscribe_streams_the_same_events(tmp_path):
+    app = create_a2a_app(CoderAgent(_Provider(), tmp_path), task_db=":memory:")
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://agent") as client:
+            async with client.stream("POST", "/tasks/sendSubscribe",
+                                     json=_task().model_dump()) as resp:
+                assert resp.headers["content-type"].startswith("text/event-stream")
+                return [line async for line in resp.aiter_lines()]
+
+    events = list(decode_sse(asyncio.run(run())))
+    assert [e.kind for e in events][0] == "status" and events[-1].final
+    assert [e.file.path for e in events if e.kind == "file"] == ["a.py", "b.py"]
+    assert events[-1].result.status == TaskStatus.completed
+
+
+def test_cancellation_stops_the_provider_stream(tmp_path):
+    cancelled = threading.Event()
+
+    class _Cancelling(_Provider):
+        def stream(self, messages, system=""):
+            yield CHUNKS[0]
+            cancelled.set()
+            yield from CHUNKS[1:]
+
+    provider = _Cancelling()
+    result = run_cancellable(CoderAgent(provider, tmp_path), _task(), cancelled)
+    assert result.status == TaskStatus.cancelled
@@ -0,0 +1,151 @@
+"""A2A task lifecycle: submit/get/cancel, persistence, duplicates and webhooks."""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from src.a2a import tasks as tasks_mod
+from src.a2a.server import create_a2a_app
+from src.a2a.tasks import DuplicateTask, TaskManager, TaskStore
+from src.a2a.types import Message, Task, TaskResult, TaskStatus, TextPart
+
+
+class _Agent:
+    name = "fake"
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.gate.set()
+        self.runs = 0
+
+    def handle_a2a_task(self, task):
+        self.runs += 1
+        self.gate.wait(5)
+        return TaskResult(id=task.id, status=TaskStatus.completed)
+
+
+def _task(task_id="t1", text="go", **metadata):
+    return Task(id=task_id, message=Message(role="user", parts=[TextPart(text=text)]),
+                metadata=metadata or None)
+
+
+def test_created_task_runs_and_is_collected():
+    manager = TaskManager(_Agent())
+    assert manager.create(_task()).status == TaskStatus.submitted
+    assert manager.get("t1").status == TaskStatus.submitted
+    assert manager.run("t1").status == TaskStatus.completed
+    assert manager.get("t1").status == TaskStatus.completed
+    assert manager.get("nope") is None
+
+
+def test_cancelled_queued_task_never_runs():
+    agent = _Agent()
+    manager = TaskManager(agent)
+    manager.create(_task())
+    assert manager.cancel("t1").status == TaskStatus.cancelled
+    assert manager.run("t1") is None
+    assert agent.runs == 0
+    assert manager.get("t1").status == TaskStatus.cancelled
+
+
+def test_results_outlive_the_store(tmp_path):
+    db = tmp_path / "agent.db"
+    manager = TaskManager(_Agent(), TaskStore(db))
+    manager.create(_task())
+    manager.run("t1")
+    manager.store.close()
+
+    reopened = TaskStore(db)
+    assert reopened.get("t1").status == TaskStatus.completed
+    assert reopened.request("t1")[0] == _task()
+
+
+def test_fail_unfinished_marks_leftovers_failed(tmp_path):
+    store = TaskStore(tmp_path / "agent.db")
+    manager = TaskManager(_Agent(), store)
+    manager.create(_task("queued"))
+    manager.create(_task("done"))
+    manager.run("done")
+
+    assert store.fail_unfinished("server restarted") == 1
+    result = store.get("queued")
+    assert (result.status, result.error) == (TaskStatus.failed, "server restarted")
+    assert store.get("done").status == TaskStatus.completed
+
+
+def test_resubmitting_returns_the_stored_task():
+    agent = _Agent()
+    manager = TaskManager(agent)
+    manager.create(_task())
+    manager.run("t1")
+    assert manager.lookup(_task()).status == TaskStatus.completed
+    assert manager.submit(_task()).status == TaskStatus.completed
+    assert agent.runs == 1
+
+
+def test_reusing_an_id_for_another_request_is_rejected():
+    manager = TaskManager(_Agent())
+    manager.create(_task())
+    with pytest.raises(DuplicateTask):
+        manager.lookup(_task(text="something else"))
+    with pytest.raises(DuplicateTask):
+        manager.create(_task())
+
+
+def test_push_urls_are_limited_to_allowed_hosts():
+    manager = TaskManager(_Agent(), push_hosts=["hooks.example.com"])
+    manager.check_push_url(_task(push_url="https://hooks.example.com/done"))
+    for url in ("http://169.254.169.254/latest", "file:///etc/passwd", "not a url"):
+        with pytest.raises(ValueError):
+            manager.check_push_url(_task(push_url=url))
+
+    closed = TaskManager(_Agent(), push_hosts=())
+    with pytest.raises(ValueError):
+        closed.create(_task(push_url="https://hooks.example.com/done"))
+
+
+def test_webhook_is_sent_to_an_allowed_host(monkeypatch):
+    sent = []
+    monkeypatch.setattr(tasks_mod, "notify", lambda url, result: sent.append((url, result.status)))
+    manager = TaskManager(_Agent(), push_hosts=["hooks.example.com"])
+    manager.create(_task(push_url="https://hooks.example.com/done"))
+    manager.run("t1")
+    assert sent == [("https://hooks.example.com/done", TaskStatus.completed)]
+
+
+def _serve(scenario, **options):
+    app = create_a2a_app(_Agent(), task_db=":memory:", **options)
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://agent") as client:
+            return await scenario(client)
+
+    return asyncio.run(run())
+
+
+def test_server_submit_is_idempotent():
+    async def scenario(client):
+        first = await client.post("/tasks/submit", json=_task().model_dump())
+        again = await client.post("/tasks/submit", json=_task().model_dump())
+        other = await client.post("/tasks/submit", json=_task(text="other").model_dump())
+        return first, again, other
+
+    first, again, other = _serve(scenario)
+    assert first.status_code == 202
+    assert again.status_code == 200 and again.json()["id"] == "t1"
+    assert other.status_code == 409
+
+
+def test_server_refuses_push_urls_by_default():
+    async def scenario(client):
+        task = _task(push_url="http://127.0.0.1:9/internal")
+        submitted = await client.post("/tasks/submit", json=task.model_dump())
+        missing = await client.post("/tasks/get", json={"id": "t1"})
+        return submitted, missing
+
+    submitted, missing = _serve(scenario)
+    assert submitted.status_code == 400
+    assert missing.status_code == 404
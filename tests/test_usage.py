@@ -0,0 +1,116 @@
+"""Usage attribution by agent and task scope, and cost estimates."""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.providers.base import BaseProvider, ProviderConfig
+from src.providers.usage import (
+    DEFAULT_PRICES, Usage, UsageStats, current_scope, estimate_cost, merge_stats,
+    price_for, usage_scope,
+)
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+class _Provider(BaseProvider):
+    """Reports 10 input and 5 output tokens per call."""
+
+    def __init__(self, model="claude-sonnet-4-20250514"):
+        super().__init__(ProviderConfig(name="fake", model=model))
+
+    def chat(self, messages, system=""):
+        self._record_usage(Usage(input_tokens=10, output_tokens=5))
+        return "ok"
+
+    def stream(self, messages, system=""):
+        yield "o"
+        yield "k"
+        self._record_usage(Usage(input_tokens=10, output_tokens=5))
+
+
+def test_scopes_nest_and_unset_arguments_are_inherited():
+    with usage_scope(task="task_01"):
+        with usage_scope(agent="coder"):
+            assert current_scope() == ("coder", "task_01")
+            with usage_scope(task="task_02"):
+                assert current_scope() == ("coder", "task_02")
+        assert current_scope() == ("", "task_01")
+    assert current_scope() == ("", "")
+
+
+def test_calls_are_recorded_per_agent_and_task():
+    provider = _Provider()
+    with usage_scope(agent="coder", task="task_01"):
+        provider.chat_with_retry(MESSAGES)
+        assert "".join(provider.stream_with_retry(MESSAGES)) == "ok"
+    with usage_scope(agent="reviewer"):
+        provider.chat_with_retry(MESSAGES)
+    provider.chat_with_retry(MESSAGES)  # unscoped: total only
+
+    model = provider.config.model
+    assert provider.usage.calls == 4
+    assert provider.usage.total() == Usage(input_tokens=40, output_tokens=20)
+    coder = provider.usage.by_agent()["coder"][model]
+    assert (coder["calls"], coder["input_tokens"], coder["streamed"]) == (2, 20, 1)
+    assert set(provider.usage.by_agent()) == {"coder", "reviewer"}
+    assert provider.usage.by_task() == {"task_01": {model: coder}}
+
+
+def test_to_thread_keeps_the_scope_but_plain_threads_start_empty():
+    provider = _Provider()
+
+    async def scoped():
+        with usage_scope(agent="planner", task="task_03"):
+            await asyncio.to_thread(provider.chat_with_retry, MESSAGES)
+            thread = threading.Thread(target=provider.chat_with_retry, args=(MESSAGES,))
+            thread.start()
+            thread.join()
+
+    asyncio.run(scoped())
+    assert provider.usage.calls == 2
+    assert list(provider.usage.by_agent()) == ["planner"]
+    assert provider.usage.by_agent()["planner"][provider.config.model]["calls"] == 1
+
+
+def test_concurrent_tasks_keep_their_own_scopes():
+    provider = _Provider()
+
+    async def task(task_id):
+        with usage_scope(task=task_id):
+            await asyncio.sleep(0)
+            await asyncio.to_thread(provider.chat_with_retry, MESSAGES)
+
+    async def build():
+        with usage_scope(agent="coder"):
+            await asyncio.gather(*(task(f"task_0{i}") for i in range(1, 4)))
+
+    asyncio.run(build())
+    by_task = provider.usage.by_task()
+    assert sorted(by_task) == ["task_01", "task_02", "task_03"]
+    assert all(t[provider.config.model]["calls"] == 1 for t in by_task.values())
+
+
+def test_price_for_matches_the_longest_prefix():
+    assert price_for("gpt-4o-mini-2024-07-18", DEFAULT_PRICES) == DEFAULT_PRICES["gpt-4o-mini"]
+    assert price_for("gpt-4o-2024-08-06", DEFAULT_PRICES) == DEFAULT_PRICES["gpt-4o"]
+    assert price_for("llama3.1", DEFAULT_PRICES) is None
+
+
+def test_estimate_cost_defaults_cache_tokens_to_the_input_price():
+    stats = UsageStats(input_tokens=1_000_000, output_tokens=1_000_000,
+                       cache_read_tokens=1_000_000, cache_write_tokens=1_000_000)
+    assert estimate_cost(stats, DEFAULT_PRICES["claude-sonnet-4"]) == pytest.approx(22.05)
+    assert estimate_cost(stats, {"input": 1.0, "output": 2.0}) == pytest.approx(5.0)
+    assert estimate_cost(stats, None) is None
+
+
+def test_merge_stats_sums_saved_and_new_usage():
+    saved = {"m": UsageStats(calls=2, input_tokens=100, latency_s=1.5).to_dict()}
+    new = {"m": UsageStats(calls=1, input_tokens=50, latency_s=0.5).to_dict(),
+           "n": UsageStats(calls=1).to_dict()}
+    merged = merge_stats(saved, new, None)
+    assert (merged["m"]["calls"], merged["m"]["input_tokens"], merged["m"]["latency_s"]) == (3, 150, 2.0)
+    assert merged["n"]["calls"] == 1
+    assert UsageStats.from_dict({**merged["m"], "unknown_field": 1}).calls == 3